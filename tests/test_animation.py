@@ -0,0 +1,77 @@
+import pytest
+
+from word_guessing_game.game import animation
+from word_guessing_game.game.animation import FrameAnimator
+
+
+class FakeRoot:
+    """Just enough of Tk's after() to drive the animator by hand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._ids = 0
+
+    def after(self, ms, fn):
+        self._ids += 1
+        self.jobs[str(self._ids)] = (ms, fn)
+        return str(self._ids)
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_next(self):
+        job = next(iter(self.jobs))
+        self.jobs.pop(job)[1]()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(animation.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _animator(shown, fps=10.0):
+    anim = FrameAnimator(lambda index, final: shown.append((index, final)) or True, fps=fps)
+    root = FakeRoot()
+    anim.attach(root)
+    return anim, root
+
+
+def test_runs_one_frame_per_tick_when_on_time(clock):
+    shown = []
+    anim, root = _animator(shown)
+    anim.animate_to(3)
+    while root.jobs:
+        clock[0] += 0.1
+        root.run_next()
+    assert shown == [(1, False), (2, False), (3, True)]
+    assert (anim.frames_shown, anim.frames_dropped) == (3, 0)
+
+
+def test_late_ticks_skip_frames_and_calls_coalesce(clock):
+    shown = []
+    anim, root = _animator(shown)
+    anim.animate_to(2)
+    anim.animate_to(6)
+    assert len(root.jobs) == 1
+    clock[0] += 0.35  # three frames late
+    root.run_next()
+    assert shown == [(3, False)]
+    while root.jobs:
+        clock[0] += 0.1
+        root.run_next()
+    assert shown[-1] == (6, True)
+    assert anim.frames_dropped == 2
+
+
+def test_jump_back_ends_the_run(clock):
+    shown = []
+    anim, root = _animator(shown)
+    anim.animate_to(5)
+    for _ in range(3):
+        clock[0] += 0.1
+        root.run_next()
+    anim.animate_to(1)
+    assert not anim.running and not root.jobs
+    assert shown == [(1, False), (2, False), (3, False), (1, True)]
@@ -0,0 +1,69 @@
+import pytest
+
+from word_guessing_game.game.corpus import Corpus, build_index, read_source
+from word_guessing_game.game.data import WORD_LISTS
+
+
+def test_read_source_normalises_difficulty(tmp_path):
+    src = tmp_path / "words.txt"
+    src.write_text("# comment\nbeginner\tFruits\tLemon\nADVANCED,animals,okapi\n\nkiwi\nbanana\nhippopotamus\n")
+    assert list(read_source(src)) == [
+        ("Beginner", "fruits", "lemon"),
+        ("Advanced", "animals", "okapi"),
+        ("Beginner", "general", "kiwi"),
+        ("Intermediate", "general", "banana"),
+        ("Advanced", "general", "hippopotamus"),
+    ]
+
+
+def test_read_source_rejects_unknown_difficulty(tmp_path):
+    src = tmp_path / "words.txt"
+    src.write_text("Beginner\tfruits\tlemon\nExpert\tfruits\tquince\n")
+    with pytest.raises(ValueError, match=r"words.txt:2: unknown difficulty 'Expert'"):
+        list(read_source(src))
+
+
+def test_build_index_drops_duplicates():
+    corpus = Corpus.from_bytes(build_index([
+        ("Beginner", "fruits", "lemon"),
+        ("Beginner", "fruits", "lemon"),
+        ("Beginner", "fruits", "fig"),
+    ]))
+    assert len(corpus) == 2
+    assert sorted(corpus.word(i) for i in range(len(corpus))) == ["fig", "lemon"]
+
+
+def test_queries_over_word_lists():
+    corpus = Corpus.from_word_lists(WORD_LISTS)
+    assert corpus.difficulties() == ["Advanced", "Beginner", "Intermediate"]
+    assert corpus.categories("Beginner") == ["animals", "flowers", "fruits"]
+    word_id = corpus.find("Beginner", "fruits", "lemon")
+    assert word_id is not None
+    assert corpus.entry(word_id) == ("Beginner", "fruits", "lemon")
+    assert corpus.find("Beginner", "fruits", "kiwi") is None
+    ids = [i for r in corpus.ids("Beginner", "fruits", 5) for i in r]
+    assert {corpus.word(i) for i in ids} == set(WORD_LISTS["Beginner"]["fruits"])
+    for _ in range(50):
+        category, word = corpus.pick("Intermediate")
+        assert word in WORD_LISTS["Intermediate"][category]
+        assert corpus.entry(corpus.sample("Advanced", "animals"))[1] == "animals"
+
+
+def test_open_compiles_and_reuses_index(tmp_path):
+    src = tmp_path / "words.txt"
+    src.write_text("Beginner\tfruits\tlemon\nBeginner\tfruits\tlime\n")
+    corpus = Corpus.open(src)
+    assert (tmp_path / "words.txt.idx").exists()
+    assert len(corpus) == 2
+    fingerprint = corpus.fingerprint()
+    corpus.close()
+
+    reopened = Corpus.open(src)
+    assert reopened.fingerprint() == fingerprint
+    reopened.close()
+
+    src.write_text("Beginner\tfruits\tlemon\nBeginner\tfruits\tlime\nBeginner\tfruits\tpear\n")
+    rebuilt = Corpus.open(src)
+    assert len(rebuilt) == 3
+    assert rebuilt.fingerprint() != fingerprint
+    rebuilt.close()
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+pytest.importorskip("PIL.ImageTk")
+
+from PIL import Image  # noqa: E402
+
+from word_guessing_game.game import frames  # noqa: E402
+from word_guessing_game.game.frames import LOOKAHEAD, FramePyramid, bucket_size, hangman_size, scale_bucket  # noqa: E402
+
+
+class FakeRoot:
+    """Tk's after() driven by hand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._ids = 0
+
+    def after(self, ms, fn):
+        self._ids += 1
+        self.jobs[str(self._ids)] = fn
+        return str(self._ids)
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_pending(self):
+        for job in list(self.jobs):
+            self.jobs.pop(job)()
+
+
+class StubCache:
+    """Stands in for the image cache: a blank bitmap of the asked-for size."""
+
+    def __init__(self):
+        self.calls = []
+
+    def resized(self, path, size, persist=False):
+        self.calls.append((path, size))
+        return Image.new("RGB", size)
+
+
+@pytest.fixture
+def pyramid(monkeypatch):
+    # PhotoImage needs a display; the bitmap itself is enough to check
+    monkeypatch.setattr(frames.ImageTk, "PhotoImage", lambda img, master: img)
+    p = FramePyramid([f"frame{i}.png" for i in range(10)], cache=StubCache())
+    p.root = FakeRoot()
+    p.attach(p.root)
+    yield p
+    p.close()
+
+
+def _settle(p):
+    # The poll re-arms itself until every queued frame is back
+    deadline = time.monotonic() + 5
+    while p.root.jobs and time.monotonic() < deadline:
+        time.sleep(0.005)
+        p.root.run_pending()
+    assert not p.root.jobs
+
+
+def test_requested_frames_arrive_at_the_requested_size(pyramid):
+    assert pyramid.photo(3, 1.0) is None
+    pyramid.request(3, 1.0)
+    _settle(pyramid)
+    bucket = scale_bucket(1.0)
+    for index in (3, 4):
+        for b in (bucket - 1, bucket, bucket + 1):
+            assert pyramid.photo(index, b * frames.SCALE_STEP).size == bucket_size(b)
+    for index in range(5, 3 + LOOKAHEAD + 1):
+        assert pyramid.photo(index, 1.0).size == hangman_size(1.0)
+    assert pyramid.photo(3 + LOOKAHEAD + 1, 1.0) is None
+    assert sorted({path for path, _ in pyramid._cache.calls}) == [f"frame{i}.png" for i in range(3, 8)]
+
+
+def test_retargeting_drops_frames_no_longer_wanted(pyramid):
+    pyramid.request(0, 1.0)
+    _settle(pyramid)
+    decoded = len(pyramid._cache.calls)
+    pyramid.request(9, 2.0)
+    _settle(pyramid)
+    assert pyramid.photo(0, 1.0) is None
+    assert pyramid.photo(9, 2.0).size == hangman_size(2.0)
+    # Past the last frame nothing is fetched; only 9 at three buckets
+    assert len(pyramid._cache.calls) - decoded == 3
+
+
+def test_close_stops_the_worker(pyramid):
+    pyramid.request(0, 1.0)
+    worker = pyramid._worker
+    pyramid.close()
+    assert not worker.is_alive()
+    # Frames still come back if the pyramid is used again
+    pyramid.request(1, 1.0)
+    _settle(pyramid)
+    assert pyramid.photo(1, 1.0) is not None
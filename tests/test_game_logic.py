@@ -0,0 +1,75 @@
+from word_guessing_game.game.game_logic import GameLogic, word_masks
+
+
+def test_guess_reveals_every_position():
+    logic = GameLogic.from_word("Beginner", "fruits", "banana")
+    result = logic.guess("A")
+    assert result.status == "correct"
+    assert result.positions == [1, 3, 5]
+    assert isinstance(result.positions, list)
+    assert logic.board_text == "_ a _ a _ a"
+    assert not result.complete
+
+
+def test_repeat_and_invalid_guesses_cost_nothing():
+    logic = GameLogic.from_word("Beginner", "fruits", "kiwi")
+    logic.guess("k")
+    assert logic.guess("k").status == "repeat"
+    assert logic.guess("7").status == "wrong"
+    assert logic.guess("ab").status == "wrong"
+    assert logic.wrong_guesses == 0
+
+
+def test_wrong_guesses_end_the_game():
+    logic = GameLogic.from_word("Beginner", "fruits", "fig")
+    results = [logic.guess(ch) for ch in "abcdehjklmnop"[: logic.max_wrong]]
+    assert all(r.status == "wrong" for r in results)
+    assert results[-1].game_over and logic.is_game_over()
+
+
+def test_complete_after_all_letters():
+    logic = GameLogic.from_word("Beginner", "fruits", "pear")
+    for ch in "pea":
+        assert not logic.guess(ch).complete
+    assert logic.guess("r").complete
+    assert logic.is_complete()
+
+
+def test_guessed_letters_is_a_mutable_set():
+    logic = GameLogic.from_word("Beginner", "fruits", "lime")
+    logic.guess("l")
+    logic.guess("z")
+    assert logic.guessed_letters == {"l", "z"}
+    logic.guessed_letters.add("q")
+    assert "q" in logic.guessed_letters
+    assert logic.guess("q").status == "repeat"
+
+
+def test_non_ascii_letters_are_still_guessable():
+    logic = GameLogic.from_word("Beginner", "food", "café")
+    for ch in "caf":
+        logic.guess(ch)
+    assert not logic.is_complete()
+    result = logic.guess("é")
+    assert result.status == "correct" and result.positions == [3]
+    assert logic.is_complete()
+
+
+def test_restore_matches_played_game():
+    played = GameLogic.from_word("Advanced", "animals", "giraffe")
+    for ch in "gzfx":
+        played.guess(ch)
+    restored = GameLogic.restore("Advanced", "animals", "giraffe", played.guessed_mask, played.wrong_guesses)
+    assert restored.gameboard == played.gameboard
+    assert restored.guessed_letters == played.guessed_letters
+    assert restored.wrong_guesses == 2
+    for ch in "irae":
+        restored.guess(ch)
+    assert restored.is_complete()
+
+
+def test_word_masks():
+    masks = word_masks("abba")
+    assert masks.letter_mask == 0b11
+    assert masks.positions[0] == (0, 3)
+    assert masks.position_masks[1] == 0b0110
@@ -0,0 +1,51 @@
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from word_guessing_game.game.image_cache import ImageCache  # noqa: E402
+from word_guessing_game.game.variant_cache import VariantCache  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ImageCache(budget_bytes=16 * 1024 * 1024, variants=VariantCache(tmp_path / "variants"))
+
+
+def _png(path, mode="RGBA", size=(400, 200)):
+    img = Image.new("RGBA", size, (200, 40, 40, 255))
+    if mode == "P":
+        img = img.convert("P")
+    img.save(path)
+    return path
+
+
+def test_large_downscale_of_a_palette_image(tmp_path, cache):
+    path = _png(tmp_path / "button.png", mode="P")
+    assert Image.open(path).mode == "P"
+    img = cache.resized(path, (100, 50))
+    assert img is not None and img.size == (100, 50)
+
+
+def test_only_persisted_sizes_reach_the_variant_store(tmp_path, cache):
+    path = _png(tmp_path / "background.png")
+    for w in range(300, 320):
+        assert cache.resized(path, (w, 150)).size == (w, 150)
+    assert cache.variants.usage() == (0, 0)
+
+    cache.resized(path, (200, 100), persist=True)
+    assert cache.variants.usage()[0] == 1
+    stored = cache.variants.load(path, (200, 100))
+    assert stored is not None and stored.size == (200, 100)
+    # Stored variants are served whether or not the caller would persist
+    assert cache.resized(path, (200, 100)).tobytes() == stored.tobytes()
+
+
+def test_decoded_images_are_cached_and_evicted(tmp_path):
+    paths = [_png(tmp_path / f"{i}.png", size=(100, 100)) for i in range(3)]
+    cache = ImageCache(budget_bytes=2 * 100 * 100 * 4)
+    for path in paths:
+        cache.decoded(path)
+    cache.decoded(paths[2])
+    stats = cache.stats
+    assert (stats.decoded_misses, stats.decoded_hits) == (3, 1)
+    assert stats.evictions == 1 and stats.entries == 2
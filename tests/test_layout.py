@@ -0,0 +1,18 @@
+from word_guessing_game.game.layout import LayoutEngine
+
+
+def test_apply_touches_only_changed_items():
+    engine = LayoutEngine()
+    calls = []
+    apply = lambda key, value: calls.append((key, value))
+
+    assert engine.apply({"board": (10, 20), "hint": 12}, apply) == 2
+    assert engine.apply({"board": (10, 20), "hint": 12}, apply) == 0
+    assert engine.apply({"board": (15, 20), "hint": 12}, apply) == 1
+    assert calls[-1] == ("board", (15, 20))
+
+    engine.forget("hint")
+    assert engine.apply({"board": (15, 20), "hint": 12}, apply) == 1
+    engine.reset()
+    assert engine.apply({"board": (15, 20), "hint": 12}, apply) == 2
+    assert engine.applied_items == 6
@@ -0,0 +1,65 @@
+import urllib.request
+
+import pytest
+
+from word_guessing_game.game.metrics import Histogram, MetricsExporter, MetricsRegistry, timed
+
+
+def test_histogram_buckets_are_less_or_equal():
+    h = Histogram([0.1, 1.0])
+    for value in (0.1, 0.5, 1.0, 2.0):
+        h.observe(value)
+    assert h.counts == [1, 2, 1]
+    assert h.count == 4 and h.sum == pytest.approx(3.6)
+    assert h.quantile(0.25) == 0.1
+    assert h.quantile(0.5) == 1.0
+    assert h.quantile(1.0) == float("inf")
+    assert Histogram().quantile(0.5) is None
+
+
+def test_render_exposition_format():
+    registry = MetricsRegistry(prefix="t_")
+    h = registry.histogram("load_seconds", "Load latency", buckets=[0.5, 1.0], result="hit")
+    registry.histogram("load_seconds", "Load latency", result="miss")
+    assert registry.histogram("load_seconds", "Load latency", result="hit") is h
+    h.observe(0.25)
+    h.observe(2.0)
+    registry.counter("dropped_total", "Dropped", effect='say "hi"').inc(3)
+    text = registry.render()
+    assert "# TYPE t_load_seconds histogram" in text
+    assert 't_load_seconds_bucket{result="hit",le="0.5"} 1' in text
+    assert 't_load_seconds_bucket{result="hit",le="+Inf"} 2' in text
+    assert 't_load_seconds_count{result="hit"} 2' in text
+    assert 't_load_seconds_sum{result="hit"} 2.25' in text
+    assert 't_dropped_total{effect="say \\"hi\\""} 3' in text
+    with pytest.raises(ValueError):
+        registry.counter("load_seconds", "Not a counter")
+
+
+def test_timed_observes_calls_that_raise():
+    h = Histogram()
+    double = timed(h, lambda x: 2 * x)
+    assert double(4) == 8
+
+    def fail():
+        raise KeyError("x")
+
+    with pytest.raises(KeyError):
+        timed(h, fail)()
+    assert h.count == 2
+
+
+def test_exporter_writes_file_and_serves_http(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("rounds_total", "Rounds").inc()
+    path = tmp_path / "wgg.prom"
+    exporter = MetricsExporter(path, port=0, registry=registry, interval=3600)
+    exporter.start()
+    try:
+        port = exporter._httpd.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "wgg_rounds_total 1" in resp.read().decode()
+    finally:
+        exporter.close()
+    assert path.read_text() == registry.render()
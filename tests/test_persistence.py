@@ -0,0 +1,72 @@
+from word_guessing_game.game.corpus import Corpus, build_index
+from word_guessing_game.game.data import WORD_LISTS
+from word_guessing_game.game.game_logic import GameLogic
+from word_guessing_game.game.persistence import SessionStore
+
+CORPUS = Corpus.from_word_lists(WORD_LISTS)
+
+
+def _play(store, key, word, letters, difficulty="Beginner", category="fruits"):
+    logic = GameLogic.from_word(difficulty, category, word)
+    assert store.record_new(key, logic)
+    for letter in letters:
+        logic.guess(letter)
+        store.record_guess(key, letter)
+    return logic
+
+
+def _state(logic):
+    return logic.word, logic.gameboard, logic.guessed_letters, logic.wrong_guesses
+
+
+def test_journal_recovers_sessions(tmp_path):
+    store = SessionStore(tmp_path, CORPUS)
+    assert store.open() == {}
+    a = _play(store, 1, "lemon", "lxe")
+    _play(store, 2, "mango", "m")
+    store.record_end(2)
+    b = _play(store, 3, "tiger", "tz", category="animals")
+    store.close()
+
+    recovered = SessionStore(tmp_path, CORPUS).open()
+    assert sorted(recovered) == [1, 3]
+    assert _state(recovered[1]) == _state(a)
+    assert _state(recovered[3]) == _state(b)
+
+
+def test_compaction_and_torn_tail(tmp_path):
+    store = SessionStore(tmp_path, CORPUS, compact_bytes=32)
+    store.open()
+    logic = _play(store, 7, "peach", "pqr")
+    store.flush()  # past compact_bytes: everything moves into the snapshot
+    assert store.journal_path.stat().st_size == 16
+    logic.guess("e")
+    store.record_guess(7, "e")
+    store.close()
+    with open(store.journal_path, "ab") as fh:
+        fh.write(b"\x02\x00torn")
+
+    reopened = SessionStore(tmp_path, CORPUS)
+    recovered = reopened.open()
+    assert _state(recovered[7]) == _state(logic)
+    # The torn record is cut off so new records follow intact ones
+    assert reopened.journal_path.stat().st_size == 32
+    reopened.close()
+
+
+def test_sessions_from_another_word_list_are_ignored(tmp_path):
+    store = SessionStore(tmp_path, CORPUS)
+    store.open()
+    _play(store, 1, "lemon", "l")
+    store.compact()
+    store.close()
+    other = Corpus.from_bytes(build_index([("Beginner", "fruits", "lemon")]))
+    assert SessionStore(tmp_path, other).open() == {}
+
+
+def test_words_outside_the_corpus_are_not_saved(tmp_path):
+    store = SessionStore(tmp_path, CORPUS)
+    store.open()
+    assert not store.record_new(1, GameLogic.from_word("Beginner", "fruits", "durian"))
+    assert 1 not in store.live
+    store.close()
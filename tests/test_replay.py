@@ -0,0 +1,98 @@
+from word_guessing_game.game.game_logic import GameLogic
+from word_guessing_game.game.replay import GuessRecorder, main, read_recording, replay_headless
+
+
+def _record(recorder, logic, letters):
+    recorder.start_round(logic)
+    for letter in letters:
+        recorder.record(letter, logic.guess(letter))
+
+
+def test_recording_round_trip(tmp_path, capsys):
+    path = tmp_path / "play.wgr"
+    recorder = GuessRecorder(path)
+    _record(recorder, GameLogic.from_word("Beginner", "fruits", "lemon"), "lemxno")
+    _record(recorder, GameLogic.from_word("Advanced", "animals", "hyena"), "abcdfg")
+    recorder.close()
+
+    rounds = read_recording(path)
+    assert [(r.difficulty, r.word, len(r.guesses)) for r in rounds] == [
+        ("Beginner", "lemon", 6),
+        ("Advanced", "hyena", 6),
+    ]
+    first = rounds[0].guesses
+    assert [g.status for g in first] == ["correct", "correct", "correct", "wrong", "correct", "correct"]
+    assert first[-1].complete and rounds[1].guesses[-1].game_over
+    assert first[0].positions == (0,)
+
+    report = replay_headless(rounds, repeat=3)
+    assert report.mismatches == []
+    assert (report.rounds, report.guesses) == (6, 36)
+    assert main([str(path)]) == 0
+
+
+def test_resumed_round_replays_from_its_saved_state(tmp_path):
+    logic = GameLogic.from_word("Intermediate", "fruits", "banana")
+    for letter in "bxz":
+        logic.guess(letter)
+
+    path = tmp_path / "play.wgr"
+    recorder = GuessRecorder(path)
+    _record(recorder, logic, "anq")
+    recorder.close()
+
+    (rnd,) = read_recording(path)
+    assert (rnd.guessed, rnd.wrong) == ("bxz", 2)
+    assert rnd.guesses[1].complete
+    assert replay_headless([rnd]).mismatches == []
+
+
+def test_appending_and_torn_tail(tmp_path):
+    path = tmp_path / "play.wgr"
+    for word in ("fig", "kiwi"):
+        recorder = GuessRecorder(path)
+        _record(recorder, GameLogic.from_word("Beginner", "fruits", word), word)
+        recorder.close()
+    with open(path, "ab") as fh:
+        fh.write(b"\x02\x01\x00")
+    assert [r.word for r in read_recording(path)] == ["fig", "kiwi"]
+
+
+def test_recorder_drops_a_torn_tail_before_appending(tmp_path):
+    path = tmp_path / "play.wgr"
+    recorder = GuessRecorder(path)
+    _record(recorder, GameLogic.from_word("Beginner", "fruits", "fig"), "fig")
+    recorder.close()
+    # A crash mid-round: half a ROUND record with a garbled name
+    with open(path, "ab") as fh:
+        fh.write(bytes([1]) + bytes(9) + b"\x08\xff\xfe")
+
+    recorder = GuessRecorder(path)
+    _record(recorder, GameLogic.from_word("Beginner", "fruits", "kiwi"), "kiwi")
+    recorder.close()
+    rounds = read_recording(path)
+    assert [(r.word, len(r.guesses)) for r in rounds] == [("fig", 3), ("kiwi", 4)]
+    assert replay_headless(rounds).mismatches == []
+
+
+def test_reader_stops_at_an_unknown_record(tmp_path):
+    path = tmp_path / "play.wgr"
+    recorder = GuessRecorder(path)
+    _record(recorder, GameLogic.from_word("Beginner", "fruits", "fig"), "fi")
+    recorder.close()
+    with open(path, "ab") as fh:
+        fh.write(b"\x09garbage")
+    (rnd,) = read_recording(path)
+    assert len(rnd.guesses) == 2
+
+
+def test_mismatches_fail_the_replay(tmp_path):
+    path = tmp_path / "play.wgr"
+    recorder = GuessRecorder(path)
+    _record(recorder, GameLogic.from_word("Beginner", "fruits", "lemon"), "le")
+    recorder.close()
+    data = bytearray(path.read_bytes())
+    i = data.index(b"lemon")
+    data[i:i + 5] = b"melon"
+    path.write_bytes(bytes(data))
+    assert main([str(path)]) == 2
@@ -0,0 +1,94 @@
+import random
+from collections import Counter
+
+import pytest
+
+from word_guessing_game.game.corpus import Corpus, build_index
+from word_guessing_game.game.sampler import (
+    N_BUCKETS,
+    HardnessSampler,
+    _AliasTable,
+    _percentiles,
+    heuristic_hardness,
+    load_hardness,
+)
+
+UNIFORM = {d: [1.0] * N_BUCKETS for d in ("Beginner", "Intermediate", "Advanced")}
+
+
+def _corpus(entries):
+    return Corpus.from_bytes(build_index(entries))
+
+
+def test_percentiles_share_ranks_on_ties():
+    assert _percentiles([3.0, 1.0, 3.0, 2.0]) == [5 / 6, 0.0, 5 / 6, 1 / 3]
+    assert _percentiles([7.0]) == [0.5]
+
+
+def test_alias_table_follows_weights():
+    table = _AliasTable([1.0, 0.0, 3.0])
+    rng = random.Random(1)
+    counts = Counter(table.draw(rng) for _ in range(40000))
+    assert counts[1] == 0
+    assert counts[2] / counts[0] == pytest.approx(3.0, rel=0.05)
+
+
+def test_shared_pool_counts_each_word_once():
+    corpus = _corpus([
+        ("Beginner", "fruits", "lemon"),
+        ("Intermediate", "fruits", "lemon"),
+        ("Advanced", "fruits", "lemon"),
+        ("Beginner", "fruits", "lime"),
+    ])
+    sampler = HardnessSampler(corpus, hardness=[0.5] * len(corpus), targets=UNIFORM, rng=random.Random(3))
+    counts = Counter(sampler.pick("Advanced")[1] for _ in range(20000))
+    assert counts["lemon"] / counts["lime"] == pytest.approx(1.0, rel=0.06)
+
+
+def test_restricted_pools_and_targets():
+    corpus = _corpus([("Beginner", "fruits", w) for w in ("fig", "kiwi")] + [("Advanced", "animals", "okapi")])
+    hardness = [0.5, 0.0, 0.95]  # ids: okapi, fig (easiest), kiwi (hardest)
+    sampler = HardnessSampler(corpus, hardness=hardness, restrict_to_difficulty=True, rng=random.Random(5))
+    assert {sampler.pick("Advanced") for _ in range(50)} == {("animals", "okapi")}
+    sampler.set_target("Beginner", [0] * (N_BUCKETS - 1) + [1])
+    assert {sampler.pick("Beginner")[1] for _ in range(50)} == {"kiwi"}
+    with pytest.raises(ValueError):
+        sampler.set_target("Beginner", [1.0])
+
+
+def test_sparse_targets_fall_back_to_the_flat_pool():
+    corpus = _corpus([("Beginner", "fruits", w) for w in ("fig", "kiwi", "lime")])
+    # Every word in the easiest bucket; Advanced wants only the hardest ones
+    sampler = HardnessSampler(corpus, hardness=[0.0, 0.01, 0.02], rng=random.Random(4))
+    sampler.set_target("Advanced", [0] * (N_BUCKETS - 1) + [1])
+    counts = Counter(sampler.pick("Advanced")[1] for _ in range(3000))
+    assert set(counts) == {"fig", "kiwi", "lime"}
+    assert min(counts.values()) > 800
+    # A word in a targeted bucket takes over
+    sampler.add_word("Advanced", "fruits", "quince", 0.99)
+    assert {sampler.pick("Advanced")[1] for _ in range(50)} == {"quince"}
+
+
+def test_add_word_joins_its_bucket():
+    corpus = _corpus([("Beginner", "fruits", "fig")])
+    sampler = HardnessSampler(corpus, hardness=[0.0], targets=UNIFORM, rng=random.Random(9))
+    word_id = sampler.add_word("Beginner", "fruits", "Quince", 0.99)
+    assert sampler.entry(word_id) == ("Beginner", "fruits", "quince")
+    assert {sampler.pick("Beginner")[1] for _ in range(200)} == {"fig", "quince"}
+
+
+def test_added_duplicates_do_not_raise_the_odds():
+    corpus = _corpus([("Beginner", "fruits", "fig")])
+    sampler = HardnessSampler(corpus, hardness=[0.0], targets=UNIFORM, rng=random.Random(9))
+    sampler.add_word("Beginner", "fruits", "kiwi", 0.0)
+    sampler.add_word("Advanced", "fruits", "fig", 0.0)
+    counts = Counter(sampler.pick("Beginner")[1] for _ in range(20000))
+    assert counts["fig"] / counts["kiwi"] == pytest.approx(1.0, rel=0.06)
+
+
+def test_hardness_is_cached_per_corpus(tmp_path):
+    corpus = _corpus([("Beginner", "fruits", w) for w in ("fig", "kiwi", "lemon", "quince")])
+    first = load_hardness(corpus, tmp_path, games_per_word=4)
+    assert len(list(tmp_path.glob("hardness-*.bin"))) == 1
+    assert load_hardness(corpus, tmp_path) == pytest.approx(first, abs=1e-6)
+    assert all(0.0 <= h <= 1.0 for h in heuristic_hardness(corpus))
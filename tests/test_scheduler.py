@@ -0,0 +1,75 @@
+import random
+
+from word_guessing_game.game import persistence
+from word_guessing_game.game.corpus import Corpus
+from word_guessing_game.game.data import WORD_LISTS
+from word_guessing_game.game.scheduler import PlayerState, ShuffleScheduler, StreamPosition, permute
+from word_guessing_game.game.tui import TerminalGame
+
+
+def test_permute_is_a_bijection():
+    for n in (1, 2, 3, 17, 100, 1000):
+        assert sorted(permute(i, n, 12345) for i in range(n)) == list(range(n))
+
+
+def test_stream_visits_every_word_before_repeating():
+    scheduler = ShuffleScheduler(Corpus.from_word_lists(WORD_LISTS))
+    state = PlayerState.new(random.Random(4))
+    n = scheduler.pool_size("Beginner")
+    ids = [scheduler.next_id(state, "Beginner") for _ in range(3 * n)]
+    for p in range(3):
+        assert len(set(ids[p * n:(p + 1) * n])) == n
+    # Passes differ, and never repeat across the boundary
+    assert ids[:n] != ids[n:2 * n]
+    assert all(a != b for a, b in zip(ids, ids[1:]))
+    assert state.streams["Beginner"] == StreamPosition(cursor=n, epoch=2)
+
+
+def test_switching_difficulty_keeps_each_pool_free_of_repeats():
+    scheduler = ShuffleScheduler(Corpus.from_word_lists(WORD_LISTS))
+    for seed in range(20):
+        state = PlayerState.new(random.Random(seed))
+        rng = random.Random(seed)
+        sizes = {d: scheduler.pool_size(d) for d in ("Beginner", "Advanced")}
+        seen = {d: [] for d in sizes}
+        while any(len(ids) < n for d, ids in seen.items() for n in [sizes[d]]):
+            d = rng.choice([d for d in sizes if len(seen[d]) < sizes[d]])
+            seen[d].append(scheduler.next_id(state, d))
+        for d, ids in seen.items():
+            assert len(set(ids)) == sizes[d]
+
+
+def test_state_round_trips_through_bytes():
+    state = PlayerState(seed=2 ** 64 - 1)
+    state.streams["Beginner"] = StreamPosition(cursor=7, epoch=3)
+    state.streams["Advanced"] = StreamPosition(cursor=1)
+    data = state.to_bytes()
+    assert PlayerState.from_bytes(data) == state
+    assert PlayerState.from_bytes(PlayerState(seed=1).to_bytes()) == PlayerState(seed=1)
+
+
+def test_players_with_the_same_state_see_the_same_words():
+    scheduler = ShuffleScheduler(Corpus.from_word_lists(WORD_LISTS))
+    a, b = PlayerState(seed=99), PlayerState(seed=99)
+    assert [scheduler.next(a, "Advanced") for _ in range(10)] == [scheduler.next(b, "Advanced") for _ in range(10)]
+
+
+def test_player_state_persists(tmp_path):
+    assert persistence.load_player_state(tmp_path) is None
+    state = PlayerState(seed=5, streams={"Intermediate": StreamPosition(cursor=2, epoch=1)})
+    persistence.save_player_state(state, tmp_path)
+    assert persistence.load_player_state(tmp_path) == state
+    (tmp_path / persistence.PLAYER_STATE_NAME).write_bytes(state.to_bytes()[:-3])
+    assert persistence.load_player_state(tmp_path) is None
+
+
+def test_terminal_game_continues_the_stream_across_launches(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "STATE_DIR", tmp_path)
+    first = TerminalGame("Beginner")
+    words = [first.logic.word]
+    first.new_round()
+    words.append(first.logic.word)
+    second = TerminalGame("Beginner")
+    assert second.player_state.seed == first.player_state.seed
+    assert second.player_state.streams["Beginner"].cursor == 3
+    assert second.logic.word not in words
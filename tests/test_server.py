@@ -0,0 +1,126 @@
+import asyncio
+import errno
+import json
+
+import pytest
+
+from word_guessing_game.game.persistence import SessionStore
+from word_guessing_game.game.server import GameServer, SessionTable
+
+
+def _call(server, **request):
+    return json.loads(server.handle_line(json.dumps(request).encode()))
+
+
+def test_play_a_round():
+    server = GameServer()
+    created = _call(server, op="new", difficulty="Intermediate", req=1)
+    assert created["ok"] and created["req"] == 1
+    sid = created["session"]
+    logic = server.sessions.get(sid)
+    assert "word" not in created["state"]
+    for letter in sorted(set(logic.word)):
+        reply = _call(server, op="guess", session=sid, letter=letter)
+        assert reply["status"] == "correct"
+        assert reply["positions"] == [j for j, ch in enumerate(logic.word) if ch == letter]
+    assert reply["state"]["complete"] and reply["state"]["word"] == logic.word
+    assert _call(server, op="guess", session=sid, letter="q")["error"] == "game finished"
+    assert _call(server, op="close", session=sid) == {"ok": True}
+    assert _call(server, op="state", session=sid)["error"] == "unknown session"
+
+
+def test_next_round_keeps_the_session_difficulty():
+    server = GameServer()
+    sid = _call(server, op="new", difficulty="Advanced")["session"]
+    assert _call(server, op="new", session=sid)["ok"]
+    assert server.sessions.get(sid).difficulty == "Advanced"
+    assert _call(server, op="new", session=sid, difficulty="Beginner")["ok"]
+    assert server.sessions.get(sid).difficulty == "Beginner"
+    # A session id that isn't live is an error, as for the other ops
+    assert _call(server, op="new", session="gone") == {"ok": False, "error": "unknown session"}
+    assert len(server.sessions) == 1
+
+
+def test_malformed_requests_get_an_error_reply():
+    server = GameServer()
+    assert _call(server, op="new", difficulty=[])["error"] == "unknown difficulty []"
+    assert _call(server, op="new", difficulty="Expert")["ok"] is False
+    assert _call(server, op="guess", session="x", letter="a")["error"] == "unknown session"
+    sid = _call(server, op="new")["session"]
+    assert _call(server, op="guess", session=sid, letter=5)["error"] == "letter must be a string"
+    assert _call(server, op="dance")["error"] == "unknown op 'dance'"
+    assert json.loads(server.handle_line(b"[1, 2]"))["ok"] is False
+    assert json.loads(server.handle_line(b"{nope"))["ok"] is False
+
+
+def test_handler_exceptions_become_error_replies():
+    server = GameServer()
+
+    def boom(request):
+        raise TypeError("unhashable type: 'list'")
+
+    server.handle = boom
+    reply = json.loads(server.handle_line(b'{"op": "new", "req": "r"}'))
+    assert reply == {"ok": False, "error": "bad request: TypeError: unhashable type: 'list'", "req": "r"}
+
+
+def test_session_table_evicts_least_recently_used():
+    table = SessionTable(idle_timeout=0.0, max_sessions=2)
+    evicted = []
+    table.on_evict = evicted.append
+    a = table.create(object(), "a")
+    table.create(object(), "b")
+    table.get(a)
+    table.create(object(), "c")
+    assert evicted == ["b"] and len(table) == 2
+    assert table.sweep() == 2
+    assert len(table) == 0 and table.evicted == 3
+
+
+def test_sessions_survive_a_restart(tmp_path):
+    store = SessionStore(tmp_path)
+    server = GameServer(store=store)
+    sid = _call(server, op="new", difficulty="Advanced")["session"]
+    _call(server, op="guess", session=sid, letter="e")
+    state = _call(server, op="state", session=sid)["state"]
+    store.close()
+
+    store = SessionStore(tmp_path)
+    restarted = GameServer(store=store)
+    assert _call(restarted, op="state", session=sid)["state"] == state
+    assert _call(restarted, op="new", session=sid)["ok"]
+    assert restarted.sessions.get(sid).difficulty == "Advanced"
+    store.close()
+
+
+def test_connection_survives_bad_requests():
+    server = GameServer()
+
+    async def scenario():
+        listener = await asyncio.start_server(server._connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b'{"op": "new", "difficulty": []}\n{"op": "ping", "req": 2}\n')
+        first = json.loads(await reader.readline())
+        second = json.loads(await reader.readline())
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return first, second
+
+    first, second = asyncio.run(asyncio.wait_for(scenario(), 10))
+    assert first["ok"] is False
+    assert second == {"ok": True, "req": 2}
+
+
+def test_failed_sync_stops_the_server(tmp_path):
+    store = SessionStore(tmp_path)
+    server = GameServer(store=store)
+    _call(server, op="new")
+
+    def full_disk():
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    store.flush = full_disk
+    with pytest.raises(OSError, match="could not sync sessions to disk: No space left"):
+        asyncio.run(asyncio.wait_for(server.serve("127.0.0.1", 0), 10))
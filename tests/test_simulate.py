@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from word_guessing_game.game.corpus import Corpus, build_index  # noqa: E402
+from word_guessing_game.game.game_logic import GameLogic  # noqa: E402
+from word_guessing_game.game.simulate import STRATEGIES, WordTable, play_batch, simulate  # noqa: E402
+
+WORDS = ["fig", "kiwi", "lemon", "quince", "jazz", "pizzazz", "rhythm", "banana", "lynx", "zebra"]
+
+
+@pytest.fixture
+def corpus():
+    return Corpus.from_bytes(build_index(("Beginner", "test", w) for w in WORDS))
+
+
+def _frequency_game(logic, freq):
+    # What the "frequency" strategy does: the hinted first letter, then the
+    # most common letters across the corpus (ties to the earlier letter)
+    order = [logic.word[0]] + sorted("abcdefghijklmnopqrstuvwxyz", key=lambda ch: (-freq[ch], ch))
+    guesses = 0
+    for ch in order:
+        if logic.is_complete() or logic.is_game_over():
+            break
+        if ch in logic.guessed_letters:
+            continue
+        logic.guess(ch)
+        guesses += 1
+    return logic.is_complete(), guesses, logic.wrong_guesses
+
+
+@pytest.mark.parametrize("max_wrong", [3, 6])
+def test_batch_matches_game_logic(corpus, max_wrong):
+    freq = {ch: sum(ch in w for w in WORDS) for ch in "abcdefghijklmnopqrstuvwxyz"}
+    table = WordTable.from_corpus(corpus)
+    ids = np.arange(len(corpus))
+    state = play_batch(ids, table, STRATEGIES["frequency"], np.random.default_rng(0), max_wrong)
+    won = (state.word_mask & ~state.guessed) == 0
+
+    outcomes = set()
+    for i in range(len(corpus)):
+        logic = GameLogic.from_word(*corpus.entry(i))
+        logic.max_wrong = max_wrong
+        expected = _frequency_game(logic, freq)
+        assert (bool(won[i]), int(state.guesses[i]), int(state.wrong[i])) == expected, corpus.word(i)
+        outcomes.add(expected[0])
+    # The corpus has both wins and losses at this budget
+    assert outcomes == {True, False}
+
+
+def test_simulate_counts_every_game(corpus):
+    result = simulate(corpus, strategy="random", games_per_word=50, seed=3)
+    assert result.games.tolist() == [50] * len(WORDS)
+    assert (result.wins <= result.games).all()
+    assert result.guess_hist.sum() == 50 * len(WORDS)
+    report = result.to_dict()
+    assert report["overall"]["games"] == 50 * len(WORDS)
+    assert set(report["length"]) == {str(len(w)) for w in WORDS}
+    # Same seed, same games
+    again = simulate(corpus, strategy="random", games_per_word=50, seed=3)
+    assert (again.wins == result.wins).all()
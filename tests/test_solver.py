@@ -0,0 +1,54 @@
+import random
+
+from word_guessing_game.game.corpus import build_index, Corpus
+from word_guessing_game.game.data import WORD_LISTS
+from word_guessing_game.game.game_logic import GameLogic
+from word_guessing_game.game.solver import Solver, auto_play
+
+
+def _solver(words):
+    return Solver(Corpus.from_bytes(build_index(("Beginner", "test", w) for w in words)))
+
+
+def test_rank_prefers_the_most_informative_letter():
+    solver = _solver(["cat", "bat", "hat", "mat"])
+    ranked = solver.rank(list("___"), [])
+    # 'a' and 't' are in every candidate, so they tell nothing
+    assert ranked[0][0] in "bchm"
+    assert ranked[0][1] > 0
+    assert dict(ranked)["a"] == 0.0
+
+
+def test_candidates_respect_board_and_misses():
+    solver = _solver(["cat", "bat", "hat", "mat", "cot"])
+    assert sorted(solver.candidates(list("_a_"), ["b"])) == ["cat", "hat", "mat"]
+    assert solver.candidates(list("_a_"), ["b"], first_letter="h") == ["hat"]
+    assert solver.candidates(list("c__"), ["a"]) == ["cot"]
+
+
+def test_letters_outside_a_z_are_skipped():
+    solver = _solver(["cafe", "cafes", "x-ray", "xray"])
+    assert solver.candidates(list("x-__y"), []) == ["x-ray"]
+    assert solver.rank(list("x-__y"), [])[0][0] in "ar"
+
+    # A non-ASCII word on the board (GameLogic reveals it by scanning)
+    logic = GameLogic.from_word("Beginner", "test", "café")
+    assert logic.guess("é").status == "correct"
+    assert solver.candidates(logic.gameboard, logic.guessed_letters) == []
+    ranked = solver.rank(logic.gameboard, logic.guessed_letters)
+    assert "é" not in dict(ranked) and ranked[0][0] == "e"
+
+
+def test_unknown_board_falls_back_to_frequency_order():
+    solver = _solver(["cat"])
+    ranked = solver.rank(list("_____"), ["e"])
+    assert [ch for ch, _ in ranked[:3]] == ["t", "a", "o"]
+
+
+def test_auto_play_wins_beginner_games():
+    random.seed(7)
+    solver = Solver(Corpus.from_word_lists(WORD_LISTS))
+    for _ in range(20):
+        logic = GameLogic("Beginner", picker=solver.corpus.pick)
+        results = auto_play(logic, solver)
+        assert results and logic.is_complete()
@@ -0,0 +1,97 @@
+import sys
+import types
+
+import pytest
+
+from word_guessing_game.game import sounds
+from word_guessing_game.game.sounds import CHANNELS_PER_EFFECT, EFFECTS, SoundManager
+
+
+class StubChannel:
+    def __init__(self, n, played):
+        self.n = n
+        self.played = played
+
+    def play(self, sound):
+        self.played.append((sound.path, self.n))
+
+
+class StubSound:
+    def __init__(self, path):
+        self.path = path
+
+    def play(self):
+        raise AssertionError("effects play on their reserved channels")
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    """A pygame.mixer that records what was played on which channel."""
+    played = []
+    mixer = types.SimpleNamespace(
+        pre_init=lambda *args: None,
+        init=lambda *args: None,
+        get_num_channels=lambda: 8,
+        set_num_channels=lambda n: None,
+        set_reserved=lambda n: None,
+        Channel=lambda n: StubChannel(n, played),
+        Sound=StubSound,
+        played=played,
+    )
+    monkeypatch.setitem(sys.modules, "pygame", types.SimpleNamespace(mixer=mixer))
+    return mixer
+
+
+@pytest.fixture
+def sounds_dir(tmp_path):
+    for name, filename in EFFECTS.items():
+        if name != "game_over":
+            (tmp_path / filename).write_bytes(b"")
+    return tmp_path
+
+
+def test_queued_requests_drain_before_close(mixer, sounds_dir, capsys):
+    manager = SoundManager(sounds_dir)
+    manager.preload(["correct"])
+    for _ in range(3):
+        manager.play_wrong()
+    manager.play_game_over()
+    worker = manager._worker
+    manager.close()
+    assert not worker.is_alive() and manager._jobs.empty()
+    assert "Sound not found" in capsys.readouterr().out
+
+    wrong = str(sounds_dir / EFFECTS["wrong"])
+    first = list(EFFECTS).index("wrong") * CHANNELS_PER_EFFECT
+    # Round-robin over the effect's own channels so repeats overlap
+    assert sorted(mixer.played) == [(wrong, first), (wrong, first), (wrong, first + 1)]
+    report = manager.report()
+    assert report["enabled"] and report["buffer"] == sounds.MIXER_BUFFER
+    assert report["effects"]["correct"]["decode_ms"] is not None
+    assert report["effects"]["correct"]["plays"] == 0
+    assert report["effects"]["wrong"]["plays"] == 3
+    assert report["effects"]["game_over"]["plays"] == 0
+
+
+def test_decoded_effects_play_on_the_calling_thread(mixer, sounds_dir):
+    manager = SoundManager(sounds_dir)
+    manager.preload(["win"])
+    manager.close()
+    manager.play_win()
+    assert manager._worker is None
+    assert mixer.played == [(str(sounds_dir / EFFECTS["win"]), list(EFFECTS).index("win") * CHANNELS_PER_EFFECT)]
+
+
+def test_late_plays_are_dropped(mixer, sounds_dir, monkeypatch):
+    manager = SoundManager(sounds_dir)
+    monkeypatch.setattr(sounds, "_STALE_PLAY_S", -1.0)
+    manager.play_correct()
+    manager.close()
+    assert mixer.played == []
+    assert manager.report()["effects"]["correct"]["dropped"] == 1
+
+
+def test_close_without_start_is_a_no_op(sounds_dir):
+    manager = SoundManager(sounds_dir)
+    manager.close()
+    assert manager._worker is None
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from word_guessing_game.game import data, tournament
+from word_guessing_game.game.corpus import Corpus, build_index
+
+
+def _corpus(words):
+    return Corpus.from_bytes(build_index(("Beginner", "fruits", w) for w in words))
+
+
+@pytest.fixture
+def small_corpus():
+    data.set_corpus(_corpus(["fig", "kiwi", "lemon", "lime", "pear"]))
+    yield
+    data.set_corpus(None)
+
+
+def first_unguessed(logic, rng):
+    return next(ch for ch in "abcdefghijklmnopqrstuvwxyz" if ch not in logic.guessed_letters)
+
+
+def always_e(logic, rng):
+    return "e"
+
+
+def not_a_letter(logic, rng):
+    return "1"
+
+
+def test_run_resume_and_merge(tmp_path, small_corpus):
+    checkpoint = tmp_path / "run.jsonl"
+    report = tournament.run_tournament(checkpoint, ["frequency", "random"], games_per_word=2, shards=3, workers=1)
+    lines = checkpoint.read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[0])["config"]["corpus"] == data.load_corpus().fingerprint()
+    assert {row["strategy"] for row in report["leaderboard"]} == {"frequency", "random"}
+    assert all(row["games"] == 10 for row in report["leaderboard"])
+    assert sorted(row["word"] for row in report["hardness"]) == ["fig", "kiwi", "lemon", "lime", "pear"]
+
+    # Drop the last shard and leave a torn line; the rerun plays only that shard
+    with open(checkpoint, "w") as fh:
+        fh.write("\n".join(lines[:3]) + "\n" + lines[3][:10])
+    resumed = tournament.run_tournament(checkpoint, ["frequency", "random"], games_per_word=2, shards=3, workers=1)
+    assert resumed == report
+    assert len(checkpoint.read_text().splitlines()) == 4
+
+
+def test_resume_refuses_a_different_corpus_of_the_same_size(tmp_path, small_corpus):
+    checkpoint = tmp_path / "run.jsonl"
+    tournament.run_tournament(checkpoint, ["frequency"], shards=2, workers=1)
+    data.set_corpus(_corpus(["date", "kiwi", "lemon", "lime", "pear"]))
+    with pytest.raises(ValueError, match="different settings"):
+        tournament.run_tournament(checkpoint, ["frequency"], shards=2, workers=1)
+
+
+def test_workers_import_strategies_missing_from_their_registry(small_corpus):
+    # What a spawned worker sees: the registry holds only the built-ins
+    path = tournament._strategy_path(first_unguessed)
+    assert path == "tests.test_tournament:first_unguessed"
+    result = tournament.play_shard(0, [0, 1], {"first": path}, 1, 0)
+    assert set(result["results"]["first"]) == {"0", "1"}
+    assert tournament.STRATEGIES.pop("first") is first_unguessed
+
+    with pytest.raises(LookupError, match="module level"):
+        tournament.play_shard(0, [0], {"missing": "tests.test_tournament:nope"}, 1, 0)
+
+
+def test_games_are_deterministic_per_seed(small_corpus):
+    paths = {"random": tournament._strategy_path(tournament.random_strategy)}
+    assert tournament.play_shard(0, range(5), paths, 3, 1) == tournament.play_shard(0, range(5), paths, 3, 1)
+
+
+def test_repeats_and_non_letters_forfeit_instead_of_hanging(small_corpus):
+    paths = {name: tournament._strategy_path(fn) for name, fn in
+             (("e", always_e), ("digit", not_a_letter), ("first", first_unguessed))}
+    results = tournament.play_shard(0, range(5), paths, 2, 0)["results"]
+    for name in paths:
+        tournament.STRATEGIES.pop(name)
+    # "e" is one guess, then a forfeit on the repeat; digits forfeit at once
+    assert results["e"]["2"] == [2, 0, 4, 0, 2]
+    assert results["digit"]["0"] == [2, 0, 2, 0, 2]
+    assert all(row[4] == 0 and row[2] <= 2 * tournament.MAX_GUESSES for row in results["first"].values())
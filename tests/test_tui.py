@@ -0,0 +1,91 @@
+import io
+
+import pytest
+
+from word_guessing_game.game import persistence, tui
+
+
+class FixedScheduler:
+    """Every round is 'kiwi'; counts how many words were drawn."""
+
+    drawn = 0
+
+    def picker(self, state):
+        def pick(difficulty):
+            FixedScheduler.drawn += 1
+            return "fruits", "kiwi"
+        return pick
+
+
+class FakeScreen:
+    """Just enough of a curses window: scripted keys, recorded frames."""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.frames = []
+        self._frame = []
+
+    def getmaxyx(self):
+        return 24, 80
+
+    def erase(self):
+        self._frame = []
+
+    def addnstr(self, y, x, text, n):
+        self._frame.append(text[:n])
+
+    def refresh(self):
+        self.frames.append("\n".join(self._frame))
+
+    def getch(self):
+        return self.keys.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_words(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(tui, "ShuffleScheduler", FixedScheduler)
+    FixedScheduler.drawn = 0
+
+
+def test_lines_render_the_round():
+    game = tui.TerminalGame("Beginner")
+    game.guess("i")
+    lines = game.lines()
+    assert lines[0] == "Word Guessing Game - Beginner"
+    assert "    " + game.logic.board_text in lines
+    assert game.logic.board_text.replace(" ", "").count("i") == 2
+    assert lines[-1] == "Yes, 'i' is in the word."
+    game.guess("i")
+    assert game.lines()[-1] == "Already guessed 'i'."
+    game.guess("z")
+    assert game.lines()[-1] == "No 'z'."
+
+
+def test_line_mode_plays_rounds(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("4\n1\nki\n?\nk\nz\ni\nw\ny\nk\n"))
+    tui.run(plain=True)
+    out = capsys.readouterr().out
+    assert "Type a single letter." in out
+    assert "Try '" in out
+    assert "No 'z'." in out
+    assert "You won! The word was 'kiwi'." in out
+    # "y" started a second round; end of input quits it cleanly
+    assert FixedScheduler.drawn == 2
+
+
+def test_curses_loop_picks_a_difficulty_and_plays():
+    keys = [ord("9"), ord("3")] + [ord(c) for c in "kIw"] + [ord("1"), ord("i"), ord("y"), 27]
+    screen = FakeScreen(keys)
+    tui._curses_loop(screen, None)
+    assert screen.frames[0].startswith("Word Guessing Game\n\n  1) Beginner")
+    assert "Word Guessing Game - Advanced" in screen.frames[2]
+    won = [f for f in screen.frames if "You won!" in f]
+    assert won and won[0].endswith("Play again? (y/n)")
+    assert FixedScheduler.drawn == 2 and not screen.keys
+
+
+def test_escape_quits_from_the_menu():
+    screen = FakeScreen([27])
+    tui._curses_loop(screen, None)
+    assert len(screen.frames) == 1 and FixedScheduler.drawn == 0
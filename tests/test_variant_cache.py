@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from word_guessing_game.game.variant_cache import VariantCache, _decode, _encode  # noqa: E402
+
+
+def _source(path, color=(10, 20, 30)):
+    Image.new("RGB", (64, 32), color).save(path)
+    return path
+
+
+@pytest.mark.parametrize("mode", ["L", "RGB", "RGBA", "P"])
+def test_pam_round_trip(mode):
+    img = Image.new("RGBA", (7, 3), (1, 2, 3, 4)).convert(mode)
+    decoded = _decode(_encode(img))
+    expected = img.convert("RGB") if mode == "P" else img
+    assert decoded.mode == expected.mode and decoded.tobytes() == expected.tobytes()
+    # A torn file is a miss, not garbage pixels
+    assert _decode(_encode(img)[:-1]) is None
+
+
+def test_store_and_load(tmp_path):
+    cache = VariantCache(tmp_path / "variants")
+    source = _source(tmp_path / "bg.png")
+    assert cache.load(source, (16, 8)) is None
+    cache.store(source, (16, 8), Image.new("RGB", (16, 8), (9, 9, 9)))
+    cache.store(source, None, Image.open(source))
+    assert cache.load(source, (16, 8)).getpixel((0, 0)) == (9, 9, 9)
+    assert cache.load(source, None).size == (64, 32)
+    assert cache.load(source, (32, 16)) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+    files = list((tmp_path / "variants").iterdir())
+    assert cache.usage() == (2, sum(f.stat().st_size for f in files))
+
+
+def test_edited_source_invalidates_its_variants(tmp_path):
+    cache = VariantCache(tmp_path / "variants")
+    source = _source(tmp_path / "bg.png")
+    cache.store(source, (16, 8), Image.new("RGB", (16, 8)))
+    assert cache.load(source, (16, 8)) is not None
+    _source(source, color=(200, 0, 0))
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert cache.load(source, (16, 8)) is None
+
+
+def test_least_recently_used_variants_are_pruned(tmp_path):
+    source = _source(tmp_path / "bg.png")
+    sizes = [(16, 16 + i) for i in range(3)]
+    cap = sum(len(_encode(Image.new("RGB", size))) for size in sizes)
+    cache = VariantCache(tmp_path / "variants", cap_bytes=cap)
+    for i, size in enumerate(sizes):
+        cache.store(source, size, Image.new("RGB", size))
+        # Distinct, increasing mtimes regardless of filesystem resolution
+        path = cache.path_for(source, size)
+        os.utime(path, ns=(10 ** 9 * (i + 1), 10 ** 9 * (i + 1)))
+    assert cache.usage()[0] == 3
+    # Touch the oldest: a hit makes it recently used
+    assert cache.load(source, sizes[0]) is not None
+
+    cache.store(source, (17, 16), Image.new("RGB", (17, 16)))
+    assert cache.load(source, sizes[1]) is None
+    assert all(cache.load(source, s) is not None for s in (sizes[0], sizes[2], (17, 16)))
+    assert cache.usage()[1] <= cache.cap_bytes
+
+    assert cache.prune(cap_bytes=0) == 3
+    assert cache.usage() == (0, 0)
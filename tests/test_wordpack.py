@@ -0,0 +1,46 @@
+import pytest
+
+from word_guessing_game.game.corpus import Corpus, word_list_entries
+from word_guessing_game.game.data import WORD_LISTS, initial_hangman_index
+from word_guessing_game.game.game_logic import word_masks
+from word_guessing_game.game.wordpack import WordPack, compile_pack, main
+
+
+def test_pack_matches_corpus_index():
+    pack = WordPack.from_bytes(compile_pack(word_list_entries(WORD_LISTS), name="builtin"))
+    corpus = Corpus.from_word_lists(WORD_LISTS)
+    assert pack.name == "builtin"
+    assert len(pack) == len(corpus)
+    assert pack.groups == corpus.groups
+    assert pack.fingerprint() == corpus.fingerprint()
+    for i in range(len(pack)):
+        word = pack.word(i)
+        assert pack.entry(i) == corpus.entry(i)
+        assert pack.letter_masks[i] == word_masks(word).letter_mask
+        assert pack.lengths[i] == len(word)
+        assert pack.initial_indices[i] == initial_hangman_index(len(word))
+        assert pack.category_names[pack.category_ids[i]] == pack.entry(i)[1]
+
+
+def test_corrupt_pack_is_rejected():
+    data = bytearray(compile_pack([("Beginner", "fruits", "lemon")]))
+    data[-1] ^= 0xFF
+    with pytest.raises(ValueError, match="checksum"):
+        WordPack.from_bytes(bytes(data))
+    with pytest.raises(ValueError, match="not a word pack"):
+        WordPack.from_bytes(b"WGGI" + bytes(data[4:]))
+
+
+def test_compile_and_info_cli(tmp_path, capsys):
+    src = tmp_path / "words.txt"
+    src.write_text("Beginner\tfruits\tlemon\nAdvanced\tanimals\tokapi\n")
+    out = tmp_path / "themed.wgp"
+    assert main(["compile", str(out), "--source", str(src)]) == 0
+    pack = WordPack.load(out)
+    assert pack.name == "words"
+    assert pack.pick("Advanced") == ("animals", "okapi")
+    pack.close()
+    assert main(["info", str(out)]) == 0
+    assert "2 words" in capsys.readouterr().out
+    out.write_bytes(out.read_bytes()[:-1] + b"x")
+    assert main(["info", str(out)]) == 1
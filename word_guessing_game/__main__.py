@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .game.app import run
+import sys
+
+from .game.app import main
 
 if __name__ == "__main__":
-    run()
+    sys.exit(main())
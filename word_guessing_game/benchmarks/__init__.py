@@ -0,0 +1 @@
+"""Performance benchmarks for the Word Guessing Game."""
@@ -0,0 +1,187 @@
+"""Cold-start benchmark: import time, time-to-first-frame and terminal startup.
+
+Each sample runs in a fresh interpreter with empty state and cache
+directories, so module caches, saved rounds and prebuilt image variants
+never hide regressions or leak into the player's files. Run with ``python -m word_guessing_game.benchmarks.startup``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules that must stay off the path to the first painted window
+DEFERRED_MODULES = [
+    "pygame",
+    "PIL.ImageDraw",
+    "PIL.ImageFont",
+    "argparse",
+    "word_guessing_game.game.persistence",
+    "word_guessing_game.game.replay",
+    "word_guessing_game.game.scheduler",
+    "word_guessing_game.game.solver",
+]
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+t = time.perf_counter()
+import word_guessing_game.game.gui
+print(json.dumps({"import_s": time.perf_counter() - t,
+                  "loaded": [m for m in %(deferred)r if m in sys.modules]}))
+"""
+
+_FIRST_FRAME_SNIPPET = """
+import json, os, sys, time
+t0 = float(os.environ["WGG_BENCH_T0"])
+t = time.perf_counter()
+from word_guessing_game.game.gui import GameGUI
+import_s = time.perf_counter() - t
+app = GameGUI()
+def done():
+    print(json.dumps({"import_s": import_s, "first_frame_s": time.time() - t0,
+                      "loaded": [m for m in %(deferred)r if m in sys.modules]}), flush=True)
+    app.root.quit()
+app.on_first_frame = done
+app.start()
+"""
+
+# The terminal front-end must never load these
+TUI_FORBIDDEN_MODULES = ["tkinter", "PIL", "pygame"]
+
+_TUI_SNIPPET = """
+import json, os, resource, sys, time
+t0 = float(os.environ["WGG_BENCH_T0"])
+from word_guessing_game.game.tui import TerminalGame
+TerminalGame("Intermediate").lines()
+print(json.dumps({"first_screen_s": time.time() - t0,
+                  "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "loaded": [m for m in %(forbidden)r if m in sys.modules]}))
+"""
+
+
+def _run_child(snippet: str, timeout: float) -> Dict:
+    with tempfile.TemporaryDirectory(prefix="wgg-startup-") as tmp:
+        env = dict(
+            os.environ,
+            WGG_BENCH_T0=repr(time.time()),
+            PYGAME_HIDE_SUPPORT_PROMPT="1",
+            WORD_GUESSING_GAME_STATE=os.path.join(tmp, "state"),
+            WORD_GUESSING_GAME_CACHE=os.path.join(tmp, "cache"),
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", snippet % {"deferred": DEFERRED_MODULES, "forbidden": TUI_FORBIDDEN_MODULES}],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+    if proc.returncode != 0 or not lines:
+        err = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+        return {"error": err}
+    return json.loads(lines[-1])
+
+
+def _note_errors(section: Dict, samples: List[Dict]) -> None:
+    failed = [s["error"] for s in samples if "error" in s]
+    if failed:
+        section["errors"] = len(failed)
+        section["error"] = failed[-1]
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    ms = [v * 1000.0 for v in values]
+    return {
+        "median_ms": round(statistics.median(ms), 2),
+        "min_ms": round(min(ms), 2),
+        "max_ms": round(max(ms), 2),
+    }
+
+
+def measure(runs: int = 5, first_frame: bool = True, timeout: float = 30.0) -> Dict:
+    """Return import, time-to-first-frame and terminal startup statistics over ``runs`` samples."""
+    report: Dict = {"runs": runs, "python": sys.version.split()[0]}
+
+    samples = [_run_child(_IMPORT_SNIPPET, timeout) for _ in range(runs)]
+    ok = [s for s in samples if "error" not in s]
+    if ok:
+        report["import"] = _summary([s["import_s"] for s in ok])
+        report["import"]["loaded_deferred"] = ok[-1]["loaded"]
+    else:
+        report["import"] = {}
+    _note_errors(report["import"], samples)
+
+    if first_frame:
+        samples = [_run_child(_FIRST_FRAME_SNIPPET, timeout) for _ in range(runs)]
+        ok = [s for s in samples if "error" not in s]
+        if ok:
+            report["first_frame"] = _summary([s["first_frame_s"] for s in ok])
+            report["first_frame"]["loaded_deferred"] = ok[-1]["loaded"]
+        else:
+            # Typically "no display" on headless machines; use --no-first-frame there
+            report["first_frame"] = {}
+        _note_errors(report["first_frame"], samples)
+
+    samples = [_run_child(_TUI_SNIPPET, timeout) for _ in range(runs)]
+    ok = [s for s in samples if "error" not in s]
+    if ok:
+        report["tui"] = _summary([s["first_screen_s"] for s in ok])
+        report["tui"]["maxrss_kb"] = max(s["maxrss_kb"] for s in ok)
+        report["tui"]["loaded_deferred"] = ok[-1]["loaded"]
+    else:
+        report["tui"] = {}
+    _note_errors(report["tui"], samples)
+    return report
+
+
+def check(report: Dict, max_import_ms: Optional[float], max_first_frame_ms: Optional[float],
+          max_tui_ms: Optional[float] = None) -> List[str]:
+    """Return budget violations and failed samples found in ``report``."""
+    problems: List[str] = []
+    for key, budget in (("import", max_import_ms), ("first_frame", max_first_frame_ms), ("tui", max_tui_ms)):
+        section = report.get(key, {})
+        if "error" in section:
+            problems.append(f"{key}: {section['errors']} of {report['runs']} runs failed: {section['error']}")
+        if section.get("loaded_deferred"):
+            problems.append(f"{key}: deferred modules loaded eagerly: {section['loaded_deferred']}")
+        if budget is not None and section.get("median_ms", 0.0) > budget:
+            problems.append(f"{key}: median {section['median_ms']} ms exceeds budget {budget} ms")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure Word Guessing Game cold-start latency.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--no-first-frame", action="store_true", help="skip the windowed measurement")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="fail if the median import exceeds this")
+    parser.add_argument("--max-first-frame-ms", type=float, default=None, help="fail if the median first frame exceeds this")
+    parser.add_argument("--max-tui-ms", type=float, default=None, help="fail if the median terminal startup exceeds this")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = measure(runs=max(1, args.runs), first_frame=not args.no_first_frame)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key in ("import", "first_frame", "tui"):
+            if key in report:
+                print(f"{key:12s} {report[key]}")
+
+    problems = check(report, args.max_import_ms, args.max_first_frame_ms, args.max_tui_ms)
+    for p in problems:
+        print(f"FAIL {p}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,527 @@
+"""Benchmark suite for the game's hot paths.
+
+Covers guess/reset throughput, ``pick_word`` at several corpus sizes, image
+decode/resize per asset, ``_current_hangman_photo``, a full
+``_layout_game_window`` pass and cold start. Every benchmark reports
+per-operation percentiles plus memory high-water marks, and ``--json``
+writes a report that ``--compare`` can diff against a later run:
+
+    python -m word_guessing_game.benchmarks --json before.json
+    python -m word_guessing_game.benchmarks --compare before.json
+
+Tk benchmarks need a display; without one an ``Xvfb`` on PATH is started
+automatically, otherwise they are reported as skipped. ``main`` runs the
+suite on private, temporary state and cache directories, so saved rounds
+and image variants neither skew results nor get resumed or overwritten.
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from ..game import data
+from ..game.corpus import Corpus, build_index
+from ..game.data import (
+    BACKGROUNDS_DIR,
+    BUTTONS_DIR,
+    HANGMAN_DIR,
+    HANGMAN_IMAGE_FILENAMES,
+    load_corpus,
+    set_corpus,
+)
+from ..game.game_logic import GameLogic
+from . import startup
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# run(n) performs n operations; it may return (seconds, ops) it measured
+# itself to keep per-sample setup out of the timing
+RunFn = Callable[[int], Optional[Tuple[float, int]]]
+BENCHMARKS: Dict[str, Tuple[int, Callable[[], ContextManager[RunFn]]]] = {}
+
+CORPUS_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_SAMPLES = 30
+
+_ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+class Skip(Exception):
+    """Raised by a benchmark's setup when it cannot run here."""
+
+
+def register_benchmark(name: str, batch: int = 1000):
+    """Register a generator that sets up, yields ``run(n)``, then tears down."""
+    def deco(fn: Callable[[], Iterator[RunFn]]):
+        BENCHMARKS[name] = (batch, contextmanager(fn))
+        return fn
+    return deco
+
+
+# Measurement
+def _percentile(sorted_values: List[float], q: float) -> float:
+    i = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[i]
+
+
+def _maxrss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def run_benchmark(name: str, samples: int = DEFAULT_SAMPLES) -> Dict:
+    batch, setup = BENCHMARKS[name]
+    try:
+        with setup() as run:
+            run(batch)  # warm-up
+            per_op: List[float] = []
+            total_s = 0.0
+            total_ops = 0
+            for _ in range(samples):
+                t = time.perf_counter()
+                measured = run(batch)
+                elapsed, ops = measured if measured is not None else (time.perf_counter() - t, batch)
+                per_op.append(elapsed / max(1, ops))
+                total_s += elapsed
+                total_ops += ops
+            # Allocation high-water of one batch, measured separately since
+            # tracing slows everything down
+            tracemalloc.start()
+            try:
+                run(batch)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Skip as e:
+        return {"skipped": str(e)}
+
+    per_op.sort()
+    us = 1e6
+    return {
+        "samples": samples,
+        "batch": batch,
+        "p50_us": round(_percentile(per_op, 0.5) * us, 3),
+        "p90_us": round(_percentile(per_op, 0.9) * us, 3),
+        "p99_us": round(_percentile(per_op, 0.99) * us, 3),
+        "min_us": round(per_op[0] * us, 3),
+        "max_us": round(per_op[-1] * us, 3),
+        "ops_per_s": round(total_ops / total_s) if total_s else 0,
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "maxrss_kb": _maxrss_kb(),
+    }
+
+
+# Game logic
+def _frequency_plans(count: int) -> List[Tuple[Tuple[str, str, str], str]]:
+    """(entry, letters) pairs: each word played in English letter order to the end."""
+    corpus = load_corpus()
+    step = max(1, len(corpus) // count)
+    plans = []
+    for word_id in range(0, len(corpus), step):
+        d, c, w = corpus.entry(word_id)
+        logic = GameLogic.from_word(d, c, w)
+        letters = []
+        for ch in _ENGLISH_ORDER:
+            letters.append(ch)
+            result = logic.guess(ch)
+            if result.complete or result.game_over:
+                break
+        plans.append(((d, c, w), "".join(letters)))
+    return plans
+
+
+@register_benchmark("logic.guess", batch=5000)
+def bench_guess():
+    plans = _frequency_plans(2000)
+    cursor = [0]
+
+    def run(n: int) -> Tuple[float, int]:
+        games = []
+        ops = 0
+        while ops < n:
+            entry, letters = plans[cursor[0] % len(plans)]
+            cursor[0] += 1
+            games.append((GameLogic.from_word(*entry), letters))
+            ops += len(letters)
+        t = time.perf_counter()
+        for logic, letters in games:
+            guess = logic.guess
+            for ch in letters:
+                guess(ch)
+        return time.perf_counter() - t, ops
+
+    yield run
+
+
+@register_benchmark("logic.reset", batch=2000)
+def bench_reset():
+    logic = GameLogic("Intermediate")
+    reset = logic.reset
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            reset()
+
+    yield run
+
+
+# Word data
+def _synthetic_corpus(size: int) -> Corpus:
+    rng = random.Random(size)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    categories = [f"category{i}" for i in range(8)]
+    entries = []
+    for _ in range(size):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 12)))
+        difficulty = "Beginner" if len(word) <= 6 else "Intermediate" if len(word) <= 9 else "Advanced"
+        entries.append((difficulty, rng.choice(categories), word))
+    return Corpus.from_bytes(build_index(entries))
+
+
+def _register_pick_word(size: Optional[int]) -> None:
+    name = f"data.pick_word[{size}]" if size else "data.pick_word[default]"
+
+    @register_benchmark(name, batch=5000)
+    def bench():
+        from ..game.data import pick_word
+
+        previous = load_corpus()
+        if size:
+            set_corpus(_synthetic_corpus(size))
+
+        def run(n: int) -> None:
+            for _ in range(n):
+                pick_word("Intermediate")
+
+        try:
+            yield run
+        finally:
+            set_corpus(previous)
+
+
+for _size in [None] + CORPUS_SIZES:
+    _register_pick_word(_size)
+
+
+# Images
+_ASSETS: Dict[str, Tuple[Path, Optional[Tuple[int, int]]]] = {
+    "background": (BACKGROUNDS_DIR / "background_image.png", (950, 630)),
+    "button.beginner": (BUTTONS_DIR / "beginner_image.png", None),
+    "button.intermediate": (BUTTONS_DIR / "intermediate_image.png", None),
+    "button.advanced": (BUTTONS_DIR / "advanced_image.png", None),
+    "button.play": (BUTTONS_DIR / "play_image.png", None),
+}
+
+
+def _asset_paths(asset: str) -> Tuple[List[Path], Optional[Tuple[int, int]]]:
+    """Files and target size for an asset; "hangman" cycles through every frame."""
+    if asset == "hangman":
+        paths, size = [HANGMAN_DIR / f for f in HANGMAN_IMAGE_FILENAMES], (600, 250)
+    else:
+        path, size = _ASSETS[asset]
+        paths = [path]
+    if not paths[0].exists():
+        raise Skip(f"missing asset {paths[0]}")
+    return paths, size
+
+
+def _register_decode(asset: str) -> None:
+    @register_benchmark(f"image.decode_resize[{asset}]", batch=5)
+    def bench():
+        """Decode + resize only (PIL, no Tk), cache bypassed."""
+        from PIL import Image
+
+        paths, size = _asset_paths(asset)
+        cursor = [0]
+
+        def run(n: int) -> None:
+            for _ in range(n):
+                path = paths[cursor[0] % len(paths)]
+                cursor[0] += 1
+                with Image.open(path) as im:
+                    img = im.copy()
+                if size:
+                    img.resize(size)
+
+        yield run
+
+
+def _register_resized(asset: str) -> None:
+    @register_benchmark(f"image.resized[{asset}]", batch=5)
+    def bench():
+        """ImageCache.resized (the resize workers' draft/reduce path), no cache or stored variants."""
+        from ..game.image_cache import ImageCache
+
+        paths, size = _asset_paths(asset)
+        cache = ImageCache()
+        cursor = [0]
+
+        def run(n: int) -> None:
+            for _ in range(n):
+                cache.clear()
+                cache.resized(paths[cursor[0] % len(paths)], size)
+                cursor[0] += 1
+
+        yield run
+
+
+def _register_load_image(asset: str) -> None:
+    @register_benchmark(f"image.load_image[{asset}]", batch=5)
+    def bench():
+        """gui._load_image on a cold in-memory cache, as on a relaunch (stored variants hit)."""
+        from ..game import gui
+        from ..game.image_cache import IMAGE_CACHE
+
+        paths, size = _asset_paths(asset)
+        root = _game_gui().root
+        if size:
+            # Benchmark sizes are warm sizes: store them as `warm` would
+            for path in paths:
+                IMAGE_CACHE.resized(path, size, persist=True)
+        cursor = [0]
+
+        def run(n: int) -> None:
+            for _ in range(n):
+                IMAGE_CACHE.clear()
+                gui._load_image(paths[cursor[0] % len(paths)], size, master=root)
+                cursor[0] += 1
+
+        yield run
+
+
+for _asset in list(_ASSETS) + ["hangman"]:
+    _register_decode(_asset)
+    if _asset == "hangman" or _ASSETS[_asset][1]:
+        _register_resized(_asset)
+    _register_load_image(_asset)
+
+
+# Tk
+_guis: Dict = {}
+_xvfb: Optional[subprocess.Popen] = None
+
+
+def _ensure_display() -> None:
+    """Start a private Xvfb when there is no display but one is installed."""
+    global _xvfb
+    if os.environ.get("DISPLAY") or os.name != "posix" or sys.platform == "darwin" or _xvfb is not None:
+        return
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return
+    display = 90 + os.getpid() % 100
+    _xvfb = subprocess.Popen([xvfb, f":{display}", "-screen", "0", "1600x1200x24", "-nolisten", "tcp"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    atexit.register(_xvfb.terminate)
+    socket = Path(f"/tmp/.X11-unix/X{display}")
+    deadline = time.monotonic() + 5.0
+    while not socket.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = f":{display}"
+
+
+def _game_gui(renderer: str = "widgets"):
+    """A live game window, driven by update() instead of a mainloop."""
+    if renderer not in _guis:
+        _ensure_display()
+        try:
+            import tkinter as tk
+
+            if renderer == "canvas":
+                from ..game.canvas_gui import CanvasGameGUI as GameGUI
+            else:
+                from ..game.gui import GameGUI
+        except ImportError as e:
+            raise Skip(f"Tk unavailable: {e}")
+
+        gui = GameGUI()
+        try:
+            gui._create_root()
+            gui._show_game_window("Intermediate")
+        except tk.TclError as e:
+            raise Skip(f"no display: {e}")
+        gui.root.update()
+        _guis[renderer] = gui
+    return _guis[renderer]
+
+
+def _close_gui() -> None:
+    for gui in _guis.values():
+        gui._destroy_root()
+    _guis.clear()
+
+
+_WINDOW_SIZES = [(950, 630), (1200, 800), (1500, 1000), (760, 504)]
+
+
+@register_benchmark("gui.current_hangman_photo", batch=20)
+def bench_hangman_photo():
+    gui = _game_gui()
+    frames = len(gui.hangman_images)
+    cursor = [0]
+
+    def run(n: int) -> None:
+        for _ in range(n):
+            gui.hangman_index = cursor[0] % frames
+            cursor[0] += 1
+            gui._current_hangman_photo()
+
+    yield run
+
+
+def _register_layout(renderer: str) -> None:
+    name = "gui.layout_game_window" + ("" if renderer == "widgets" else f"[{renderer}]")
+
+    @register_benchmark(name, batch=1)
+    def bench():
+        gui = _game_gui(renderer)
+        root = gui.root
+        cursor = [0]
+
+        def run(n: int) -> Tuple[float, int]:
+            elapsed = 0.0
+            for _ in range(n):
+                w, h = _WINDOW_SIZES[cursor[0] % len(_WINDOW_SIZES)]
+                cursor[0] += 1
+                root.geometry(f"{w}x{h}")
+                root.update()
+                t = time.perf_counter()
+                gui._layout_game_window()
+                root.update_idletasks()
+                elapsed += time.perf_counter() - t
+            return elapsed, n
+
+        yield run
+
+
+for _renderer in ("widgets", "canvas"):
+    _register_layout(_renderer)
+
+
+# Runner
+@contextmanager
+def _scratch_dirs() -> Iterator[None]:
+    """Point the game's state and cache directories at a temporary one.
+
+    Of the game modules only ``data`` is imported up front; the ones that
+    read these paths (persistence, variant_cache, sampler) are imported
+    lazily by the benchmarks and so pick up the scratch directories.
+    """
+    saved = data.STATE_DIR, data.CACHE_DIR
+    with tempfile.TemporaryDirectory(prefix="wgg-bench-") as tmp:
+        data.STATE_DIR, data.CACHE_DIR = Path(tmp) / "state", Path(tmp) / "cache"
+        try:
+            yield
+        finally:
+            data.STATE_DIR, data.CACHE_DIR = saved
+
+
+def run_suite(names: List[str], samples: int = DEFAULT_SAMPLES, startup_runs: int = 3) -> Dict:
+    report: Dict = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "samples": samples,
+        },
+        "results": {},
+    }
+    try:
+        for name in names:
+            print(f"  {name} ...", file=sys.stderr, flush=True)
+            report["results"][name] = run_benchmark(name, samples)
+    finally:
+        _close_gui()
+    if startup_runs:
+        print("  startup ...", file=sys.stderr, flush=True)
+        report["startup"] = startup.measure(runs=startup_runs, first_frame=bool(os.environ.get("DISPLAY")))
+    return report
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(report: Dict, baseline: Dict) -> List[str]:
+    """One line per benchmark present in both reports: p50 before -> after."""
+    lines = []
+    for name, row in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "p50_us" not in base or "p50_us" not in row:
+            continue
+        ratio = row["p50_us"] / base["p50_us"] if base["p50_us"] else float("inf")
+        lines.append(f"{name:40s} {base['p50_us']:>10.2f} -> {row['p50_us']:>10.2f} us  ({ratio:.2f}x)")
+    return lines
+
+
+def _format(name: str, row: Dict) -> str:
+    if "skipped" in row:
+        return f"{name:40s} skipped: {row['skipped']}"
+    return (f"{name:40s} p50 {row['p50_us']:>10.2f} us  p90 {row['p90_us']:>10.2f}  p99 {row['p99_us']:>10.2f}  "
+            f"{row['ops_per_s']:>10,}/s  peak {row['peak_alloc_kb']:.0f} KiB")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Word Guessing Game's hot paths.")
+    parser.add_argument("--filter", default=None, help="run only benchmarks whose name contains this")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--startup-runs", type=int, default=3, help="fresh interpreters for cold start (0 = skip)")
+    parser.add_argument("--json", type=Path, default=None, help="write the report here")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline report to diff against")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if not args.filter or args.filter in n]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    startup_runs = args.startup_runs if not args.filter or "startup" in args.filter else 0
+    with _scratch_dirs():
+        report = run_suite(names, max(1, args.samples), startup_runs)
+    for name, row in report["results"].items():
+        print(_format(name, row))
+    for key in ("import", "first_frame", "tui"):
+        if key in report.get("startup", {}):
+            print(f"{'startup.' + key:40s} {report['startup'][key]}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.compare:
+        try:
+            baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Cannot read baseline: {e}", file=sys.stderr)
+            return 1
+        print(f"\nvs {args.compare} ({baseline.get('meta', {}).get('commit')}):")
+        for line in compare(report, baseline):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
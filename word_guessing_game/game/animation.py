@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+import tkinter as tk
+
+# Hangman animation rate
+ANIMATION_FPS: float = 30.0
+
+
+class FrameAnimator:
+    """Steps a frame index towards a target at a fixed rate on the Tk loop.
+
+    ``animate_to`` raises the target; a run already in progress keeps its
+    clock, so rapid calls coalesce into one continuous run. Each tick shows
+    the frame the run should be on by the clock, so a late tick skips the
+    frames it missed rather than slowing the run down. ``show(index, final)``
+    returns False when a frame isn't ready (it is dropped); it must always
+    show the final frame of a run.
+    """
+
+    def __init__(self, show: Callable[[int, bool], bool], fps: float = ANIMATION_FPS) -> None:
+        self._show = show
+        self.frame_s = 1.0 / fps
+        self.shown = 0
+        self.target = 0
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self._root: Optional[tk.Misc] = None
+        self._job: Optional[str] = None
+        self._run_from = 0
+        self._run_start = 0.0
+
+    def attach(self, root: tk.Misc) -> None:
+        self.detach()
+        self._root = root
+
+    def detach(self) -> None:
+        self._cancel()
+        self._root = None
+
+    @property
+    def running(self) -> bool:
+        return self._job is not None
+
+    def jump(self, index: int) -> None:
+        """Show ``index`` now, ending any run."""
+        self._cancel()
+        self.shown = self.target = index
+        self._show(index, True)
+        self.frames_shown += 1
+
+    def animate_to(self, index: int) -> None:
+        if index < self.shown or self._root is None:
+            self.jump(index)
+            return
+        self.target = index
+        if self._job is None and index > self.shown:
+            self._run_from = self.shown
+            self._run_start = time.monotonic()
+            self._schedule(self.frame_s)
+
+    def _tick(self) -> None:
+        self._job = None
+        now = time.monotonic()
+        due = self._run_from + int((now - self._run_start) / self.frame_s)
+        index = min(max(due, self.shown + 1), self.target)
+        if self._show(index, index == self.target):
+            self.frames_dropped += index - self.shown - 1
+            self.frames_shown += 1
+            self.shown = index
+        if self.shown < self.target:
+            next_at = self._run_start + (max(due, self.shown) - self._run_from + 1) * self.frame_s
+            self._schedule(next_at - now)
+
+    def _schedule(self, delay_s: float) -> None:
+        if self._root is None:
+            return
+        try:
+            self._job = self._root.after(max(1, int(delay_s * 1000)), self._tick)
+        except tk.TclError:
+            self._root = None
+
+    def _cancel(self) -> None:
+        if self._job is not None and self._root is not None:
+            try:
+                self._root.after_cancel(self._job)
+            except Exception:
+                pass
+        self._job = None
@@ -1,12 +1,116 @@
 from __future__ import annotations
 
-from .gui import GameGUI
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
+if TYPE_CHECKING:
+    import argparse
+
+
+def run(record: Optional[Path] = None, profile: Optional[Path] = None, renderer: str = "widgets",
+        metrics_path: Optional[Path] = None, metrics_port: Optional[int] = None) -> None:
+    # Imported lazily so `import word_guessing_game` stays free of Tk/PIL
+    if renderer == "canvas":
+        from .canvas_gui import CanvasGameGUI as GameGUI
+    else:
+        from .gui import GameGUI
 
-def run() -> None:
     app = GameGUI()
-    app.start()
+    if record:
+        from .replay import GuessRecorder
+
+        app.recorder = GuessRecorder(record)
+    if metrics_path or metrics_port is not None:
+        from .metrics import MetricsExporter
+
+        exporter = MetricsExporter(metrics_path, metrics_port)
+        exporter.start()
+        try:
+            _start(app, profile)
+        finally:
+            exporter.close()
+        return
+    _start(app, profile)
+
+
+def _start(app, profile: Optional[Path]) -> None:
+    if not profile:
+        app.start()
+        return
+
+    from .profiling import FrameBudgetProfiler
+
+    profiler = FrameBudgetProfiler()
+    profiler.attach(app)
+    try:
+        app.start()
+    finally:
+        profiler.stop()
+        print(profiler.report(), file=sys.stderr)
+        try:
+            samples = profiler.dump(profile)
+            print(f"{samples} stack samples written to {profile} (folded format)", file=sys.stderr)
+        except OSError as e:
+            print(f"Failed to write profile: {e}", file=sys.stderr)
+
+
+def _add_gui_options(parser: argparse.ArgumentParser, default) -> None:
+    parser.add_argument("--record", type=Path, default=default, help="append every guess to this recording (see game/replay.py)")
+    parser.add_argument("--profile", type=Path, nargs="?", const=Path("wgg-profile.folded"), default=default,
+                        help="time Tk callbacks against a 16 ms frame budget and write folded stacks on exit")
+    parser.add_argument("--renderer", choices=["widgets", "canvas"], default=default if default is not None else "widgets",
+                        help="draw the game screen with Tk widgets (default) or on a single canvas")
+
+
+def _add_metrics_options(parser: argparse.ArgumentParser, default) -> None:
+    parser.add_argument("--metrics", dest="metrics_path", type=Path, nargs="?", const=Path("wgg-metrics.prom"), default=default,
+                        help="write latency histograms in Prometheus text format here, periodically and on exit")
+    parser.add_argument("--metrics-port", type=int, default=default, help="serve the same metrics at http://HOST:PORT/metrics")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # Not at module level: the package imports this module on every launch
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="word_guessing_game", description="Word Guessing Game")
+    _add_gui_options(parser, None)
+    _add_metrics_options(parser, None)
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    # SUPPRESS keeps `gui` from resetting options given before the command
+    gui = commands.add_parser("gui", help="play in a window (default)")
+    _add_gui_options(gui, argparse.SUPPRESS)
+    _add_metrics_options(gui, argparse.SUPPRESS)
+
+    tui = commands.add_parser("tui", help="play in the terminal (no tkinter, Pillow or pygame)")
+    tui.add_argument("--difficulty", choices=["Beginner", "Intermediate", "Advanced"], default=None)
+    tui.add_argument("--plain", action="store_true", help="line-by-line prompts instead of curses")
+
+    serve = commands.add_parser("serve", help="host headless games over line-delimited JSON/TCP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--idle-timeout", type=float, default=600.0, help="seconds before an idle session is dropped")
+    serve.add_argument("--max-sessions", type=int, default=200_000)
+    serve.add_argument("--state-dir", type=Path, default=None, help="persist sessions here across restarts")
+    _add_metrics_options(serve, argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.command == "tui":
+        from . import tui
+
+        try:
+            tui.run(args.difficulty, args.plain)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.command == "serve":
+        from . import server
+
+        return server.run(args.host, args.port, args.idle_timeout, args.max_sessions, args.state_dir,
+                          args.metrics_path, args.metrics_port)
+    run(args.record, args.profile, args.renderer, args.metrics_path, args.metrics_port)
+    return 0
 
 
 if __name__ == "__main__":
-    run()
+    sys.exit(main())
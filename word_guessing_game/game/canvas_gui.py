@@ -0,0 +1,182 @@
+"""Single-canvas renderer for the game screen.
+
+``CanvasGameGUI`` draws the background, hint, hangman, board, counters and
+the 26 letter keys as items on one ``tk.Canvas`` instead of ~32 widgets.
+Items carry tags (``board``, ``keybg-a``, ``scaled`` ...), so a state change
+is one ``itemconfigure`` on a tag and is skipped when nothing changed.
+Letter presses are resolved by hit-testing the key grid arithmetically.
+On resize, every item laid out in design coordinates is moved with a single
+``Canvas.scale`` call; only the shared fonts and the two images are
+re-rendered.
+
+Select it with ``python -m word_guessing_game --renderer canvas``.
+"""
+from __future__ import annotations
+
+from typing import Dict, Optional, Set
+
+import tkinter as tk
+
+from PIL import ImageTk
+
+from .data import ALPHABET, BACKGROUNDS_DIR
+from .frames import hangman_size
+from .gui import GameGUI
+
+KEY_FILL = "#d9d9d9"
+KEY_OUTLINE = "#8c8c8c"
+KEY_TEXT = "#000000"
+KEY_DISABLED_FILL = "#c8c8c8"
+KEY_DISABLED_TEXT = "#a3a3a3"
+KEY_HIGHLIGHT_FILL = "#ffd54f"
+# Suggest button box at scale 1.0
+SUGGEST_BOX = (700, 300, 850, 330)
+
+
+class CanvasGameGUI(GameGUI):
+    def __init__(self) -> None:
+        super().__init__()
+        self.canvas: Optional[tk.Canvas] = None
+        self._texts: Dict[str, str] = {}  # last text drawn per item tag
+        self._disabled: Set[str] = set()
+        self._scaled = 1.0  # factor currently applied to the "scaled" items
+        self._bg_photo: Optional[ImageTk.PhotoImage] = None
+        self._hangman_photo: Optional[ImageTk.PhotoImage] = None
+
+    def _destroy_root(self) -> None:
+        super()._destroy_root()
+        self.canvas = None
+        self._texts.clear()
+        self._disabled.clear()
+        self._scaled = 1.0
+
+    def _build_game_screen(self) -> None:
+        root = self._create_root()
+        screen = self.game_screen = tk.Frame(root)
+        fonts = self._create_game_fonts(root)
+        c = self.canvas = tk.Canvas(screen, highlightthickness=0, borderwidth=0, background="#1e1e1e")
+        c.place(x=0, y=0, relwidth=1, relheight=1)
+
+        self._game_bg_path = BACKGROUNDS_DIR / "background_image.png"
+        c.create_image(0, 0, anchor="nw", tags=("background",))
+        # Centre column, positioned by the ("column",) layout entry
+        c.create_text(0, 0, anchor="n", font=fonts["hint"], tags=("hint",))
+        c.create_image(0, 0, anchor="n", tags=("hangman",))
+        c.create_text(0, 0, anchor="n", font=fonts["board"], tags=("board",))
+
+        # Everything tagged "scaled" is drawn in design coordinates and
+        # follows the window via Canvas.scale
+        c.create_text(100, 300, anchor="nw", font=fonts["meta"], tags=("guesses", "scaled"))
+        c.create_text(100, 330, anchor="nw", font=fonts["meta"], tags=("lives", "scaled"))
+        x1, y1, x2, y2 = SUGGEST_BOX
+        c.create_rectangle(x1, y1, x2, y2, fill=KEY_FILL, outline=KEY_OUTLINE, tags=("suggest", "scaled"))
+        c.create_text((x1 + x2) / 2, (y1 + y2) / 2, text="Suggest a letter", font=fonts["meta"], tags=("suggest", "scaled"))
+
+        base = self._alpha_base
+        for i, letter in enumerate(ALPHABET):
+            row, col = divmod(i, base["per_row"])
+            x = base["x0"] + col * base["col_w"]
+            y = base["y0"] + row * base["row_h"]
+            c.create_rectangle(x + 1, y + 1, x + base["btn_w"] - 1, y + base["btn_h"] - 1,
+                               fill=KEY_FILL, outline=KEY_OUTLINE, tags=("scaled", f"keybg-{letter}"))
+            c.create_text(x + base["btn_w"] / 2, y + base["btn_h"] / 2, text=letter.upper(), fill=KEY_TEXT,
+                          font=fonts["letters"], tags=("scaled", f"keytext-{letter}"))
+        self._scaled = 1.0
+
+        c.bind("<ButtonPress-1>", self._on_canvas_click)
+        screen.bind("<Configure>", self._on_game_configure)
+        root.geometry(f"{self.BASE_W}x{self.BASE_H}")
+
+    # Hit-testing
+    def _letter_at(self, x: float, y: float) -> Optional[str]:
+        base = self._alpha_base
+        bx = x / self._scaled - base["x0"]
+        by = y / self._scaled - base["y0"]
+        if bx < 0 or by < 0:
+            return None
+        col, dx = divmod(bx, base["col_w"])
+        row, dy = divmod(by, base["row_h"])
+        i = int(row) * base["per_row"] + int(col)
+        if col >= base["per_row"] or i >= len(ALPHABET) or dx > base["btn_w"] or dy > base["btn_h"]:
+            return None
+        return ALPHABET[i]
+
+    def _on_canvas_click(self, event) -> None:
+        letter = self._letter_at(event.x, event.y)
+        if letter:
+            if letter not in self._disabled:
+                self._on_letter(letter)
+            return
+        x1, y1, x2, y2 = SUGGEST_BOX
+        if x1 <= event.x / self._scaled <= x2 and y1 <= event.y / self._scaled <= y2:
+            self._on_suggest()
+
+    # Rendering hooks
+    def _set_text(self, name: str, text: str) -> None:
+        if self.canvas and self._texts.get(name) != text:
+            self._texts[name] = text
+            self.canvas.itemconfigure(name, text=text)
+
+    def _set_hangman_image(self, img: ImageTk.PhotoImage) -> None:
+        if self.canvas:
+            if img is not self._hangman_photo:
+                self.canvas.itemconfigure("hangman", image=img)
+                self._hangman_photo = img
+
+    def _set_game_background(self, img: ImageTk.PhotoImage) -> None:
+        if self.canvas:
+            self.canvas.itemconfigure("background", image=img)
+            self._bg_photo = img
+
+    def _set_letter_enabled(self, letter: str, enabled: bool) -> None:
+        if not self.canvas or enabled == (letter not in self._disabled):
+            return
+        if enabled:
+            self._disabled.discard(letter)
+        else:
+            self._disabled.add(letter)
+        self.canvas.itemconfigure(f"keybg-{letter}", fill=KEY_FILL if enabled else KEY_DISABLED_FILL)
+        self.canvas.itemconfigure(f"keytext-{letter}", fill=KEY_TEXT if enabled else KEY_DISABLED_TEXT)
+
+    def _letter_enabled(self, letter: str) -> bool:
+        return letter in ALPHABET and letter not in self._disabled
+
+    def _set_letter_highlight(self, letter: str, on: bool) -> None:
+        if self.canvas:
+            fill = KEY_HIGHLIGHT_FILL if on else (KEY_DISABLED_FILL if letter in self._disabled else KEY_FILL)
+            self.canvas.itemconfigure(f"keybg-{letter}", fill=fill)
+
+    # Layout
+    def _game_layout(self, w: int, h: int) -> Dict[tuple, object]:
+        s = self._scale_for(w, h)
+        size = hangman_size(min(w / self.BASE_W, h / self.BASE_H))
+        hint_size = max(8, int(12 * s))
+        # Fonts come first: the column entry measures the hint font
+        return {
+            ("font", "hint"): hint_size,
+            ("font", "board"): max(16, int(30 * s)),
+            ("font", "meta"): max(8, int(10 * s)),
+            ("font", "letters"): max(10, int(16 * s)),
+            ("background",): (w, h),
+            ("scale",): s,
+            ("column",): (w // 2, hint_size, size[1]),
+            ("hangman",): size,
+        }
+
+    def _apply_layout_item(self, key: tuple, value) -> None:
+        kind = key[0]
+        c = self.canvas
+        if c is None:
+            return
+        if kind == "scale":
+            ratio = value / self._scaled
+            c.scale("scaled", 0, 0, ratio, ratio)
+            self._scaled = value
+        elif kind == "column":
+            cx, _, hangman_h = value
+            top = self._layout.fonts["hint"].metrics("linespace") + 5
+            c.coords("hint", cx, 0)
+            c.coords("hangman", cx, top)
+            c.coords("board", cx, top + hangman_h + 5)
+        else:
+            super()._apply_layout_item(key, value)
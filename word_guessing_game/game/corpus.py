@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# Compiled index layout (all offsets relative to the start of the file):
+#   header   magic, version, reserved, JSON metadata length
+#   metadata JSON: word count, group table, source stamp, byte order
+#   offsets  uint32[count + 1] into the blob, 4-byte aligned
+#   blob     concatenated ASCII words
+# Words are sorted by (difficulty, category, length, word) so every group,
+# and every (difficulty, category) pair, is one contiguous id range.
+MAGIC = b"WGGI"
+# 2: difficulty names are normalised to DIFFICULTIES
+VERSION = 2
+_HEADER = struct.Struct("<4sHHI")
+
+# Entry = (difficulty, category, word)
+Entry = Tuple[str, str, str]
+# Group = (difficulty, category, length, first word id, word count)
+Group = Tuple[str, str, int, int, int]
+
+# Canonical difficulty names (the keys of data.WORD_LISTS)
+DIFFICULTIES = ("Beginner", "Intermediate", "Advanced")
+_DIFFICULTY_BY_NAME = {d.lower(): d for d in DIFFICULTIES}
+
+
+def _difficulty_for_length(length: int) -> str:
+    if length <= 5:
+        return "Beginner"
+    if length <= 7:
+        return "Intermediate"
+    return "Advanced"
+
+
+def read_source(path: Path) -> Iterator[Entry]:
+    """Yield entries from a word file.
+
+    Each non-blank, non-comment line is ``difficulty<TAB>category<TAB>word``
+    (commas also accepted). A line holding just a word goes to category
+    'general' with a difficulty derived from its length. Difficulty names
+    are matched case-insensitively against DIFFICULTIES; any other name
+    raises ValueError naming the line.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [f.strip() for f in line.split("\t" if "\t" in line else ",")]
+            if len(fields) >= 3:
+                difficulty = _DIFFICULTY_BY_NAME.get(fields[0].lower())
+                if difficulty is None:
+                    raise ValueError(
+                        f"{path}:{lineno}: unknown difficulty {fields[0]!r} (expected one of {', '.join(DIFFICULTIES)})"
+                    )
+                category, word = fields[1].lower(), fields[2].lower()
+            else:
+                word = fields[0].lower()
+                difficulty, category = _difficulty_for_length(len(word)), "general"
+            if word.isascii() and word.isalpha():
+                yield difficulty, category, word
+
+
+def word_list_entries(word_lists: Mapping[str, Mapping[str, Sequence[str]]]) -> Iterator[Entry]:
+    for difficulty, categories in word_lists.items():
+        for category, words in categories.items():
+            for word in words:
+                yield difficulty, category, word
+
+
+def build_index(entries: Iterable[Entry], source_stamp: Tuple[int, int] = (0, 0)) -> bytes:
+    """Compile entries into the binary index format, dropping duplicates."""
+    rows = sorted({(d, c, len(w), w) for d, c, w in entries})
+
+    offsets = array("I", [0])
+    blob = bytearray()
+    for row in rows:
+        blob += row[3].encode("ascii")
+        offsets.append(len(blob))
+
+    groups: List[Group] = []
+    start = 0
+    for (d, c, length), members in itertools.groupby(rows, key=lambda r: r[:3]):
+        count = sum(1 for _ in members)
+        groups.append((d, c, length, start, count))
+        start += count
+
+    meta = json.dumps({
+        "count": len(rows),
+        "groups": groups,
+        "source_mtime_ns": source_stamp[0],
+        "source_size": source_stamp[1],
+        "byteorder": sys.byteorder,
+    }).encode("utf-8")
+    head = _HEADER.pack(MAGIC, VERSION, 0, len(meta)) + meta
+    head += b"\0" * (-len(head) % 4)
+    return head + offsets.tobytes() + bytes(blob)
+
+
+class Corpus:
+    """Read-only word corpus over a compiled index (memory-mapped when on disk).
+
+    Words are decoded on access only, so sampling never copies word lists.
+    """
+
+    def __init__(self, buf: memoryview, mm: Optional[mmap.mmap] = None) -> None:
+        magic, version, _, meta_len = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a word corpus index (or an unsupported version)")
+        meta_end = _HEADER.size + meta_len
+        self.meta = json.loads(bytes(buf[_HEADER.size:meta_end]))
+        if self.meta["byteorder"] != sys.byteorder:
+            raise ValueError("word corpus index was built on a machine with another byte order")
+
+        count = self.meta["count"]
+        off_at = meta_end + (-meta_end % 4)
+        blob_at = off_at + 4 * (count + 1)
+        self._mmap = mm
+        self._buf = buf
+        self._index(self.meta["groups"], buf[off_at:blob_at].cast("I"), buf[blob_at:])
+
+    def _index(self, groups: Sequence[Sequence], offsets: memoryview, blob: memoryview) -> None:
+        """Build the in-memory group lookups; ``offsets``/``blob`` stay views."""
+        self._offsets = offsets
+        self._blob = blob
+        self.groups: List[Group] = [tuple(g) for g in groups]  # type: ignore[misc]
+        self._group_starts = [g[3] for g in self.groups]
+        self._ranges: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._group_index: Dict[Tuple[str, str, int], Tuple[int, int]] = {}
+        for d, c, length, start, n in self.groups:
+            self._group_index[(d, c, length)] = (start, n)
+            first, total = self._ranges.get((d, c), (start, 0))
+            self._ranges[(d, c)] = (first, total + n)
+            cats = self._categories.setdefault(d, [])
+            if not cats or cats[-1] != c:
+                cats.append(c)
+        self._selections: Dict[Tuple[str, Optional[str], Optional[int]], Tuple[List[int], List[int]]] = {}
+
+    # Construction
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Corpus":
+        return cls(memoryview(data))
+
+    @classmethod
+    def load(cls, path: Path) -> "Corpus":
+        """Map a compiled file directly (no staleness check against a source)."""
+        with open(path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(memoryview(mm), mm)
+        except Exception:
+            try:
+                mm.close()
+            except BufferError:
+                pass
+            raise
+
+    @classmethod
+    def from_word_lists(cls, word_lists: Mapping[str, Mapping[str, Sequence[str]]]) -> "Corpus":
+        return cls.from_bytes(build_index(word_list_entries(word_lists)))
+
+    @classmethod
+    def open(cls, source: Path, index_path: Optional[Path] = None) -> "Corpus":
+        """Open ``source`` through its compiled index, rebuilding it if stale."""
+        source = Path(source)
+        st = source.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        index_path = Path(index_path) if index_path else source.with_name(source.name + ".idx")
+
+        corpus = cls._map(index_path)
+        if corpus is not None:
+            if (corpus.meta["source_mtime_ns"], corpus.meta["source_size"]) == stamp:
+                return corpus
+            corpus.close()
+
+        data = build_index(read_source(source), stamp)
+        tmp = index_path.with_name(index_path.name + f".{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, index_path)
+        except OSError:
+            # Read-only location: serve the freshly built index from memory
+            return cls.from_bytes(data)
+        return cls._map(index_path) or cls.from_bytes(data)
+
+    @classmethod
+    def _map(cls, path: Path) -> Optional["Corpus"]:
+        try:
+            return cls.load(path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    def _views(self) -> List[memoryview]:
+        return [self._offsets, self._blob, self._buf]
+
+    def close(self) -> None:
+        for view in self._views():
+            view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def fingerprint(self) -> int:
+        """CRC-32 of the word table; identifies the word list for derived caches."""
+        return zlib.crc32(self._blob, zlib.crc32(self._offsets))
+
+    # Queries
+    def __len__(self) -> int:
+        return self.meta["count"]
+
+    def word(self, word_id: int) -> str:
+        off = self._offsets
+        return str(self._blob[off[word_id]:off[word_id + 1]], "ascii")
+
+    def entry(self, word_id: int) -> Entry:
+        d, c, _, _, _ = self.groups[bisect.bisect_right(self._group_starts, word_id) - 1]
+        return d, c, self.word(word_id)
+
+    def find(self, difficulty: str, category: str, word: str) -> Optional[int]:
+        """Return the id of an entry, or None if it is not in the corpus."""
+        lo, n = self._group_index.get((difficulty, category, len(word)), (0, 0))
+        hi = lo + n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word(mid) < word:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if n and lo < len(self) and self.word(lo) == word else None
+
+    def difficulties(self) -> List[str]:
+        return list(self._categories)
+
+    def categories(self, difficulty: str) -> List[str]:
+        return list(self._categories[difficulty])
+
+    def ids(self, difficulty: str, category: Optional[str] = None, length: Optional[int] = None) -> List[range]:
+        """Word id ranges matching the filters (ranges, not materialised ids)."""
+        return [
+            range(start, start + n)
+            for d, c, l, start, n in self.groups
+            if d == difficulty and (category is None or c == category) and (length is None or l == length)
+        ]
+
+    def pick(self, difficulty: str) -> Tuple[str, str]:
+        """Return (category, word): a uniform category, then a uniform word in it."""
+        cats = self._categories[difficulty]
+        category = cats[random.randrange(len(cats))]
+        start, n = self._ranges[(difficulty, category)]
+        return category, self.word(start + random.randrange(n))
+
+    def sample(self, difficulty: str, category: Optional[str] = None, length: Optional[int] = None) -> int:
+        """Return a uniformly random word id matching the filters."""
+        key = (difficulty, category, length)
+        sel = self._selections.get(key)
+        if sel is None:
+            ranges = self.ids(difficulty, category, length)
+            if not ranges:
+                raise KeyError(key)
+            sel = ([r.start for r in ranges], list(itertools.accumulate(len(r) for r in ranges)))
+            self._selections[key] = sel
+        starts, cumulative = sel
+        k = random.randrange(cumulative[-1])
+        g = bisect.bisect_right(cumulative, k)
+        return starts[g] + k - (cumulative[g - 1] if g else 0)
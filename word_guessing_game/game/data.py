@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import random
+import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from .corpus import Corpus
 
 # Base directories
 PACKAGE_ROOT = Path(__file__).resolve().parents[1]
@@ -14,10 +16,18 @@ _PREF_HANGMAN = ASSETS_DIR / "hangman_images"
 _LEGACY_MOUSE = ASSETS_DIR / "mouse_images"
 HANGMAN_DIR = _PREF_HANGMAN if _PREF_HANGMAN.exists() else _LEGACY_MOUSE
 SOUNDS_DIR = ASSETS_DIR / "sounds"
+# Per-user cache for derived data (word hardness, ...)
+CACHE_DIR = Path(os.environ.get("WORD_GUESSING_GAME_CACHE", Path.home() / ".cache" / "word_guessing_game"))
+# Saved player state and game sessions (snapshot + guess journal)
+STATE_DIR = Path(os.environ.get("WORD_GUESSING_GAME_STATE", Path.home() / ".local" / "share" / "word_guessing_game"))
 
 # Constants
 ALPHABET: List[str] = [chr(c) for c in range(ord('a'), ord('z') + 1)]
 MAX_WRONG_GUESSES: int = 5
+# Byte budget shared by the decoded and scaled image caches
+IMAGE_CACHE_BUDGET_BYTES: int = 64 * 1024 * 1024
+# Size cap of the on-disk pre-rendered image variants (LRU-pruned)
+VARIANT_CACHE_BYTES: int = 256 * 1024 * 1024
 
 # Hangman image sequence (52 frames, img0.png ... img51.png)
 HANGMAN_IMAGE_FILENAMES: List[str] = [f"img{i}.png" for i in range(52)]
@@ -58,9 +68,36 @@ WORD_LISTS: Dict[str, Dict[str, List[str]]] = {
 }
 
 
+# Optional external word file (see corpus.py for the format) or compiled word
+# pack (*.wgp, see wordpack.py); the built-in WORD_LISTS above are used when
+# it is not set
+_corpus_env = os.environ.get("WORD_GUESSING_GAME_CORPUS")
+CORPUS_PATH: Optional[Path] = Path(_corpus_env) if _corpus_env else None
+
+_corpus: Optional[Corpus] = None
+
+
+def load_corpus() -> Corpus:
+    """Return the shared corpus, compiling or mapping it on first use."""
+    global _corpus
+    if _corpus is None:
+        if CORPUS_PATH and CORPUS_PATH.suffix == ".wgp":
+            from .wordpack import WordPack
+
+            _corpus = WordPack.load(CORPUS_PATH)
+        elif CORPUS_PATH:
+            _corpus = Corpus.open(CORPUS_PATH)
+        else:
+            _corpus = Corpus.from_word_lists(WORD_LISTS)
+    return _corpus
+
+
+def set_corpus(corpus: Optional[Corpus]) -> None:
+    """Replace the shared corpus (None reloads from CORPUS_PATH/WORD_LISTS)."""
+    global _corpus
+    _corpus = corpus
+
+
 def pick_word(difficulty: str) -> tuple[str, str]:
     """Return (category, word) given a difficulty."""
-    categories = list(WORD_LISTS[difficulty].keys())
-    category = random.choice(categories)
-    word = random.choice(WORD_LISTS[difficulty][category])
-    return category, word
+    return load_corpus().pick(difficulty)
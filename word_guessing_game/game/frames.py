@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import tkinter as tk
+
+from PIL import Image, ImageTk
+
+from .image_cache import IMAGE_CACHE, ImageCache
+
+# Hangman frame size at scale 1.0 and the floor used for tiny windows
+HANGMAN_BASE_SIZE: Tuple[int, int] = (600, 250)
+HANGMAN_MIN_SIZE: Tuple[int, int] = (200, 120)
+
+# Scale factors are quantised so nearby window sizes share pre-scaled frames
+SCALE_STEP: float = 0.05
+# Frames ahead of the current one pre-scaled at the current scale
+LOOKAHEAD: int = 4
+# Neighbouring scale buckets (each side) covering the current and next frame
+NEIGHBOUR_BUCKETS: int = 1
+
+_POLL_MS = 15
+_MAX_PHOTOS_PER_TICK = 2
+
+
+def scale_bucket(scale: float) -> int:
+    return max(1, int(round(scale / SCALE_STEP)))
+
+
+def bucket_size(bucket: int) -> Tuple[int, int]:
+    s = bucket * SCALE_STEP
+    return (
+        max(HANGMAN_MIN_SIZE[0], int(HANGMAN_BASE_SIZE[0] * s)),
+        max(HANGMAN_MIN_SIZE[1], int(HANGMAN_BASE_SIZE[1] * s)),
+    )
+
+
+def hangman_size(scale: float) -> Tuple[int, int]:
+    """Size of a hangman frame for a window scale factor."""
+    return bucket_size(scale_bucket(scale))
+
+
+class FramePyramid:
+    """Hangman frames pre-scaled off the Tk thread.
+
+    ``request`` retargets the pyramid to the shown frame and window scale; a
+    daemon worker decodes (via the shared image cache) and resizes the frames
+    around it, and finished bitmaps are turned into PhotoImages on the Tk
+    thread by an ``after()`` poll. ``photo`` never blocks: it returns None
+    until the frame is ready.
+    """
+
+    def __init__(self, paths: Sequence[Path], cache: ImageCache = IMAGE_CACHE) -> None:
+        self.paths: List[Path] = list(paths)
+        self._cache = cache
+        self._root: Optional[tk.Misc] = None
+        self._photos: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
+        self._wanted: Set[Tuple[int, int]] = set()
+        self._queued: Set[Tuple[int, int]] = set()
+        self._target: Optional[Tuple[int, int]] = None
+        self._jobs: "queue.Queue[Optional[Tuple[int, int]]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[int, int, Optional[Image.Image]]]" = queue.Queue()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._poll_job: Optional[str] = None
+
+    # Tk-thread API
+    def attach(self, root: tk.Misc) -> None:
+        self.detach()
+        self._root = root
+
+    def detach(self) -> None:
+        if self._root is not None and self._poll_job:
+            try:
+                self._root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+        self._root = None
+        self._poll_job = None
+        self._photos.clear()
+        self._wanted = set()
+        self._queued.clear()
+        self._target = None
+
+    def request(self, index: int, scale: float) -> None:
+        bucket = scale_bucket(scale)
+        if self._target == (index, bucket):
+            return
+        self._target = (index, bucket)
+
+        wanted: List[Tuple[int, int]] = [(index, bucket), (index + 1, bucket)]
+        for d in range(1, NEIGHBOUR_BUCKETS + 1):
+            for b in (bucket - d, bucket + d):
+                if b >= 1:
+                    wanted += [(index, b), (index + 1, b)]
+        wanted += [(index + i, bucket) for i in range(2, LOOKAHEAD + 1)]
+        wanted = [k for k in wanted if 0 <= k[0] < len(self.paths)]
+
+        # Rebinding the set is atomic; the worker skips jobs no longer wanted
+        self._wanted = set(wanted)
+        for key in [k for k in self._photos if k not in self._wanted]:
+            del self._photos[key]
+        self._queued &= self._wanted
+        for key in wanted:
+            if key in self._photos or key in self._queued:
+                continue
+            self._queued.add(key)
+            with self._lock:
+                self._in_flight += 1
+            self._jobs.put(key)
+        self._ensure_worker()
+        self._schedule_poll()
+
+    def photo(self, index: int, scale: float) -> Optional[ImageTk.PhotoImage]:
+        self._drain()
+        return self._photos.get((index, scale_bucket(scale)))
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the worker once the jobs already queued are done."""
+        worker, self._worker = self._worker, None
+        if worker is None or not worker.is_alive():
+            return
+        self._jobs.put(None)
+        worker.join(timeout)
+
+    # Worker thread
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, name="hangman-frames", daemon=True)
+            self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            index, bucket = job
+            img: Optional[Image.Image] = None
+            if (index, bucket) in self._wanted:
+                try:
+                    img = self._cache.resized(self.paths[index], bucket_size(bucket), persist=True)
+                except Exception:
+                    img = None
+            self._results.put((index, bucket, img))
+
+    # Result marshalling (Tk thread)
+    def _schedule_poll(self) -> None:
+        if self._root is None or self._poll_job:
+            return
+        try:
+            self._poll_job = self._root.after(_POLL_MS, self._poll)
+        except tk.TclError:
+            self._root = None
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        self._drain(_MAX_PHOTOS_PER_TICK)
+        with self._lock:
+            busy = self._in_flight > 0
+        if busy:
+            self._schedule_poll()
+
+    def _drain(self, limit: Optional[int] = None) -> None:
+        converted = 0
+        while limit is None or converted < limit:
+            try:
+                index, bucket, img = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._in_flight -= 1
+            key = (index, bucket)
+            self._queued.discard(key)
+            if img is None or self._root is None or key not in self._wanted or key in self._photos:
+                continue
+            try:
+                self._photos[key] = ImageTk.PhotoImage(img, master=self._root)
+                converted += 1
+            except Exception:
+                pass
@@ -1,13 +1,55 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Set, Dict
-
-from .data import MAX_WRONG_GUESSES, pick_word
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Set, Tuple
+
+from .data import ALPHABET, MAX_WRONG_GUESSES, pick_word
+
+_ORD_A = ord("a")
+_NO_POSITIONS: Tuple[int, ...] = ()
+
+
+def letter_index(letter: str) -> int:
+    """Return 0-25 for 'a'-'z', or -1 for anything else."""
+    i = ord(letter) - _ORD_A if len(letter) == 1 else -1
+    return i if 0 <= i < 26 else -1
+
+
+class WordMasks(NamedTuple):
+    letter_mask: int  # bit i set if ALPHABET[i] occurs in the word
+    positions: Tuple[Tuple[int, ...], ...]  # per letter, indices where it occurs
+    position_masks: Tuple[int, ...]  # per letter, bit j set if word[j] is that letter
+    letter_count: int  # positions holding a maskable letter
+
+
+@lru_cache(maxsize=65536)
+def word_masks(word: str) -> WordMasks:
+    """Precompute the letter and position masks for ``word`` (cached)."""
+    positions: List[List[int]] = [[] for _ in range(26)]
+    for j, ch in enumerate(word):
+        i = letter_index(ch)
+        if i >= 0:
+            positions[i].append(j)
+    letter_mask = 0
+    position_masks = [0] * 26
+    for i, ps in enumerate(positions):
+        if ps:
+            letter_mask |= 1 << i
+            for j in ps:
+                position_masks[i] |= 1 << j
+    return WordMasks(
+        letter_mask,
+        tuple(tuple(ps) if ps else _NO_POSITIONS for ps in positions),
+        tuple(position_masks),
+        sum(len(ps) for ps in positions),
+    )
 
 
 @dataclass
 class GuessResult:
+    __slots__ = ("status", "positions", "complete", "game_over")
+
     status: str  # 'correct' | 'wrong' | 'repeat'
     positions: List[int]
     complete: bool
@@ -15,13 +57,68 @@ class GuessResult:
 
 
 class GameLogic:
-    def __init__(self, difficulty: str) -> None:
+    __slots__ = (
+        "difficulty",
+        "category",
+        "word",
+        "gameboard",
+        "guessed_letters",
+        "guessed_mask",
+        "wrong_guesses",
+        "max_wrong",
+        "picker",
+        "_masks",
+        "_remaining",
+    )
+
+    def __init__(self, difficulty: str, picker: Optional[Callable[[str], Tuple[str, str]]] = None) -> None:
         self.difficulty = difficulty
-        self.category, self.word = pick_word(difficulty)
-        self.gameboard: List[str] = ["_"] * len(self.word)
+        self.max_wrong: int = MAX_WRONG_GUESSES
+        # picker(difficulty) -> (category, word); pick_word unless a sampler is given
+        self.picker = picker or pick_word
+        self._start(*self.picker(difficulty))
+
+    @classmethod
+    def from_word(cls, difficulty: str, category: str, word: str) -> "GameLogic":
+        """Start a game on a given word instead of a random pick."""
+        logic = cls.__new__(cls)
+        logic.difficulty = difficulty
+        logic.max_wrong = MAX_WRONG_GUESSES
+        logic.picker = pick_word
+        logic._start(category, word)
+        return logic
+
+    @classmethod
+    def restore(cls, difficulty: str, category: str, word: str, guessed_mask: int, wrong_guesses: int) -> "GameLogic":
+        """Rebuild a game mid-round from its guessed-letter mask and wrong count."""
+        logic = cls.from_word(difficulty, category, word)
+        masks = logic._masks
+        board = logic.gameboard
+        logic.guessed_letters.update(ALPHABET[i] for i in range(26) if guessed_mask >> i & 1)
+        hits = guessed_mask & masks.letter_mask
+        while hits:
+            low = hits & -hits
+            i = low.bit_length() - 1
+            positions = masks.positions[i]
+            for j in positions:
+                board[j] = ALPHABET[i]
+            logic._remaining -= len(positions)
+            hits ^= low
+        logic.guessed_mask = guessed_mask
+        logic.wrong_guesses = wrong_guesses
+        return logic
+
+    def _start(self, category: str, word: str) -> None:
+        self.category = category
+        self.word = word
+        self.gameboard: List[str] = ["_"] * len(word)
         self.guessed_letters: Set[str] = set()
+        # Bit i mirrors ALPHABET[i] in guessed_letters, for callers that test many letters
+        self.guessed_mask: int = 0
         self.wrong_guesses: int = 0
-        self.max_wrong: int = MAX_WRONG_GUESSES
+        self._masks = word_masks(word)
+        # Blank board cells; a word is complete only once every cell is revealed
+        self._remaining: int = len(word)
 
     # Presentation helpers
     @property
@@ -43,35 +140,49 @@ class GameLogic:
         return f"Lives({self.max_wrong}): " + "x " * self.wrong_guesses
 
     def is_complete(self) -> bool:
-        return "_" not in self.gameboard
+        return self._remaining == 0
 
     def is_game_over(self) -> bool:
         return self.wrong_guesses >= self.max_wrong
 
     def guess(self, letter: str) -> GuessResult:
         letter = letter.lower()
-        if not (len(letter) == 1 and letter.isalpha()):
-            return GuessResult(status="wrong", positions=[], complete=self.is_complete(), game_over=self.is_game_over())
-
-        if letter in self.guessed_letters or letter in self.gameboard:
-            return GuessResult(status="repeat", positions=[], complete=self.is_complete(), game_over=self.is_game_over())
-
+        i = letter_index(letter)
+        if i < 0:
+            if len(letter) == 1 and letter.isalpha():
+                return self._guess_other(letter)
+            return GuessResult("wrong", [], self._remaining == 0, self.wrong_guesses >= self.max_wrong)
+
+        if letter in self.guessed_letters:
+            return GuessResult("repeat", [], self._remaining == 0, self.wrong_guesses >= self.max_wrong)
         self.guessed_letters.add(letter)
-
-        positions: List[int] = []
-        for i, ch in enumerate(self.word):
-            if ch == letter:
-                positions.append(i)
-                self.gameboard[i] = letter
-
+        bit = 1 << i
+        self.guessed_mask |= bit
+
+        if self._masks.letter_mask & bit:
+            positions = self._masks.positions[i]
+            board = self.gameboard
+            for j in positions:
+                board[j] = letter
+            self._remaining -= len(positions)
+            return GuessResult("correct", list(positions), self._remaining == 0, self.wrong_guesses >= self.max_wrong)
+
+        self.wrong_guesses += 1
+        return GuessResult("wrong", [], self._remaining == 0, self.wrong_guesses >= self.max_wrong)
+
+    def _guess_other(self, letter: str) -> GuessResult:
+        # Letters outside a-z have no mask bit; scan the word as before
+        if letter in self.guessed_letters:
+            return GuessResult("repeat", [], self._remaining == 0, self.wrong_guesses >= self.max_wrong)
+        self.guessed_letters.add(letter)
+        positions = [j for j, ch in enumerate(self.word) if ch == letter]
         if positions:
-            return GuessResult(status="correct", positions=positions, complete=self.is_complete(), game_over=self.is_game_over())
-        else:
-            self.wrong_guesses += 1
-            return GuessResult(status="wrong", positions=[], complete=self.is_complete(), game_over=self.is_game_over())
+            for j in positions:
+                self.gameboard[j] = letter
+            self._remaining -= len(positions)
+            return GuessResult("correct", positions, self._remaining == 0, self.wrong_guesses >= self.max_wrong)
+        self.wrong_guesses += 1
+        return GuessResult("wrong", [], self._remaining == 0, self.wrong_guesses >= self.max_wrong)
 
     def reset(self) -> None:
-        self.category, self.word = pick_word(self.difficulty)
-        self.gameboard = ["_"] * len(self.word)
-        self.guessed_letters.clear()
-        self.wrong_guesses = 0
+        self._start(*self.picker(self.difficulty))
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import string
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox, ttk
 
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageTk
 
 from .data import (
     ALPHABET,
@@ -18,24 +20,33 @@ from .data import (
     SOUNDS_DIR,
     initial_hangman_index,
 )
-from .game_logic import GameLogic
+from .animation import FrameAnimator
+from .frames import FramePyramid, hangman_size
+from .game_logic import GameLogic, word_masks
+from .image_cache import IMAGE_CACHE
+from .image_pipeline import ResizePipeline
+from .layout import LayoutEngine
+from .metrics import GUESS_SECONDS, LAYOUT_SECONDS, PICK_WORD_SECONDS, timed
 from .sounds import SoundManager
 
+if TYPE_CHECKING:
+    # Saved games, the word stream, recording and the solver are imported
+    # where first used, after the first frame
+    from .persistence import SessionStore
+    from .replay import GuessRecorder
+    from .scheduler import PlayerState, ShuffleScheduler
+    from .solver import Solver
+
 
 def _load_image(path: Path, size: Optional[tuple[int, int]] = None, master: Optional[tk.Misc] = None) -> Optional[ImageTk.PhotoImage]:
-    if not path.exists():
-        return None
-    try:
-        with Image.open(path) as im:
-            img = im.copy()
-        if size:
-            img = img.resize(size)
-        return ImageTk.PhotoImage(img, master=master)
-    except Exception:
-        return None
+    # Decoded and scaled images are cached; repeated sizes never touch the decoder
+    return IMAGE_CACHE.photo(path, size, master)
 
 
 def _placeholder(size: tuple[int, int], text: str) -> ImageTk.PhotoImage:
+    # Only needed when an asset is missing; keep these modules off the startup path
+    from PIL import ImageDraw, ImageFont
+
     img = Image.new("RGB", size, color=(30, 30, 30))
     d = ImageDraw.Draw(img)
     try:
@@ -47,27 +58,76 @@ def _placeholder(size: tuple[int, int], text: str) -> ImageTk.PhotoImage:
     return ImageTk.PhotoImage(img)
 
 
+def _set_image(widget: tk.Misc, img: ImageTk.PhotoImage) -> None:
+    try:
+        widget.configure(image=img)
+        widget.image = img
+    except tk.TclError:
+        pass  # widget destroyed while the image was being scaled
+
+
+# Session key of the window's round in the session store
+_GUI_SESSION = 0
+
+
 class GameGUI:
     def __init__(self) -> None:
         self.selected_difficulty: Optional[str] = None
-        self.difficulty_root: Optional[tk.Tk] = None
-        self.game_root: Optional[tk.Tk] = None
+        # One Tk root per session; screens are cached frames swapped inside it
+        self.root: Optional[tk.Tk] = None
+        self.difficulty_screen: Optional[tk.Frame] = None
+        self.game_screen: Optional[tk.Frame] = None
+        self._screen: Optional[tk.Frame] = None
 
+        # Audio loads in the background once the first window has painted
         self.sound_manager = SoundManager(SOUNDS_DIR)
+        self.on_first_frame: Optional[Callable[[], None]] = None
+        self._first_frame_shown = False
+        # Called each time a round's game screen is shown
+        self.on_round_start: Optional[Callable[[], None]] = None
+        # Optional guess recorder (see replay.py)
+        self.recorder: Optional[GuessRecorder] = None
 
         # Game window state
         self.logic: Optional[GameLogic] = None
+        # Words come from a per-player shuffle so rounds don't repeat words,
+        # resumed from the last launch (loaded with the first round)
+        self.player_state: Optional[PlayerState] = None
+        self._word_scheduler: Optional[ShuffleScheduler] = None
         self.hangman_images: List[Path] = [HANGMAN_DIR / f for f in HANGMAN_IMAGE_FILENAMES]
+        self.hangman_frames = FramePyramid(self.hangman_images)
+        # Correct guesses animate through the frames in between
+        self.hangman_animator = FrameAnimator(lambda index, final: self._show_hangman_frame(index, final))
+        # Background and button rescales run on worker threads
+        self.images = ResizePipeline()
         self.hangman_index: int = 0
+        self.hint_label: Optional[tk.Label] = None
         self.hangman_label: Optional[tk.Label] = None
         self.board_label: Optional[tk.Label] = None
         self.guesses_label: Optional[tk.Label] = None
         self.lives_label: Optional[tk.Label] = None
         self.buttons: Dict[str, tk.Button] = {}
+        self.suggest_button: Optional[tk.Button] = None
+        self.solver: Optional[Solver] = None
+        self._suggested: Optional[str] = None
+        self._suggested_bg: str = ""
+        # The current round is journaled so a crash or close can resume it
+        self.saved_sessions: Optional[SessionStore] = None
+        self._save_job: Optional[str] = None
 
         # Base design size for responsive scaling
         self.BASE_W: int = 950
         self.BASE_H: int = 630
+        # Letter grid: 5 rows up to 26 letters, like original placements
+        self._alpha_base: Dict[str, int] = {
+            "x0": 150,
+            "y0": 370,
+            "col_w": 100,
+            "row_h": 50,
+            "btn_w": 100,
+            "btn_h": 50,
+            "per_row": 6,
+        }
 
         # Difficulty window assets and widgets for responsive layout
         self._diff_bg_path: Optional[Path] = None
@@ -77,19 +137,115 @@ class GameGUI:
         self._diff_btn_widgets: Dict[str, ttk.Button] = {}
         self._diff_layout_job: Optional[str] = None
         self._game_layout_job: Optional[str] = None
+        self._layout = LayoutEngine()
 
     def start(self) -> None:
-        self._show_difficulty_window()
+        try:
+            self._create_root()
+            # An unfinished round is resumed once this has painted
+            self._show_difficulty_window()
+            # The only mainloop: rounds swap screens instead of windows
+            if self.root:
+                self.root.mainloop()
+        finally:
+            self._destroy_root()
+            self.hangman_frames.close()
+            self.sound_manager.close()
+            if self.saved_sessions:
+                self.saved_sessions.close()
+            if self.recorder:
+                self.recorder.close()
+
+    def _create_root(self) -> tk.Tk:
+        if self.root is None:
+            self.root = tk.Tk()
+            self.root.title("Word Guessing Game")
+            self.root.resizable(True, True)
+            self.hangman_frames.attach(self.root)
+            self.images.attach(self.root)
+            self.hangman_animator.attach(self.root)
+            if not self._first_frame_shown:
+                self.root.bind("<Map>", self._on_first_map, add="+")
+        return self.root
+
+    def _destroy_root(self) -> None:
+        if self.root is None:
+            return
+        self.hangman_frames.detach()
+        self.images.detach()
+        self.hangman_animator.detach()
+        IMAGE_CACHE.discard_master(self.root)
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass  # already closed by the window manager
+        self.root = self.difficulty_screen = self.game_screen = self._screen = None
+        self._layout = LayoutEngine()
+
+    def _show_screen(self, screen: tk.Frame) -> None:
+        if self._screen is screen:
+            return
+        if self._screen is not None:
+            self._screen.place_forget()
+        screen.place(x=0, y=0, relwidth=1, relheight=1)
+        self._screen = screen
+
+    def _resume_saved_round(self) -> None:
+        resumed = self._open_saved_sessions()
+        if resumed and self.root and self.logic is None:
+            self._show_game_window(resumed.difficulty, resumed)
+
+    def _open_saved_sessions(self) -> Optional[GameLogic]:
+        """Open the session store; return an unfinished round to resume, if any."""
+        from .persistence import SessionStore
+
+        try:
+            self.saved_sessions = SessionStore()
+            logic = self.saved_sessions.open().get(_GUI_SESSION)
+        except Exception as e:
+            print(f"Saved games unavailable: {e}")
+            self.saved_sessions = None
+            return None
+        if logic and not (logic.is_complete() or logic.is_game_over()):
+            return logic
+        return None
+
+    def _save_soon(self) -> None:
+        from .persistence import SYNC_INTERVAL_S
+
+        # Batch journal writes: one fsync per interval rather than per click
+        if self._save_job is None and self.root:
+            self._save_job = self.root.after(int(SYNC_INTERVAL_S * 1000), self._save_now)
+
+    def _save_now(self) -> None:
+        self._save_job = None
+        if self.saved_sessions:
+            try:
+                self.saved_sessions.flush()
+            except Exception as e:
+                print(f"Failed to save game: {e}")
+
+    def _save_player_state(self) -> None:
+        from .persistence import save_player_state
+
+        try:
+            save_player_state(self.player_state)
+        except OSError as e:
+            print(f"Failed to save word order: {e}")
 
     # Difficulty window
     def _show_difficulty_window(self) -> None:
-        self.difficulty_root = tk.Tk()
-        self.difficulty_root.title("Word Guessing Game")
-        self.difficulty_root.geometry("850x630")
+        if self.difficulty_screen is None:
+            self._build_difficulty_screen()
+            self.root.geometry("850x630")
+        self._show_screen(self.difficulty_screen)
 
-        bg = _load_image(BACKGROUNDS_DIR / "background_image.png")
+    def _build_difficulty_screen(self) -> None:
+        screen = self.difficulty_screen = tk.Frame(self._create_root())
+
+        bg = _load_image(BACKGROUNDS_DIR / "background_image.png", master=self.root)
         if bg:
-            label = tk.Label(self.difficulty_root, image=bg)
+            label = tk.Label(screen, image=bg)
             label.image = bg
             label.place(relwidth=1, relheight=1)
 
@@ -98,27 +254,27 @@ class GameGUI:
         y_intermediate = 320
         y_advanced = 390
 
-        beginner_img = _load_image(BUTTONS_DIR / "beginner_image.png")
-        intermediate_img = _load_image(BUTTONS_DIR / "intermediate_image.png")
-        advanced_img = _load_image(BUTTONS_DIR / "advanced_image.png")
-        play_img = _load_image(BUTTONS_DIR / "play_image.png")
+        beginner_img = _load_image(BUTTONS_DIR / "beginner_image.png", master=self.root)
+        intermediate_img = _load_image(BUTTONS_DIR / "intermediate_image.png", master=self.root)
+        advanced_img = _load_image(BUTTONS_DIR / "advanced_image.png", master=self.root)
+        play_img = _load_image(BUTTONS_DIR / "play_image.png", master=self.root)
 
         beginner_btn = ttk.Button(
-            self.difficulty_root,
+            screen,
             command=lambda: self._set_selected_difficulty("Beginner"),
             image=beginner_img,
             compound=tk.LEFT,
         )
         beginner_btn.image = beginner_img
         intermediate_btn = ttk.Button(
-            self.difficulty_root,
+            screen,
             command=lambda: self._set_selected_difficulty("Intermediate"),
             image=intermediate_img,
             compound=tk.LEFT,
         )
         intermediate_btn.image = intermediate_img
         advanced_btn = ttk.Button(
-            self.difficulty_root,
+            screen,
             command=lambda: self._set_selected_difficulty("Advanced"),
             image=advanced_img,
             compound=tk.LEFT,
@@ -130,7 +286,7 @@ class GameGUI:
         advanced_btn.place(x=x_position, y=y_advanced)
 
         play_btn = ttk.Button(
-            self.difficulty_root,
+            screen,
             command=self._start_game,
             image=play_img,
             compound=tk.LEFT,
@@ -138,7 +294,18 @@ class GameGUI:
         play_btn.image = play_img
         play_btn.place(x=525, y=y_advanced + 70)
 
-        self.difficulty_root.mainloop()
+    def _on_first_map(self, event) -> None:
+        if self._first_frame_shown or not self.root or event.widget is not self.root:
+            return
+        self._first_frame_shown = True
+        # Idle callbacks queued after <Map> run once the initial redraw is done
+        self.root.after_idle(self._after_first_frame)
+
+    def _after_first_frame(self) -> None:
+        if self.on_first_frame:
+            self.on_first_frame()
+        self._resume_saved_round()
+        self.sound_manager.preload()
 
     def _set_selected_difficulty(self, difficulty: str) -> None:
         self.selected_difficulty = difficulty
@@ -148,75 +315,122 @@ class GameGUI:
         if not self.selected_difficulty:
             messagebox.showinfo("Select Difficulty", "Please select a difficulty first.")
             return
-
-        if self.difficulty_root:
-            self.difficulty_root.destroy()
-            self.difficulty_root = None
-
         self._show_game_window(self.selected_difficulty)
 
-    def _show_game_window(self, difficulty: str) -> None:
-        self.game_root = tk.Tk()
-        self.game_root.title("Word Guessing Game")
-        self.game_root.geometry(f"{self.BASE_W}x{self.BASE_H}")
-        self.game_root.resizable(True, True)
+    def _build_game_screen(self) -> None:
+        """Create the game screen's widgets once; rounds only reconfigure them."""
+        root = self._create_root()
+        screen = self.game_screen = tk.Frame(root)
+        fonts = self._create_game_fonts(root)
+        hint_font, board_font, meta_font = fonts["hint"], fonts["board"], fonts["meta"]
 
         # Background
         self._game_bg_path: Path = BACKGROUNDS_DIR / "background_image.png"
-        bg = _load_image(self._game_bg_path, master=self.game_root)
+        bg = _load_image(self._game_bg_path, master=root)
         if bg:
-            self._game_bg_label = tk.Label(self.game_root, image=bg)
+            self._game_bg_label = tk.Label(screen, image=bg)
             self._game_bg_label.image = bg
             self._game_bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 
-        self.logic = GameLogic(difficulty)
-
-        self.hint_label = tk.Label(self.game_root, text=self.logic.hint_text, font=("Verdana", 12, "bold"))
+        self.hint_label = tk.Label(screen, font=hint_font)
         self.hint_label.pack(side="top")
 
         # Hangman image
-        self.hangman_index = initial_hangman_index(len(self.logic.word))
-        img = self._current_hangman_photo()
-        self.hangman_label = tk.Label(self.game_root, image=img)
-        self.hangman_label.image = img
+        self.hangman_label = tk.Label(screen)
         self.hangman_label.pack(pady=(5, 5))
 
         # Board + meta
-        # Match legacy: board label displays the raw list representation
-        self.board_label = tk.Label(self.game_root, text=self._legacy_board_text(), font=("Verdana", 30, "bold"))
+        self.board_label = tk.Label(screen, font=board_font)
         self.board_label.pack(side="top")
-
-        # Match legacy: guesses shown as a Python list-like string with 'Guesses:' prefix
-        self.guesses_label = tk.Label(self.game_root, text=self._legacy_guesses_text(), font=("Verdana", 10, "bold"))
+        self.guesses_label = tk.Label(screen, font=meta_font)
         self.guesses_label.place(x=100, y=300)
-
-        # Match legacy: lives shown as ['Lives(5):', 'x', ...]
-        self.lives_label = tk.Label(self.game_root, text=self._legacy_lives_text(), font=("Verdana", 10, "bold"))
+        self.lives_label = tk.Label(screen, font=meta_font)
         self.lives_label.place(x=100, y=330)
 
+        # Solver-backed hint: highlights the best next letter
+        self.suggest_button = tk.Button(screen, text="Suggest a letter", font=meta_font, command=self._on_suggest)
+        self.suggest_button.place(x=700, y=300)
+
         # Alphabet buttons grid similar to original layout
         self.buttons = {}
         self._populate_alpha_buttons()
 
-        # Initial responsive layout and bindings
+        screen.bind("<Configure>", self._on_game_configure)
+        root.geometry(f"{self.BASE_W}x{self.BASE_H}")
+
+    def _create_game_fonts(self, root: tk.Tk) -> Dict[str, tkfont.Font]:
+        # Shared fonts: one configure() resizes every widget using them
+        self._layout.font(root, "hint", "Verdana", 12, "bold")
+        self._layout.font(root, "board", "Verdana", 30, "bold")
+        self._layout.font(root, "meta", "Verdana", 10, "bold")
+        self._layout.font(root, "letters", "Pacifico", 16)
+        return self._layout.fonts
+
+    def _show_game_window(self, difficulty: str, logic: Optional[GameLogic] = None) -> None:
+        if self.game_screen is None:
+            self._build_game_screen()
+
+        if self._word_scheduler is None:
+            from .persistence import load_player_state
+            from .scheduler import PlayerState, ShuffleScheduler
+
+            self._word_scheduler = ShuffleScheduler()
+            self.player_state = load_player_state() or PlayerState.new()
+        picker = timed(PICK_WORD_SECONDS, self._word_scheduler.picker(self.player_state))
+        if logic is None:
+            logic = GameLogic(difficulty, picker=picker)
+            self._save_player_state()
+            if self.saved_sessions:
+                self.saved_sessions.record_new(_GUI_SESSION, logic)
+                self._save_soon()
+        else:
+            logic.picker = picker
+        self.logic = logic
+        if self.recorder:
+            self.recorder.start_round(logic)
+
+        self._set_text("hint", self.logic.hint_text)
+        self._refresh_texts()
+
+        self._clear_suggestion()
+        guessed = self.logic.guessed_letters
+        for letter in ALPHABET:
+            self._set_letter_enabled(letter, letter not in guessed)
+
+        self.hangman_index = initial_hangman_index(len(self.logic.word))
+        # A resumed round has already advanced once per correct letter
+        correct = bin(self.logic.guessed_mask & word_masks(self.logic.word).letter_mask).count("1")
+        self.hangman_index = min(self.hangman_index + correct, len(self.hangman_images) - 1)
+        self.hangman_animator.jump(self.hangman_index)
+
+        self._show_screen(self.game_screen)
         self._layout_game_window()
-        self.game_root.bind("<Configure>", self._on_game_configure)
 
-        self.game_root.mainloop()
+        if self.on_round_start:
+            self.on_round_start()
 
-    def _current_hangman_photo(self) -> ImageTk.PhotoImage:
+    def _hangman_scale(self) -> float:
         # Scale hangman image relative to window size
-        size = (600, 250)
-        if self.game_root:
+        if self.root:
             try:
-                w = max(self.game_root.winfo_width(), 1)
-                h = max(self.game_root.winfo_height(), 1)
-                s = min(w / self.BASE_W, h / self.BASE_H)
-                size = (max(200, int(600 * s)), max(120, int(250 * s)))
+                w = max(self.root.winfo_width(), 1)
+                h = max(self.root.winfo_height(), 1)
+                return min(w / self.BASE_W, h / self.BASE_H)
             except Exception:
                 pass
-        if 0 <= self.hangman_index < len(self.hangman_images):
-            img = _load_image(self.hangman_images[self.hangman_index], size=size, master=self.game_root)
+        return 1.0
+
+    def _current_hangman_photo(self, index: Optional[int] = None) -> ImageTk.PhotoImage:
+        index = self.hangman_index if index is None else index
+        s = self._hangman_scale()
+        size = hangman_size(s)
+        if 0 <= index < len(self.hangman_images):
+            # Pre-scaled frames come from the pyramid worker; fall back to a
+            # synchronous (cached) load only until the first one is ready
+            self.hangman_frames.request(index, s)
+            img = self.hangman_frames.photo(index, s)
+            if img is None:
+                img = _load_image(self.hangman_images[index], size=size, master=self.root)
             if img is not None:
                 return img
         return _placeholder(size, "Hangman")
@@ -224,30 +438,77 @@ class GameGUI:
     def _advance_hangman(self) -> None:
         if self.hangman_index < len(self.hangman_images) - 1:
             self.hangman_index += 1
-            if self.hangman_label:
-                img = self._current_hangman_photo()
-                self.hangman_label.configure(image=img)
-                self.hangman_label.image = img
+            # Played by the animator; rapid guesses extend the current run
+            self.hangman_animator.animate_to(self.hangman_index)
+
+    def _show_hangman_frame(self, index: int, final: bool) -> bool:
+        """Animator callback: show a pre-scaled frame, or drop it if not ready yet."""
+        s = self._hangman_scale()
+        self.hangman_frames.request(index, s)
+        img = self.hangman_frames.photo(index, s)
+        if img is None:
+            if not final:
+                return False
+            img = self._current_hangman_photo(index)
+        self._set_hangman_image(img)
+        return True
+
+    # Rendering hooks: the widget UI below, overridden by CanvasGameGUI
+    def _set_text(self, name: str, text: str) -> None:
+        label = getattr(self, f"{name}_label", None)
+        if label:
+            label.configure(text=text)
+
+    def _refresh_texts(self) -> None:
+        # Match legacy: board label displays the raw list representation,
+        # guesses and lives are list-like strings
+        self._set_text("board", self._legacy_board_text())
+        self._set_text("guesses", self._legacy_guesses_text())
+        self._set_text("lives", self._legacy_lives_text())
+
+    def _show_hangman(self) -> None:
+        # Redraw the frame on screen (mid-animation, not necessarily the target)
+        self._set_hangman_image(self._current_hangman_photo(self.hangman_animator.shown))
+
+    def _set_hangman_image(self, img: ImageTk.PhotoImage) -> None:
+        if self.hangman_label:
+            _set_image(self.hangman_label, img)
 
-    def _populate_alpha_buttons(self) -> None:
-        # Layout: 5 rows up to 26 letters, like original placements
-        self._alpha_base = {
-            "x0": 150,
-            "y0": 370,
-            "col_w": 100,
-            "row_h": 50,
-            "btn_w": 100,
-            "btn_h": 50,
-            "per_row": 6,
-        }
+    def _set_game_background(self, img: ImageTk.PhotoImage) -> None:
+        label = getattr(self, "_game_bg_label", None)
+        if label is not None:
+            _set_image(label, img)
+
+    def _set_letter_enabled(self, letter: str, enabled: bool) -> None:
+        btn = self.buttons.get(letter)
+        if btn:
+            btn.configure(state=tk.NORMAL if enabled else tk.DISABLED)
+
+    def _letter_enabled(self, letter: str) -> bool:
+        btn = self.buttons.get(letter)
+        return bool(btn) and str(btn.cget("state")) != tk.DISABLED
+
+    def _set_letter_highlight(self, letter: str, on: bool) -> None:
+        btn = self.buttons.get(letter)
+        if not btn:
+            return
+        try:
+            if on:
+                self._suggested_bg = btn.cget("bg")
+                btn.configure(bg="#ffd54f")
+            else:
+                btn.configure(bg=self._suggested_bg)
+        except Exception:
+            pass
 
+    def _populate_alpha_buttons(self) -> None:
         row_breaks = {6, 12, 18, 24}
         c = 0
         for letter in ALPHABET:
             btn = tk.Button(
-                self.game_root,
+                self.game_screen,
                 text=letter.upper(),
-                font=("Pacifico", 16),
+                font=self._layout.fonts["letters"],
                 command=lambda l=letter: self._on_letter(l),
             )
             # Initially place at base; will be repositioned on resize
@@ -261,16 +522,22 @@ class GameGUI:
     def _on_letter(self, letter: str) -> None:
         if not self.logic:
             return
-        btn = self.buttons.get(letter)
-        if btn:
-            btn.configure(state=tk.DISABLED)
+        self._clear_suggestion()
+        self._set_letter_enabled(letter, False)
 
+        t = time.perf_counter()
         result = self.logic.guess(letter)
+        GUESS_SECONDS.observe(time.perf_counter() - t)
+        if self.recorder:
+            self.recorder.record(letter, result)
+        if self.saved_sessions:
+            self.saved_sessions.record_guess(_GUI_SESSION, letter)
+            if result.complete or result.game_over:
+                self.saved_sessions.record_end(_GUI_SESSION)
+            self._save_soon()
 
         # Update UI texts (legacy-style formatting)
-        self.board_label.configure(text=self._legacy_board_text())
-        self.guesses_label.configure(text=self._legacy_guesses_text())
-        self.lives_label.configure(text=self._legacy_lives_text())
+        self._refresh_texts()
 
         # Sounds + image animation
         if result.status == "correct":
@@ -282,57 +549,74 @@ class GameGUI:
         # End state checks
         if result.complete:
             self.sound_manager.play_win()
-            again = messagebox.askyesno("Congrats!", "You won! Play again?")
+            again = self._ask_play_again("Congrats!", "You won! Play again?")
             self._handle_restart(again)
             return
         if result.game_over:
             self.sound_manager.play_game_over()
             answer = getattr(self.logic, 'word', '')
-            again = messagebox.askyesno("GAME OVER!", f"GAME OVER: Thanks for playing!\nAnswer:\t{answer}\nPlay again?")
+            again = self._ask_play_again("GAME OVER!", f"GAME OVER: Thanks for playing!\nAnswer:\t{answer}\nPlay again?")
             self._handle_restart(again)
             return
 
+    def _ask_play_again(self, title: str, message: str) -> bool:
+        return messagebox.askyesno(title, message)
+
+    def _on_suggest(self) -> None:
+        if not self.logic:
+            return
+        if self.solver is None:
+            from .solver import Solver
+
+            self.solver = Solver()
+        letter = self.solver.suggest(self.logic)
+        self._clear_suggestion()
+        if letter and self._letter_enabled(letter):
+            self._suggested = letter
+            self._set_letter_highlight(letter, True)
+
+    def _clear_suggestion(self) -> None:
+        if not self._suggested:
+            return
+        letter = self._suggested
+        self._suggested = None
+        self._set_letter_highlight(letter, False)
+
     def _handle_restart(self, again: bool) -> None:
-        if self.game_root:
-            self.game_root.destroy()
-            self.game_root = None
+        if self._save_job is not None:
+            self._save_now()
         if again:
             # Reset selected difficulty to allow a fresh pick, or reuse last
             self.selected_difficulty = None
             self._show_difficulty_window()
-        else:
-            # Exit application
-            pass
+        elif self.root:
+            # Exit application: start() tears the root down once mainloop returns
+            self.root.quit()
 
     # Responsive layout helpers
     def _scale_factor(self, root: tk.Tk) -> float:
         try:
-            w = max(root.winfo_width(), 1)
-            h = max(root.winfo_height(), 1)
-            return max(0.5, min(w / self.BASE_W, h / self.BASE_H))
+            return self._scale_for(max(root.winfo_width(), 1), max(root.winfo_height(), 1))
         except Exception:
             return 1.0
 
+    def _scale_for(self, w: int, h: int) -> float:
+        return max(0.5, min(w / self.BASE_W, h / self.BASE_H))
+
     def _layout_difficulty_window(self) -> None:
-        if not self.difficulty_root:
+        if not self.difficulty_screen:
             return
-        s = self._scale_factor(self.difficulty_root)
-
-        # Background fit to window
-        if self._diff_bg_label and self._diff_bg_path and self.difficulty_root:
-            try:
-                w = max(self.difficulty_root.winfo_width(), 1)
-                h = max(self.difficulty_root.winfo_height(), 1)
-                tkimg = _load_image(self._diff_bg_path, (w, h), master=self.difficulty_root)
-                if tkimg:
-                    self._diff_bg_label.configure(image=tkimg)
-                    self._diff_bg_label.image = tkimg
-            except Exception:
-                pass
+        t = time.perf_counter()
+        s = self._scale_factor(self.root)
 
         # Centered vertical stack layout
-        w = max(self.difficulty_root.winfo_width(), 1)
-        h = max(self.difficulty_root.winfo_height(), 1)
+        w = max(self.root.winfo_width(), 1)
+        h = max(self.root.winfo_height(), 1)
+
+        # Background fit to window (rescaled off the Tk thread)
+        if self._diff_bg_label and self._diff_bg_path:
+            label = self._diff_bg_label
+            self.images.submit("difficulty-background", self._diff_bg_path, (w, h), lambda img: _set_image(label, img))
 
         order = ["beginner", "intermediate", "advanced", "play"]
         gap = max(10, int(70 * s))
@@ -361,112 +645,98 @@ class GameGUI:
             # Scale image each time to stay crisp
             path = self._diff_btn_paths.get(key)
             if path and path.exists():
-                try:
-                    img = _load_image(path, (bw, bh), master=self.difficulty_root)
-                    if img:
-                        btn.configure(image=img)
-                        btn.image = img
-                except Exception:
-                    pass
+                self.images.submit(f"difficulty-{key}", path, (bw, bh), lambda img, btn=btn: _set_image(btn, img))
             btn.place(x=x, y=y, width=bw, height=bh)
             y += bh + gap
+        LAYOUT_SECONDS["difficulty"].observe(time.perf_counter() - t)
+
+    def _alpha_layout(self, s: float) -> Dict[tuple, object]:
+        base = self._alpha_base
+        x0 = int(base["x0"] * s)
+        y0 = int(base["y0"] * s)
+        col_w = int(base["col_w"] * s)
+        row_h = int(base["row_h"] * s)
+        bw = max(50, int(base["btn_w"] * s))
+        bh = max(30, int(base["btn_h"] * s))
+        per_row = base["per_row"]
+        target: Dict[tuple, object] = {("font", "letters"): max(10, int(16 * s))}
+        for i, letter in enumerate(ALPHABET):
+            row, col = divmod(i, per_row)
+            target[("letter", letter)] = (x0 + col * col_w, y0 + row * row_h, bw, bh)
+        return target
+
+    def _game_layout(self, w: int, h: int) -> Dict[tuple, object]:
+        """Target layout of the game window for a window size."""
+        s = self._scale_for(w, h)
+        target: Dict[tuple, object] = {
+            ("background",): (w, h),
+            ("font", "hint"): max(8, int(12 * s)),
+            ("font", "board"): max(16, int(30 * s)),
+            ("font", "meta"): max(8, int(10 * s)),
+            ("place", "guesses_label"): (int(100 * s), int(300 * s)),
+            ("place", "lives_label"): (int(100 * s), int(330 * s)),
+            ("place", "suggest_button"): (int(700 * s), int(300 * s)),
+            # The hangman frame scales with the unclamped factor
+            ("hangman",): hangman_size(min(w / self.BASE_W, h / self.BASE_H)),
+        }
+        target.update(self._alpha_layout(s))
+        return target
+
+    def _apply_layout_item(self, key: tuple, value) -> None:
+        kind = key[0]
+        if kind == "letter":
+            btn = self.buttons.get(key[1])
+            if btn:
+                x, y, bw, bh = value
+                btn.place(x=x, y=y, width=bw, height=bh)
+        elif kind == "font":
+            self._layout.fonts[key[1]].configure(size=value)
+        elif kind == "place":
+            widget = getattr(self, key[1], None)
+            if widget:
+                widget.place(x=value[0], y=value[1])
+        elif kind == "background":
+            # The old image stays up until the worker's rescale arrives
+            self.images.submit("game-background", self._game_bg_path, value, self._set_game_background)
+        elif kind == "hangman":
+            self._show_hangman()
 
     def _layout_alpha_buttons(self) -> None:
-        if not self.game_root:
+        if not self.game_screen:
             return
-        s = self._scale_factor(self.game_root)
-        x0 = int(self._alpha_base["x0"] * s)
-        y0 = int(self._alpha_base["y0"] * s)
-        col_w = int(self._alpha_base["col_w"] * s)
-        row_h = int(self._alpha_base["row_h"] * s)
-        bw = max(50, int(self._alpha_base["btn_w"] * s))
-        bh = max(30, int(self._alpha_base["btn_h"] * s))
-
-        # Place in rows of per_row
-        per_row = self._alpha_base["per_row"]
-        c = 0
-        row = 0
-        col = 0
-        for letter in ALPHABET:
-            btn = self.buttons.get(letter)
-            if not btn:
-                continue
-            if c and c % per_row == 0:
-                row += 1
-                col = 0
-            x = x0 + col * col_w
-            y = y0 + row * row_h
-            btn.place(x=x, y=y, width=bw, height=bh)
-            try:
-                btn.configure(font=("Pacifico", max(10, int(16 * s))))
-            except Exception:
-                pass
-            col += 1
-            c += 1
+        self._layout.apply(self._alpha_layout(self._scale_factor(self.root)), self._apply_layout_item)
 
     def _layout_game_window(self) -> None:
-        if not self.game_root:
+        if not self.game_screen:
             return
-        s = self._scale_factor(self.game_root)
-
-        # Background resize
-        try:
-            w = max(self.game_root.winfo_width(), 1)
-            h = max(self.game_root.winfo_height(), 1)
-            if hasattr(self, "_game_bg_label") and self._game_bg_label is not None:
-                tkimg = _load_image(self._game_bg_path, (w, h), master=self.game_root)
-                if tkimg:
-                    self._game_bg_label.configure(image=tkimg)
-                    self._game_bg_label.image = tkimg
-        except Exception:
-            pass
-
-        # Scale fonts
-        try:
-            self.hint_label.configure(font=("Verdana", max(8, int(12 * s)), "bold"))
-            self.board_label.configure(font=("Verdana", max(16, int(30 * s)), "bold"))
-            self.guesses_label.configure(font=("Verdana", max(8, int(10 * s)), "bold"))
-            self.lives_label.configure(font=("Verdana", max(8, int(10 * s)), "bold"))
-        except Exception:
-            pass
-
-        # Reposition meta labels (keep relative to base)
-        gx = int(100 * s)
-        gy = int(300 * s)
-        lx = int(100 * s)
-        ly = int(330 * s)
-        self.guesses_label.place(x=gx, y=gy)
-        self.lives_label.place(x=lx, y=ly)
-
-        # Resize hangman image
-        if self.hangman_label:
-            img = self._current_hangman_photo()
-            self.hangman_label.configure(image=img)
-            self.hangman_label.image = img
-
-        # Layout alphabet
-        self._layout_alpha_buttons()
+        t = time.perf_counter()
+        # Only entries that differ from the last pass touch Tk
+        w = max(self.root.winfo_width(), 1)
+        h = max(self.root.winfo_height(), 1)
+        self._layout.apply(self._game_layout(w, h), self._apply_layout_item)
+        LAYOUT_SECONDS["game"].observe(time.perf_counter() - t)
 
     # Debounced configure handlers
     def _on_diff_configure(self, event) -> None:
-        if not self.difficulty_root:
+        if not self.difficulty_screen:
             return
         if self._diff_layout_job:
             try:
-                self.difficulty_root.after_cancel(self._diff_layout_job)
+                self.root.after_cancel(self._diff_layout_job)
             except Exception:
                 pass
-        self._diff_layout_job = self.difficulty_root.after(60, self._layout_difficulty_window)
+        self._diff_layout_job = self.root.after(60, self._layout_difficulty_window)
 
     def _on_game_configure(self, event) -> None:
-        if not self.game_root:
+        # Bound on the game screen frame; it tracks the window's size
+        if not self.game_screen or event.widget is not self.game_screen:
             return
         if self._game_layout_job:
             try:
-                self.game_root.after_cancel(self._game_layout_job)
+                self.root.after_cancel(self._game_layout_job)
             except Exception:
                 pass
-        self._game_layout_job = self.game_root.after(60, self._layout_game_window)
+        self._game_layout_job = self.root.after(60, self._layout_game_window)
 
     # Helpers to mimic legacy label text style
     def _legacy_board_text(self) -> str:
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+
+import tkinter as tk
+
+from PIL import Image, ImageTk
+
+from .data import IMAGE_CACHE_BUDGET_BYTES
+from .metrics import LOAD_IMAGE_SECONDS
+from .variant_cache import VARIANT_CACHE, VariantCache
+
+_DECODED = "decoded"
+_SCALED = "scaled"
+
+
+@dataclass
+class CacheStats:
+    decoded_hits: int = 0
+    decoded_misses: int = 0
+    scaled_hits: int = 0
+    scaled_misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+    budget_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.decoded_hits + self.scaled_hits
+
+    @property
+    def misses(self) -> int:
+        return self.decoded_misses + self.scaled_misses
+
+
+def _image_bytes(size: Tuple[int, int], bands: int = 4) -> int:
+    return max(1, size[0]) * max(1, size[1]) * bands
+
+
+class ImageCache:
+    """Two-level LRU cache: decoded PIL images and scaled PhotoImages.
+
+    Decoded images are keyed by (path, mtime) so edited assets are picked up;
+    scaled PhotoImages are keyed by (path, mtime, size, master). Both levels
+    share one byte budget and are evicted least-recently-used first. Behind
+    them, finished bitmaps persist across launches in ``variants``.
+    """
+
+    def __init__(self, budget_bytes: int = IMAGE_CACHE_BUDGET_BYTES, variants: Optional[VariantCache] = None) -> None:
+        self.budget_bytes = budget_bytes
+        self.variants = variants
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats = CacheStats()
+
+    # Public API
+    def decoded(self, path: Path) -> Optional[Image.Image]:
+        """Return the decoded image at ``path``; callers must not mutate it."""
+        return self._decode(path)
+
+    def resized(self, path: Path, size: Tuple[int, int], persist: bool = False) -> Optional[Image.Image]:
+        """Decode ``path`` scaled to ``size``; safe to call off the Tk thread.
+
+        A stored variant is used as is. Otherwise a JPEG not yet in the
+        cache is shrunk by the decoder (``draft``) and large downscales are
+        pre-shrunk with ``reduce`` before resampling. With ``persist`` the
+        result is also stored as a variant for the next launch; pass it only
+        for quantised sizes (hangman scale buckets, warm window sizes), since
+        every size passed through while dragging a window would otherwise
+        be written to disk.
+        """
+        if self.variants is not None:
+            img = self.variants.load(path, size)
+            if img is not None:
+                return img
+        img = self._decode(path, size)
+        if img is None:
+            return None
+        factor = min(img.width // max(1, size[0]), img.height // max(1, size[1]))
+        if factor >= 2:
+            if img.mode in ("P", "PA", "1"):
+                # reduce() can't average palette or bilevel pixels
+                img = img.convert("RGBA")
+            img = img.reduce(factor)
+        img = img.resize(size)
+        if persist and self.variants is not None:
+            self.variants.store(path, size, img)
+        return img
+
+    def natural(self, path: Path) -> Optional[Image.Image]:
+        """``path`` at its natural size, from the variant store when possible."""
+        if self.variants is not None:
+            img = self.variants.load(path, None)
+            if img is not None:
+                return img
+        img = self.decoded(path)
+        if img is not None and self.variants is not None:
+            self.variants.store(path, None, img)
+        return img
+
+    def photo(
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        master: Optional[tk.Misc] = None,
+    ) -> Optional[ImageTk.PhotoImage]:
+        """Return a PhotoImage of ``path`` scaled to ``size`` for ``master``."""
+        t = time.perf_counter()
+        mtime = self._mtime(path)
+        if mtime is None:
+            return None
+        key = (_SCALED, str(path), mtime, tuple(size) if size else None, master)
+        with self._lock:
+            hit = self._get(key)
+            if hit is not None:
+                self._stats.scaled_hits += 1
+            else:
+                self._stats.scaled_misses += 1
+        if hit is not None:
+            LOAD_IMAGE_SECONDS["hit"].observe(time.perf_counter() - t)
+            return hit
+        try:
+            img = self.resized(path, size) if size else self.natural(path)
+            if img is None:
+                return None
+            photo = ImageTk.PhotoImage(img, master=master)
+        except Exception:
+            return None
+        with self._lock:
+            self._put(key, photo, _image_bytes(img.size))
+        LOAD_IMAGE_SECONDS["miss"].observe(time.perf_counter() - t)
+        return photo
+
+    def peek_photo(
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]] = None,
+        master: Optional[tk.Misc] = None,
+    ) -> Optional[ImageTk.PhotoImage]:
+        """Return the cached PhotoImage for these arguments without creating one."""
+        mtime = self._mtime(path)
+        if mtime is None:
+            return None
+        with self._lock:
+            hit = self._get((_SCALED, str(path), mtime, tuple(size) if size else None, master))
+            if hit is not None:
+                self._stats.scaled_hits += 1
+            else:
+                self._stats.scaled_misses += 1
+            return hit
+
+    def store_photo(
+        self,
+        path: Path,
+        size: Optional[Tuple[int, int]],
+        master: Optional[tk.Misc],
+        img: Image.Image,
+    ) -> Optional[ImageTk.PhotoImage]:
+        """Wrap an already scaled ``img`` in a cached PhotoImage (Tk thread only)."""
+        mtime = self._mtime(path)
+        try:
+            photo = ImageTk.PhotoImage(img, master=master)
+        except Exception:
+            return None
+        if mtime is not None:
+            with self._lock:
+                self._put((_SCALED, str(path), mtime, tuple(size) if size else None, master), photo, _image_bytes(img.size))
+        return photo
+
+    def discard_master(self, master: Optional[tk.Misc]) -> None:
+        """Drop PhotoImages bound to ``master`` (call before destroying it)."""
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == _SCALED and k[4] is master]
+            for key in stale:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def set_budget(self, budget_bytes: int) -> None:
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            s = self._stats
+            return CacheStats(
+                decoded_hits=s.decoded_hits,
+                decoded_misses=s.decoded_misses,
+                scaled_hits=s.scaled_hits,
+                scaled_misses=s.scaled_misses,
+                evictions=s.evictions,
+                entries=len(self._entries),
+                bytes_used=self._bytes,
+                budget_bytes=self.budget_bytes,
+            )
+
+    # Internals (callers hold self._lock unless noted)
+    def _decode(self, path: Path, draft: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
+        # Takes the lock itself; decoding runs outside it
+        mtime = self._mtime(path)
+        if mtime is None:
+            return None
+        key = (_DECODED, str(path), mtime)
+        with self._lock:
+            hit = self._get(key)
+            if hit is not None:
+                self._stats.decoded_hits += 1
+                return hit
+            self._stats.decoded_misses += 1
+        try:
+            with Image.open(path) as im:
+                full = im.size
+                if draft:
+                    im.draft(im.mode, draft)
+                img = im.copy()
+        except Exception:
+            return None
+        # A draft-reduced decode only serves this request
+        if img.size == full:
+            with self._lock:
+                self._put(key, img, _image_bytes(img.size, len(img.getbands())))
+        return img
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (value, nbytes)
+        self._bytes += nbytes
+        self._evict()
+
+    def _drop(self, key: Hashable) -> None:
+        _, nbytes = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def _evict(self) -> None:
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while self._bytes > self.budget_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._drop(key)
+            self._stats.evictions += 1
+
+
+# Shared cache used by the GUI
+IMAGE_CACHE = ImageCache(variants=VARIANT_CACHE)
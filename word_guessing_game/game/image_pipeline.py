@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import tkinter as tk
+
+from PIL import Image, ImageTk
+
+from .image_cache import IMAGE_CACHE, ImageCache
+from .variant_cache import WARM_WINDOW_SIZES
+
+# Decode/resize threads; Pillow releases the GIL while it resamples
+RESIZE_WORKERS: int = 2
+
+_POLL_MS = 15
+
+Deliver = Callable[[ImageTk.PhotoImage], None]
+
+
+class ResizePipeline:
+    """Decode and resize jobs on a small thread pool.
+
+    ``submit`` asks for ``path`` at ``size`` on behalf of a slot (say, the
+    game background). Workers produce the scaled bitmap through the shared
+    cache's ``draft``/``reduce`` fast paths; an ``after()`` poll on the Tk
+    thread turns it into a PhotoImage and hands it to the slot's callback.
+    A newer submit for the same slot supersedes older ones: workers skip
+    superseded jobs and their late results are dropped. Only sizes in
+    ``persist_sizes`` are written to the on-disk variant store.
+    """
+
+    def __init__(self, cache: ImageCache = IMAGE_CACHE, workers: int = RESIZE_WORKERS) -> None:
+        self._cache = cache
+        self._n_workers = max(1, workers)
+        self.persist_sizes = set(WARM_WINDOW_SIZES)
+        self._root: Optional[tk.Misc] = None
+        self._latest: Dict[Hashable, int] = {}  # slot -> generation of its newest job
+        self._deliver: Dict[Hashable, Deliver] = {}
+        self._generations = itertools.count(1)
+        self._jobs: "queue.Queue[Tuple[Hashable, int, Path, Tuple[int, int]]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[Hashable, int, Path, Tuple[int, int], Optional[Image.Image]]]" = queue.Queue()
+        self._pending = 0
+        self._workers: List[threading.Thread] = []
+        self._poll_job: Optional[str] = None
+        self.cancelled = 0
+
+    # Tk-thread API
+    def attach(self, root: tk.Misc) -> None:
+        self.detach()
+        self._root = root
+
+    def detach(self) -> None:
+        if self._root is not None and self._poll_job:
+            try:
+                self._root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+        self._root = None
+        self._poll_job = None
+        # Anything still in flight is now stale
+        self._latest.clear()
+        self._deliver.clear()
+
+    def submit(self, slot: Hashable, path: Path, size: Tuple[int, int], deliver: Deliver) -> None:
+        """Deliver ``path`` scaled to ``size`` to ``deliver``; cached sizes are delivered at once."""
+        self._latest[slot] = gen = next(self._generations)
+        photo = self._cache.peek_photo(path, size, self._root)
+        if photo is not None:
+            self._deliver.pop(slot, None)
+            deliver(photo)
+            return
+        self._deliver[slot] = deliver
+        self._pending += 1
+        self._jobs.put((slot, gen, path, tuple(size)))
+        self._ensure_workers()
+        self._schedule_poll()
+
+    def cancel(self, slot: Hashable) -> None:
+        self._latest.pop(slot, None)
+        self._deliver.pop(slot, None)
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    # Worker threads
+    def _ensure_workers(self) -> None:
+        self._workers = [t for t in self._workers if t.is_alive()]
+        while len(self._workers) < self._n_workers:
+            t = threading.Thread(target=self._work, name=f"image-resize-{len(self._workers)}", daemon=True)
+            t.start()
+            self._workers.append(t)
+
+    def _work(self) -> None:
+        while True:
+            slot, gen, path, size = self._jobs.get()
+            img: Optional[Image.Image] = None
+            # Skip jobs superseded while they waited
+            if self._latest.get(slot) == gen:
+                try:
+                    img = self._cache.resized(path, size, persist=size in self.persist_sizes)
+                except Exception:
+                    img = None
+            self._results.put((slot, gen, path, size, img))
+
+    # Result marshalling (Tk thread)
+    def _schedule_poll(self) -> None:
+        if self._root is None or self._poll_job:
+            return
+        try:
+            self._poll_job = self._root.after(_POLL_MS, self._poll)
+        except tk.TclError:
+            self._root = None
+
+    def _poll(self) -> None:
+        self._poll_job = None
+        self.drain()
+        if self._pending:
+            self._schedule_poll()
+
+    def drain(self) -> int:
+        """Deliver finished results now; returns how many were delivered."""
+        delivered = 0
+        while True:
+            try:
+                slot, gen, path, size, img = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            self._pending -= 1
+            if self._latest.get(slot) != gen or self._root is None:
+                self.cancelled += 1
+                continue
+            del self._latest[slot]
+            deliver = self._deliver.pop(slot, None)
+            if img is None or deliver is None:
+                continue
+            # The only image work left on the Tk thread
+            photo = self._cache.store_photo(path, size, self._root, img)
+            if photo is not None:
+                deliver(photo)
+                delivered += 1
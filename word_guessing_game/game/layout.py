@@ -0,0 +1,54 @@
+"""Incremental layout: apply only what differs from the last pass.
+
+A window describes its layout as a flat target mapping (widget geometry,
+font sizes, image sizes, ...) computed from the window size alone.
+``LayoutEngine.apply`` diffs it against the last applied target and calls
+back only for changed entries, so a window move or a resize that lands on
+the same scale costs a dict comparison instead of reconfiguring every
+widget. Fonts are shared named ``tkinter.font.Font`` objects: resizing one
+updates every widget that uses it in a single call.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Mapping
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+_MISSING = object()
+
+
+class LayoutEngine:
+    def __init__(self) -> None:
+        self.fonts: Dict[str, tkfont.Font] = {}
+        self.applied_items = 0
+        self._applied: Dict[Hashable, Any] = {}
+
+    def font(self, root: tk.Misc, key: str, family: str, size: int, weight: str = "normal") -> tkfont.Font:
+        """Return the shared font ``key``, creating it on first use."""
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = tkfont.Font(root=root, family=family, size=size, weight=weight)
+            self._applied[("font", key)] = size
+        return font
+
+    def apply(self, target: Mapping[Hashable, Any], apply_item: Callable[[Hashable, Any], None]) -> int:
+        """Call ``apply_item`` for entries that changed; returns how many did."""
+        applied = self._applied
+        changed = 0
+        for key, value in target.items():
+            if applied.get(key, _MISSING) == value:
+                continue
+            apply_item(key, value)
+            applied[key] = value
+            changed += 1
+        self.applied_items += changed
+        return changed
+
+    def forget(self, key: Hashable) -> None:
+        """Force ``key`` to be re-applied on the next pass."""
+        self._applied.pop(key, None)
+
+    def reset(self) -> None:
+        self._applied.clear()
+        self._applied.update((("font", k), f.cget("size")) for k, f in self.fonts.items())
@@ -0,0 +1,272 @@
+"""Always-on latency histograms and counters, exported for Prometheus.
+
+Recording is a bisect over fixed bucket bounds plus two in-place adds, with
+no lock and no allocation, so the GUI and the server keep it on all the
+time. Concurrent observations from different threads may, rarely, lose an
+increment under the GIL; that is the price of not locking and does not
+matter for trend monitoring. Histograms are cumulative for the life of the
+process, so ``histogram_quantile(0.99, rate(...[1h]))`` over days of
+scrapes gives the tail latency trend.
+
+Export with either (or both) of:
+
+    python -m word_guessing_game --metrics wgg.prom      # text file, rewritten every 15 s and on exit
+    python -m word_guessing_game serve --metrics-port 9109  # http://127.0.0.1:9109/metrics
+
+The text file suits node_exporter's textfile collector.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+# Upper bounds in seconds, 1 us .. 10 s (about 2.5x apart)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# How often --metrics rewrites its file
+METRICS_INTERVAL_S = 15.0
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_Labels = Tuple[Tuple[str, str], ...]
+F = TypeVar("F", bound=Callable)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = tuple(sorted(bounds))
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)  # last one is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # Prometheus buckets are "less than or equal", which is bisect_left
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile (None if empty)."""
+        counts = list(self.counts)
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for bound, n in zip(self.bounds + (float("inf"),), counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class MetricsRegistry:
+    """Metric families by name; each family holds one child per label set."""
+
+    def __init__(self, prefix: str = "wgg_") -> None:
+        self.prefix = prefix
+        self._families: Dict[str, Tuple[str, str, Dict[_Labels, object]]] = {}
+        self._lock = threading.Lock()  # registration only, never on observe
+
+    def histogram(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS, **labels: str) -> Histogram:
+        return self._child(name, "histogram", help, labels, lambda: Histogram(buckets))
+
+    def counter(self, name: str, help: str, **labels: str) -> Counter:
+        return self._child(name, "counter", help, labels, Counter)
+
+    def _child(self, name: str, kind: str, help: str, labels: Dict[str, str], make: Callable[[], object]):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = (kind, help, {})
+            elif family[0] != kind:
+                raise ValueError(f"metric {name!r} is a {family[0]}, not a {kind}")
+            child = family[2].get(key)
+            if child is None:
+                child = family[2][key] = make()
+            return child
+
+    # Export
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            families = [(name, kind, help, list(children.items()))
+                        for name, (kind, help, children) in sorted(self._families.items())]
+        lines: List[str] = []
+        for name, kind, help, children in families:
+            full = self.prefix + name
+            lines.append(f"# HELP {full} {help}")
+            lines.append(f"# TYPE {full} {kind}")
+            for labels, metric in sorted(children, key=lambda kv: kv[0]):
+                if isinstance(metric, Histogram):
+                    counts = list(metric.counts)  # one snapshot for buckets, count and sum
+                    cumulative = 0
+                    for bound, n in zip(metric.bounds, counts):
+                        cumulative += n
+                        lines.append(f"{full}_bucket{_format_labels(labels, ('le', repr(bound)))} {cumulative}")
+                    cumulative += counts[-1]
+                    lines.append(f"{full}_bucket{_format_labels(labels, ('le', '+Inf'))} {cumulative}")
+                    lines.append(f"{full}_sum{_format_labels(labels)} {metric.sum!r}")
+                    lines.append(f"{full}_count{_format_labels(labels)} {cumulative}")
+                else:
+                    lines.append(f"{full}{_format_labels(labels)} {metric.value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """Replace ``path`` atomically (scrapers never see a partial file)."""
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _format_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escape = lambda v: v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in pairs) + "}"
+
+
+def timed(histogram: Histogram, fn: F) -> F:
+    """Wrap ``fn`` so each call's latency is observed into ``histogram``."""
+    clock = time.perf_counter
+    observe = histogram.observe
+
+    def wrapper(*args, **kwargs):
+        t = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            observe(clock() - t)
+
+    return wrapper  # type: ignore[return-value]
+
+
+# Shared registry and the metrics recorded by the game
+METRICS = MetricsRegistry()
+GUESS_SECONDS = METRICS.histogram("guess_seconds", "GameLogic.guess latency")
+PICK_WORD_SECONDS = METRICS.histogram("pick_word_seconds", "Word picker latency at round start")
+LOAD_IMAGE_SECONDS = {
+    result: METRICS.histogram("load_image_seconds", "Image load latency by cache result", result=result)
+    for result in ("hit", "miss")
+}
+LAYOUT_SECONDS = {
+    screen: METRICS.histogram("layout_seconds", "Layout pass latency", screen=screen)
+    for screen in ("game", "difficulty")
+}
+
+
+def sound_start_seconds(effect: str) -> Histogram:
+    return METRICS.histogram("sound_start_seconds", "Delay from play request to mixer start", effect=effect)
+
+
+def sound_dropped(effect: str) -> Counter:
+    return METRICS.counter("sound_dropped_total", "Play requests dropped while their sound was decoding", effect=effect)
+
+
+def _http_server(host: str, port: int, registry: MetricsRegistry):
+    # http.server costs ~60 ms to import; only pay for it when serving
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # one line per scrape is noise
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
+class MetricsExporter:
+    """Periodic text-file dumps and/or an HTTP endpoint on daemon threads.
+
+    ``close()`` writes the file one last time, so a run's final numbers
+    survive the process.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        port: Optional[int] = None,
+        host: str = "127.0.0.1",
+        registry: MetricsRegistry = METRICS,
+        interval: float = METRICS_INTERVAL_S,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.port = port
+        self.host = host
+        self.registry = registry
+        self.interval = interval
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._httpd = None
+
+    def start(self) -> None:
+        if self.port is not None:
+            try:
+                self._httpd = _http_server(self.host, self.port, self.registry)
+            except OSError as e:
+                print(f"Metrics endpoint disabled: cannot listen on {self.host}:{self.port}: {e}", file=sys.stderr)
+            else:
+                threading.Thread(target=self._httpd.serve_forever, name="metrics-http", daemon=True).start()
+                print(f"Metrics at http://{self.host}:{self._httpd.server_address[1]}/metrics", file=sys.stderr)
+        if self.path is not None:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+            self._writer.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._writer is not None:
+            self._writer.join(timeout=1.0)
+            self._writer = None
+        self._dump()
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._dump()
+
+    def _dump(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.registry.write(self.path)
+        except OSError as e:
+            print(f"Failed to write metrics to {self.path}: {e}", file=sys.stderr)
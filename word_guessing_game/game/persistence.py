@@ -0,0 +1,277 @@
+"""Durable game sessions: binary snapshots plus an append-only guess journal.
+
+A session is saved as 18 bytes (key, word id, guessed-letter mask, wrong
+count, difficulty). Between snapshots every new round, guess and end is
+appended to a journal as a 16-byte checksummed record; records are buffered
+and written with one fsync per ``flush()``, so recording a guess costs only
+a struct pack. Once the journal grows past ``compact_bytes`` the live
+sessions are written to a fresh snapshot and the journal starts over.
+
+Replaying the journal is idempotent (a guess already in the mask is a
+repeat, a new round starts over), so a crash between writing a snapshot and
+truncating the journal loses nothing.
+
+The player's position in their word stream (``scheduler.PlayerState``) is
+kept next to the sessions, so rounds don't repeat words across launches.
+"""
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+from .corpus import Corpus
+from .data import ALPHABET, STATE_DIR, load_corpus
+from .game_logic import GameLogic, letter_index
+from .scheduler import PlayerState
+
+SNAPSHOT_NAME = "sessions.snap"
+JOURNAL_NAME = "sessions.journal"
+PLAYER_STATE_NAME = "player.state"
+# How often owners are expected to call flush(); also the durability window
+SYNC_INTERVAL_S = 0.05
+COMPACT_BYTES = 1024 * 1024  # ~65k records: replay stays a fraction of a second
+_BUFFER_LIMIT = 64 * 1024
+
+_SNAP_MAGIC = b"WGGS"
+_JOURNAL_MAGIC = b"WGGJ"
+_FORMAT_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sHHII")  # magic, version, reserved, record count, corpus fingerprint
+_SNAP_RECORD = struct.Struct("<QIIBB")  # key, word id, guessed mask, wrong guesses, difficulty
+_JOURNAL_RECORD = struct.Struct("<BBHQI")  # op, arg, check, key, word id
+
+_NEW, _GUESS, _END = 1, 2, 3
+_NOT_A_LETTER = 255
+
+
+def _record(op: int, arg: int, key: int, word_id: int = 0) -> bytes:
+    check = zlib.crc32(_JOURNAL_RECORD.pack(op, arg, 0, key, word_id)) & 0xFFFF
+    return _JOURNAL_RECORD.pack(op, arg, check, key, word_id)
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def load_player_state(directory: Optional[Path] = None) -> Optional[PlayerState]:
+    """Return the saved word-stream positions, or None if there are none."""
+    try:
+        return PlayerState.from_bytes((Path(directory or STATE_DIR) / PLAYER_STATE_NAME).read_bytes())
+    except (OSError, struct.error, IndexError, UnicodeDecodeError):
+        return None
+
+
+def save_player_state(state: PlayerState, directory: Optional[Path] = None) -> None:
+    """Replace the saved word-stream positions (written atomically)."""
+    directory = Path(directory or STATE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = directory / (PLAYER_STATE_NAME + ".tmp")
+    tmp.write_bytes(state.to_bytes())
+    os.replace(tmp, directory / PLAYER_STATE_NAME)
+
+
+class SessionStore:
+    """Keeps game sessions recoverable across restarts.
+
+    Call ``open()`` once to recover sessions, then ``record_new``/
+    ``record_guess``/``record_end`` as games change and ``flush()`` every
+    ``SYNC_INTERVAL_S`` or so. The store holds references to the live
+    ``GameLogic`` objects, so snapshots always reflect their current state.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        corpus: Optional[Corpus] = None,
+        compact_bytes: int = COMPACT_BYTES,
+    ) -> None:
+        self.directory = Path(directory or STATE_DIR)
+        self.corpus = corpus if corpus is not None else load_corpus()
+        self.compact_bytes = compact_bytes
+        self.live: Dict[int, GameLogic] = {}
+        self._word_ids: Dict[int, int] = {}
+        self._difficulties = self.corpus.difficulties()
+        self._difficulty_index = {d: i for i, d in enumerate(self._difficulties)}
+        self._fingerprint = self.corpus.fingerprint()
+        self._buffer = bytearray()
+        self._journal: Optional[BinaryIO] = None
+        self._journal_bytes = 0
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / SNAPSHOT_NAME
+
+    @property
+    def journal_path(self) -> Path:
+        return self.directory / JOURNAL_NAME
+
+    # Recovery
+    def open(self) -> Dict[int, GameLogic]:
+        """Recover sessions from disk and start journaling; returns them by key."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_snapshot()
+        good = self._replay_journal()
+        path = self.journal_path
+        if good == 0:
+            with open(path, "wb") as fh:
+                fh.write(_FILE_HEADER.pack(_JOURNAL_MAGIC, _FORMAT_VERSION, 0, 0, self._fingerprint))
+            good = _FILE_HEADER.size
+        self._journal = open(path, "r+b")
+        # Drop a torn or corrupt tail so new records append after intact ones
+        self._journal.truncate(good)
+        self._journal.seek(good)
+        self._journal_bytes = good - _FILE_HEADER.size
+        return dict(self.live)
+
+    def _matches(self, data: bytes, magic: bytes) -> bool:
+        try:
+            m, version, _, _, fingerprint = _FILE_HEADER.unpack_from(data, 0)
+        except struct.error:
+            return False
+        return (m, version, fingerprint) == (magic, _FORMAT_VERSION, self._fingerprint)
+
+    def _load_snapshot(self) -> None:
+        try:
+            data = self.snapshot_path.read_bytes()
+        except FileNotFoundError:
+            return
+        if not self._matches(data, _SNAP_MAGIC):
+            print(f"Ignoring saved sessions in {self.snapshot_path}: different word list or format")
+            return
+        count = _FILE_HEADER.unpack_from(data, 0)[3]
+        body = memoryview(data)[_FILE_HEADER.size:_FILE_HEADER.size + count * _SNAP_RECORD.size]
+        entry = self.corpus.entry
+        restore = GameLogic.restore
+        difficulties = self._difficulties
+        live = self.live
+        word_ids = self._word_ids
+        for key, word_id, mask, wrong, d in _SNAP_RECORD.iter_unpack(body):
+            _, category, word = entry(word_id)
+            live[key] = restore(difficulties[d], category, word, mask, wrong)
+            word_ids[key] = word_id
+
+    def _replay_journal(self) -> int:
+        """Apply intact journal records; return the byte length they cover."""
+        try:
+            data = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        if not self._matches(data, _JOURNAL_MAGIC):
+            return 0
+        unpack = _JOURNAL_RECORD.unpack_from
+        size = _JOURNAL_RECORD.size
+        pos = _FILE_HEADER.size
+        while pos + size <= len(data):
+            op, arg, check, key, word_id = unpack(data, pos)
+            if _record(op, arg, key, word_id) != data[pos:pos + size]:
+                break
+            self._apply(op, arg, key, word_id)
+            pos += size
+        return pos
+
+    def _apply(self, op: int, arg: int, key: int, word_id: int) -> None:
+        if op == _GUESS:
+            logic = self.live.get(key)
+            if logic is not None:
+                logic.guess(ALPHABET[arg] if arg < 26 else "?")
+        elif op == _NEW:
+            _, category, word = self.corpus.entry(word_id)
+            self.live[key] = GameLogic.from_word(self._difficulties[arg], category, word)
+            self._word_ids[key] = word_id
+        elif op == _END:
+            self.live.pop(key, None)
+            self._word_ids.pop(key, None)
+
+    # Recording
+    def _word_id(self, logic: GameLogic) -> Optional[int]:
+        find = self.corpus.find
+        word_id = find(logic.difficulty, logic.category, logic.word)
+        for d in self._difficulties:
+            if word_id is not None:
+                break
+            word_id = find(d, logic.category, logic.word)
+        return word_id
+
+    def record_new(self, key: int, logic: GameLogic) -> bool:
+        """Record a new round for ``key``; False if the word can't be saved."""
+        d = self._difficulty_index.get(logic.difficulty)
+        word_id = self._word_id(logic)
+        if d is None or word_id is None:
+            self.record_end(key)
+            return False
+        self.live[key] = logic
+        self._word_ids[key] = word_id
+        self._append(_record(_NEW, d, key, word_id))
+        return True
+
+    def record_guess(self, key: int, letter: str) -> None:
+        if key in self.live:
+            i = letter_index(letter.lower())
+            self._append(_record(_GUESS, i if i >= 0 else _NOT_A_LETTER, key))
+
+    def record_end(self, key: int) -> None:
+        if self.live.pop(key, None) is not None:
+            self._word_ids.pop(key, None)
+            self._append(_record(_END, 0, key))
+
+    def _append(self, record: bytes) -> None:
+        self._buffer += record
+        if len(self._buffer) >= _BUFFER_LIMIT:
+            self.flush()
+
+    # Durability
+    def flush(self) -> None:
+        """Write buffered records with a single fsync; compact if the journal is large."""
+        if self._journal is None or not self._buffer:
+            return
+        self._journal.write(self._buffer)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_bytes += len(self._buffer)
+        self._buffer.clear()
+        if self._journal_bytes > self.compact_bytes:
+            self.compact()
+
+    def compact(self) -> None:
+        """Snapshot every live session and start an empty journal."""
+        out = bytearray(_FILE_HEADER.pack(_SNAP_MAGIC, _FORMAT_VERSION, 0, len(self.live), self._fingerprint))
+        pack = _SNAP_RECORD.pack
+        index = self._difficulty_index
+        for key, logic in self.live.items():
+            out += pack(key, self._word_ids[key], logic.guessed_mask, min(255, logic.wrong_guesses),
+                        index.get(logic.difficulty, 0))
+        tmp = self.snapshot_path.with_name(SNAPSHOT_NAME + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(out)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.snapshot_path)
+        _fsync_dir(self.directory)
+        # The snapshot already reflects anything still buffered
+        self._buffer.clear()
+        if self._journal is not None:
+            self._journal.truncate(_FILE_HEADER.size)
+            self._journal.seek(_FILE_HEADER.size)
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        self._journal_bytes = 0
+
+    def close(self) -> None:
+        if self._journal is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,146 @@
+"""Frame-budget tracing for the GUI's Tk callbacks.
+
+``FrameBudgetProfiler.attach(gui)`` wraps the handlers named in
+``TRACED_CALLBACKS`` on a ``GameGUI`` instance (before any window binds
+them). Each call is timed; calls over the 16 ms frame budget are reported
+as they happen. While a traced callback runs, a sampler thread records the
+main thread's Python stack every millisecond; ``dump()`` writes those
+samples as folded stacks ("root;frame;frame count" lines) for
+flamegraph.pl, speedscope or inferno.
+
+Enable with ``python -m word_guessing_game --profile [out.folded]``.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+FRAME_BUDGET_MS = 16.0
+SAMPLE_INTERVAL_S = 0.001
+TRACED_CALLBACKS = [
+    "_on_letter",
+    "_on_canvas_click",
+    "_on_game_configure",
+    "_layout_game_window",
+    "_layout_difficulty_window",
+    "_advance_hangman",
+    "_show_hangman_frame",
+]
+
+
+@dataclass
+class CallbackStats:
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    over_budget: int = 0
+
+
+class FrameBudgetProfiler:
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS, sample_interval: float = SAMPLE_INTERVAL_S) -> None:
+        self.budget_ms = budget_ms
+        self.sample_interval = sample_interval
+        self.stats: Dict[str, CallbackStats] = {}
+        self.stacks: Counter = Counter()
+        self._active: List[str] = []  # traced callbacks on the main thread's stack
+        self._main_ident = threading.main_thread().ident
+        self._wrapper_code = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval = sys.getswitchinterval()
+
+    # Instrumentation
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        stats = self.stats.setdefault(name, CallbackStats())
+        active = self._active
+        budget = self.budget_ms
+
+        @wraps(fn)
+        def traced(*args, **kwargs):
+            active.append(name)
+            t = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                ms = (time.perf_counter() - t) * 1000.0
+                active.pop()
+                stats.calls += 1
+                stats.total_ms += ms
+                if ms > stats.max_ms:
+                    stats.max_ms = ms
+                if ms > budget:
+                    stats.over_budget += 1
+                    print(f"[profile] {name} took {ms:.1f} ms (budget {budget:.0f} ms)", file=sys.stderr)
+
+        self._wrapper_code = traced.__code__
+        return traced
+
+    def attach(self, obj: Any, names: Optional[List[str]] = None) -> None:
+        """Wrap ``obj``'s handlers in place and start sampling."""
+        for name in names or TRACED_CALLBACKS:
+            fn = getattr(obj, name, None)
+            if fn is not None:
+                setattr(obj, name, self.wrap(name, fn))
+        self.start()
+
+    # Sampling
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        # Let the sampler get the GIL about as often as it wants to sample
+        sys.setswitchinterval(min(self._switch_interval, self.sample_interval))
+        self._thread = threading.Thread(target=self._sample_loop, name="frame-budget-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        sys.setswitchinterval(self._switch_interval)
+
+    def _sample_loop(self) -> None:
+        while self._running:
+            time.sleep(self.sample_interval)
+            if self._active:
+                self._sample()
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self._main_ident)
+        try:
+            root = self._active[0]
+        except IndexError:
+            return
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        # Keep only frames inside the outermost traced call, minus the wrappers
+        wrapper = self._wrapper_code
+        outer = max((i for i, c in enumerate(codes) if c is wrapper), default=len(codes))
+        names = [f"tk:{root}"]
+        names += [f"{Path(c.co_filename).stem}:{c.co_name}" for c in reversed(codes[:outer]) if c is not wrapper]
+        self.stacks[";".join(names)] += 1
+
+    # Output
+    def report(self) -> str:
+        lines = [f"{'callback':28s} {'calls':>7s} {'mean ms':>9s} {'max ms':>9s} {'>' + str(int(self.budget_ms)) + ' ms':>7s}"]
+        for name, s in sorted(self.stats.items(), key=lambda kv: -kv[1].total_ms):
+            if s.calls:
+                lines.append(f"{name:28s} {s.calls:7d} {s.total_ms / s.calls:9.2f} {s.max_ms:9.2f} {s.over_budget:7d}")
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> int:
+        """Write folded stacks to ``path``; returns the number of samples."""
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in sorted(self.stacks.items()):
+                fh.write(f"{stack} {count}\n")
+        return sum(self.stacks.values())
+
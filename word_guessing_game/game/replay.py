@@ -0,0 +1,320 @@
+"""Record guesses as a compact event stream and replay them.
+
+A recording is a small binary file: a header, then for every round a
+ROUND record (start time, lives, difficulty, category, word), a RESUME
+record (letters already guessed, wrong count) if the round was resumed
+mid-game, and one 16-byte GUESS record per ``_on_letter`` call
+(milliseconds since the round started, letter, outcome flags, revealed
+positions).
+
+Replays run headlessly through ``GameLogic`` as fast as possible, checking
+every outcome against the recording, or through ``GameGUI`` at the recorded
+pace scaled by ``--speed``:
+
+    python -m word_guessing_game gui --record play.wgr
+    python -m word_guessing_game.game.replay play.wgr --repeat 100
+    python -m word_guessing_game.game.replay play.wgr --gui --speed 4
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .game_logic import GameLogic, GuessResult
+
+_MAGIC = b"WGGR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")  # magic, version, reserved
+_ROUND = struct.Struct("<BdB")  # type, wall-clock start, max wrong; then 3 length-prefixed strings
+_GUESS = struct.Struct("<BIBBQ")  # type, ms since round start, letter, flags, position mask
+_RESUME = struct.Struct("<BB")  # type, wrong guesses; then the guessed letters, length-prefixed
+_ROUND_TYPE, _GUESS_TYPE, _RESUME_TYPE = 1, 2, 3
+
+_STATUSES = ("correct", "wrong", "repeat")
+_COMPLETE, _GAME_OVER = 4, 8
+
+
+class GuessEvent(NamedTuple):
+    t: float  # seconds since the round started
+    letter: str
+    status: str
+    positions: Tuple[int, ...]
+    complete: bool
+    game_over: bool
+
+
+@dataclass
+class Round:
+    difficulty: str
+    category: str
+    word: str
+    max_wrong: int
+    started_at: float
+    guesses: List[GuessEvent] = field(default_factory=list)
+    # State of a round resumed from a saved session when recording began
+    guessed: str = ""
+    wrong: int = 0
+
+    def new_game(self) -> GameLogic:
+        logic = GameLogic.from_word(self.difficulty, self.category, self.word)
+        logic.max_wrong = self.max_wrong
+        for letter in self.guessed:
+            logic.guess(letter)
+        logic.wrong_guesses = self.wrong
+        return logic
+
+
+def _short_string(text: str) -> bytes:
+    raw = text.encode("utf-8")[:255]
+    return bytes((len(raw),)) + raw
+
+
+def _read_short_string(data: bytes, pos: int) -> Tuple[str, int]:
+    n = data[pos]
+    if pos + 1 + n > len(data):
+        raise struct.error("truncated string")
+    return data[pos + 1:pos + 1 + n].decode("utf-8"), pos + 1 + n
+
+
+def _positions_mask(positions: Sequence[int]) -> int:
+    mask = 0
+    for j in positions:
+        if j < 64:
+            mask |= 1 << j
+    return mask
+
+
+class GuessRecorder:
+    """Appends rounds and guesses to a recording file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        # Drop a torn tail left by a crash, so new rounds stay readable
+        end = _parse(self.path.read_bytes(), self.path)[1] if self.path.exists() else 0
+        self._fh: Optional[BinaryIO] = open(self.path, "ab")
+        self._fh.truncate(end)
+        if end == 0:
+            self._fh.write(_HEADER.pack(_MAGIC, _VERSION, 0))
+        self._t0 = time.monotonic()
+
+    def start_round(self, logic: GameLogic) -> None:
+        if self._fh is None:
+            return
+        self._t0 = time.monotonic()
+        out = bytearray(_ROUND.pack(_ROUND_TYPE, time.time(), logic.max_wrong))
+        for text in (logic.difficulty, logic.category, logic.word):
+            out += _short_string(text)
+        if logic.guessed_letters or logic.wrong_guesses:
+            out += _RESUME.pack(_RESUME_TYPE, min(255, logic.wrong_guesses))
+            out += _short_string("".join(sorted(logic.guessed_letters)))
+        self._fh.write(out)
+
+    def record(self, letter: str, result: GuessResult) -> None:
+        if self._fh is None:
+            return
+        ms = min(int((time.monotonic() - self._t0) * 1000), 0xFFFFFFFF)
+        code = ord(letter) if len(letter) == 1 and ord(letter) < 256 else ord("?")
+        flags = _STATUSES.index(result.status) | (_COMPLETE if result.complete else 0) | (_GAME_OVER if result.game_over else 0)
+        self._fh.write(_GUESS.pack(_GUESS_TYPE, ms, code, flags, _positions_mask(result.positions)))
+        if result.complete or result.game_over:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _parse(data: bytes, path: Path) -> Tuple[List[Round], int]:
+    """Return the rounds in ``data`` and the offset just past the last whole record.
+
+    Parsing stops at the first record that is torn or garbled (a crash
+    mid-write), so everything recorded before it stays readable.
+    """
+    if len(data) < _HEADER.size:
+        return [], 0
+    magic, version, _ = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"{path} is not a guess recording (or an unsupported version)")
+    rounds: List[Round] = []
+    pos = end = _HEADER.size
+    try:
+        while pos < len(data):
+            kind = data[pos]
+            if kind == _ROUND_TYPE:
+                _, started_at, max_wrong = _ROUND.unpack_from(data, pos)
+                pos += _ROUND.size
+                texts = []
+                for _ in range(3):
+                    text, pos = _read_short_string(data, pos)
+                    texts.append(text)
+                rounds.append(Round(texts[0], texts[1], texts[2], max_wrong, started_at))
+            elif kind == _RESUME_TYPE and rounds:
+                _, wrong = _RESUME.unpack_from(data, pos)
+                guessed, pos = _read_short_string(data, pos + _RESUME.size)
+                rounds[-1].guessed, rounds[-1].wrong = guessed, wrong
+            elif kind == _GUESS_TYPE and rounds:
+                _, ms, code, flags, mask = _GUESS.unpack_from(data, pos)
+                if flags & 3 >= len(_STATUSES):
+                    break
+                pos += _GUESS.size
+                positions = tuple(j for j in range(64) if mask >> j & 1)
+                rounds[-1].guesses.append(GuessEvent(
+                    ms / 1000, chr(code), _STATUSES[flags & 3], positions,
+                    bool(flags & _COMPLETE), bool(flags & _GAME_OVER),
+                ))
+            else:
+                break
+            end = pos
+    except (struct.error, IndexError, UnicodeDecodeError):
+        pass
+    return rounds, end
+
+
+def read_recording(path: Path) -> List[Round]:
+    """Parse a recording; a torn or garbled tail is ignored."""
+    return _parse(Path(path).read_bytes(), path)[0]
+
+
+@dataclass
+class ReplayReport:
+    rounds: int = 0
+    guesses: int = 0
+    elapsed_s: float = 0.0
+    mismatches: List[Dict] = field(default_factory=list)
+
+    @property
+    def guesses_per_s(self) -> float:
+        return self.guesses / self.elapsed_s if self.elapsed_s else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "rounds": self.rounds,
+            "guesses": self.guesses,
+            "elapsed_s": round(self.elapsed_s, 6),
+            "guesses_per_s": round(self.guesses_per_s),
+            "mismatches": self.mismatches,
+        }
+
+
+def replay_headless(rounds: Sequence[Round], repeat: int = 1) -> ReplayReport:
+    """Feed every recorded guess through ``GameLogic`` and diff the outcomes."""
+    report = ReplayReport()
+    start = time.perf_counter()
+    for rep in range(repeat):
+        for r, rnd in enumerate(rounds):
+            logic = rnd.new_game()
+            for g, event in enumerate(rnd.guesses):
+                result = logic.guess(event.letter)
+                if rep == 0 and (
+                    result.status != event.status
+                    or tuple(j for j in result.positions if j < 64) != event.positions
+                    or result.complete != event.complete
+                    or result.game_over != event.game_over
+                ):
+                    report.mismatches.append({
+                        "round": r,
+                        "guess": g,
+                        "word": rnd.word,
+                        "letter": event.letter,
+                        "recorded": [event.status, list(event.positions), event.complete, event.game_over],
+                        "replayed": [result.status, list(result.positions), result.complete, result.game_over],
+                    })
+            report.guesses += len(rnd.guesses)
+        report.rounds += len(rounds)
+    report.elapsed_s = time.perf_counter() - start
+    return report
+
+
+def replay_gui(rounds: Sequence[Round], speed: float = 1.0) -> None:
+    """Play the recording in the game window; speed <= 0 means as fast as Tk allows."""
+    from .gui import GameGUI
+
+    class ReplayGUI(GameGUI):
+        def __init__(self) -> None:
+            super().__init__()
+            self._queue = list(rounds)
+            self._round = 0
+            self._current: Optional[Round] = None
+            self.on_round_start = self._schedule_round
+
+        def _open_saved_sessions(self) -> Optional[GameLogic]:
+            # Never touch the player's saved round
+            return None
+
+        def _show_difficulty_window(self) -> None:
+            # Every "play again" goes straight to the next recorded round
+            if self._queue:
+                rnd = self._queue.pop(0)
+                self._current = rnd
+                self._show_game_window(rnd.difficulty, rnd.new_game())
+            elif self.root:
+                # Deferred: quit() only takes effect inside the mainloop
+                self.root.after_idle(self.root.quit)
+
+        def _delay_ms(self, i: int, t: float) -> int:
+            return int(t * 1000 / speed) if speed > 0 else i
+
+        def _schedule_round(self) -> None:
+            self._round += 1
+            token = self._round
+            rnd = self._current
+            # The root outlives rounds, so callbacks check they are still current
+            for i, event in enumerate(rnd.guesses):
+                self.root.after(self._delay_ms(i, event.t), lambda l=event.letter: self._guess(token, l))
+            # Rounds recorded without an ending still move on
+            last = rnd.guesses[-1].t if rnd.guesses else 0.0
+            self.root.after(self._delay_ms(len(rnd.guesses), last) + 500, lambda: self._abandon(token))
+
+        def _guess(self, token: int, letter: str) -> None:
+            if token == self._round:
+                self._on_letter(letter)
+
+        def _abandon(self, token: int) -> None:
+            if token == self._round:
+                self._handle_restart(True)
+
+        def _ask_play_again(self, title: str, message: str) -> bool:
+            return True
+
+    ReplayGUI().start()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a guess recording.")
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--gui", action="store_true", help="replay in the game window instead of headlessly")
+    parser.add_argument("--speed", type=float, default=1.0, help="GUI pace multiplier (0 = no delays)")
+    parser.add_argument("--repeat", type=int, default=1, help="headless passes, for timing")
+    parser.add_argument("--json", action="store_true", help="print the headless report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        rounds = read_recording(args.recording)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.gui:
+        replay_gui(rounds, args.speed)
+        return 0
+
+    report = replay_headless(rounds, args.repeat)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(f"{report.rounds} rounds, {report.guesses} guesses in {report.elapsed_s * 1000:.1f} ms "
+              f"({report.guesses_per_s:,.0f} guesses/s), {len(report.mismatches)} mismatches")
+        for m in report.mismatches[:10]:
+            print(f"  round {m['round']} guess {m['guess']} {m['word']!r} {m['letter']!r}: "
+                  f"recorded {m['recorded']} replayed {m['replayed']}")
+    return 2 if report.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
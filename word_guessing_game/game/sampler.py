@@ -0,0 +1,252 @@
+"""Hardness-weighted word sampling in constant time.
+
+Every word gets a hardness score in [0, 1] (its percentile among the corpus,
+0 = easiest), computed from simulated solve rates and cached per corpus.
+Words are grouped into hardness buckets; an alias table over the buckets
+reproduces a per-difficulty target distribution, and a word is then drawn
+uniformly inside the chosen bucket. Adding a word appends to one bucket and
+rebuilds only the small bucket-level tables.
+"""
+from __future__ import annotations
+
+import random
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .corpus import Corpus
+from .data import CACHE_DIR, load_corpus
+from .game_logic import word_masks
+
+N_BUCKETS = 10
+
+# Target share of draws per hardness bucket (easiest first), by difficulty
+TARGET_HARDNESS: Dict[str, List[float]] = {
+    "Beginner": [20, 18, 16, 13, 10, 8, 6, 4, 3, 2],
+    "Intermediate": [4, 7, 10, 13, 16, 16, 13, 10, 7, 4],
+    "Advanced": [2, 3, 4, 6, 8, 10, 13, 16, 18, 20],
+}
+
+_CACHE_MAGIC = b"WGGH"
+_CACHE_VERSION = 1
+_CACHE_HEADER = struct.Struct("<4sHHII")  # magic, version, reserved, count, corpus fingerprint
+
+_ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+def _percentiles(raw: Sequence[float]) -> List[float]:
+    """Map raw scores to [0, 1] percentile ranks (ties share a rank)."""
+    n = len(raw)
+    if n <= 1:
+        return [0.5] * n
+    order = sorted(range(n), key=raw.__getitem__)
+    out = [0.0] * n
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and raw[order[j + 1]] == raw[order[i]]:
+            j += 1
+        rank = (i + j) / 2 / (n - 1)
+        for k in range(i, j + 1):
+            out[order[k]] = rank
+        i = j + 1
+    return out
+
+
+def heuristic_hardness(corpus: Corpus) -> List[float]:
+    """Rare and many distinct letters make a word harder (no NumPy needed)."""
+    raw = []
+    for i in range(len(corpus)):
+        mask = word_masks(corpus.word(i)).letter_mask
+        letters = [ch for ch in _ENGLISH_ORDER if mask >> (ord(ch) - 97) & 1]
+        rarity = sum(_ENGLISH_ORDER.index(ch) for ch in letters) / (25 * max(1, len(letters)))
+        raw.append(0.6 * rarity + 0.4 * min(1.0, len(letters) / 10))
+    return _percentiles(raw)
+
+
+def compute_hardness(corpus: Corpus, games_per_word: int = 64, seed: int = 0) -> List[float]:
+    """Hardness from simulated solve rates, falling back to a letter heuristic."""
+    try:
+        from .simulate import WordTable, simulate
+        table = WordTable.from_corpus(corpus)
+    except RuntimeError:
+        return heuristic_hardness(corpus)
+    result = simulate(table=table, strategy="sampled_frequency", games_per_word=games_per_word, seed=seed)
+    solve = (result.wins / result.games.clip(min=1)).tolist()
+    # Break solve-rate ties with the heuristic so buckets stay populated
+    tiebreak = heuristic_hardness(corpus)
+    return _percentiles([(1.0 - s) + 1e-3 * t for s, t in zip(solve, tiebreak)])
+
+
+def hardness_from_report(corpus: Corpus, report: Mapping) -> List[float]:
+    """Hardness from a tournament report; words it does not cover get 0.5."""
+    by_entry = {(r["difficulty"], r["category"], r["word"]): r["hardness"] for r in report["hardness"]}
+    raw = [by_entry.get(corpus.entry(i), 0.5) for i in range(len(corpus))]
+    return _percentiles(raw)
+
+
+def load_hardness(corpus: Corpus, cache_dir: Optional[Path] = None, games_per_word: int = 64) -> List[float]:
+    """Return cached hardness for ``corpus``, computing and caching it if needed."""
+    fingerprint = corpus.fingerprint()
+    path = Path(cache_dir or CACHE_DIR) / f"hardness-{fingerprint:08x}-{len(corpus)}.bin"
+    try:
+        data = path.read_bytes()
+        magic, version, _, count, fp = _CACHE_HEADER.unpack_from(data, 0)
+        if (magic, version, count, fp) == (_CACHE_MAGIC, _CACHE_VERSION, len(corpus), fingerprint):
+            values = array("f")
+            values.frombytes(data[_CACHE_HEADER.size:_CACHE_HEADER.size + 4 * count])
+            return values.tolist()
+    except (OSError, struct.error, ValueError):
+        pass
+
+    hardness = compute_hardness(corpus, games_per_word=games_per_word)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(_CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, 0, len(corpus), fingerprint)
+                        + array("f", hardness).tobytes())
+        tmp.replace(path)
+    except OSError:
+        pass
+    return hardness
+
+
+class _AliasTable:
+    """Vose alias table over a handful of weights."""
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights] if total > 0 else [1.0] * n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def draw(self, rng: random.Random) -> int:
+        r = rng.random() * len(self.prob)
+        i = int(r)
+        return i if r - i < self.prob[i] else self.alias[i]
+
+
+class HardnessSampler:
+    """Draws (category, word) for a difficulty following its hardness target.
+
+    Pass ``sampler.pick`` as ``GameLogic(difficulty, picker=...)``. With
+    ``restrict_to_difficulty`` only a difficulty's own corpus words are
+    eligible; otherwise every word is, once per (category, word) however
+    many difficulties list it, and the difficulty only selects the target
+    distribution.
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[Corpus] = None,
+        hardness: Optional[Sequence[float]] = None,
+        targets: Optional[Mapping[str, Sequence[float]]] = None,
+        restrict_to_difficulty: bool = False,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.corpus = corpus if corpus is not None else load_corpus()
+        self.hardness = array("f", hardness if hardness is not None else load_hardness(self.corpus))
+        self.targets: Dict[str, List[float]] = {k: list(v) for k, v in (targets or TARGET_HARDNESS).items()}
+        self.restrict = restrict_to_difficulty
+        self.rng = rng or random.Random()
+        self._extra: List[Tuple[str, str, str]] = []
+        # pool key (difficulty or None) -> bucket -> word ids
+        self._buckets: Dict[Optional[str], List[array]] = {}
+        # (category, word) already in the shared pool (unrestricted mode)
+        self._shared: Set[Tuple[str, str]] = set()
+        self._tables: Dict[str, Tuple[_AliasTable, List[int]]] = {}
+        self._build()
+
+    @staticmethod
+    def bucket_of(hardness: float) -> int:
+        return min(N_BUCKETS - 1, max(0, int(hardness * N_BUCKETS)))
+
+    def _pool_key(self, difficulty: str) -> Optional[str]:
+        return difficulty if self.restrict else None
+
+    def _build(self) -> None:
+        self._buckets = {}
+        self._shared = set()
+        for d, c, _, start, n in self.corpus.groups:
+            buckets = self._buckets.setdefault(self._pool_key(d), [array("I") for _ in range(N_BUCKETS)])
+            for i in range(start, start + n):
+                if not self.restrict and self._seen(c, self.corpus.word(i)):
+                    continue
+                buckets[self.bucket_of(self.hardness[i])].append(i)
+        self._tables = {}
+
+    def _seen(self, category: str, word: str) -> bool:
+        """Record a shared-pool member; True if it was already there."""
+        key = (category, word)
+        if key in self._shared:
+            return True
+        self._shared.add(key)
+        return False
+
+    def _table(self, difficulty: str) -> Tuple[_AliasTable, List[int]]:
+        """Alias table over the non-empty buckets, and the bucket each slot is.
+
+        If the target puts no weight on any populated bucket, draws fall back
+        to the flat pool (buckets weighted by size, so words are uniform).
+        """
+        entry = self._tables.get(difficulty)
+        if entry is None:
+            buckets = self._buckets[self._pool_key(difficulty)]
+            target = self.targets.get(difficulty) or [1.0] * N_BUCKETS
+            slots = [k for k, b in enumerate(buckets) if len(b)]
+            weights = [target[k] for k in slots]
+            if not sum(weights) > 0:
+                weights = [len(buckets[k]) for k in slots]
+            entry = self._tables[difficulty] = (_AliasTable(weights), slots)
+        return entry
+    def set_target(self, difficulty: str, weights: Sequence[float]) -> None:
+        if len(weights) != N_BUCKETS:
+            raise ValueError(f"expected {N_BUCKETS} bucket weights")
+        self.targets[difficulty] = list(weights)
+        self._tables.pop(difficulty, None)
+
+    def add_word(self, difficulty: str, category: str, word: str, hardness: float) -> int:
+        """Add a word outside the corpus; only its bucket's tables are rebuilt."""
+        word_id = len(self.corpus) + len(self._extra)
+        self._extra.append((difficulty, category, word.lower()))
+        self.hardness.append(hardness)
+        if not self.restrict and self._seen(category, word.lower()):
+            return word_id
+        key = self._pool_key(difficulty)
+        buckets = self._buckets.setdefault(key, [array("I") for _ in range(N_BUCKETS)])
+        bucket = self.bucket_of(hardness)
+        was_empty = not buckets[bucket]
+        buckets[bucket].append(word_id)
+        if was_empty:
+            # A bucket gaining its first word changes the alias tables
+            for d in list(self._tables):
+                if self._pool_key(d) == key:
+                    del self._tables[d]
+        return word_id
+
+    def entry(self, word_id: int) -> Tuple[str, str, str]:
+        n = len(self.corpus)
+        return self.corpus.entry(word_id) if word_id < n else self._extra[word_id - n]
+
+    def pick_id(self, difficulty: str) -> int:
+        buckets = self._buckets[self._pool_key(difficulty)]
+        table, slots = self._table(difficulty)
+        members = buckets[slots[table.draw(self.rng)]]
+        return members[int(self.rng.random() * len(members))]
+
+    def pick(self, difficulty: str) -> Tuple[str, str]:
+        """Return (category, word), same contract as ``pick_word``."""
+        _, category, word = self.entry(self.pick_id(difficulty))
+        return category, word
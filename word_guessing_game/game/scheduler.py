@@ -0,0 +1,159 @@
+"""Non-repeating word streams with constant per-player state.
+
+A player's stream is a keyed pseudo-random permutation of a difficulty's
+word pool, evaluated on demand with a small Feistel network (cycle-walked
+to the pool size). Walking the cursor through the permutation visits every
+word once before any repeats; the next pass (epoch) uses a fresh
+permutation. No shuffled list is ever materialised, so a player costs a
+seed plus a cursor and an epoch per difficulty played (about 60 bytes
+serialised for the three built-in difficulties) whatever the corpus size.
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+import random
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .corpus import Corpus
+from .data import load_corpus
+
+_M64 = (1 << 64) - 1
+_ROUNDS = 4
+_STATE = struct.Struct("<QB")  # seed, number of streams
+_STREAM = struct.Struct("<IH")  # cursor, epoch; follows the difficulty name
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finaliser."""
+    x = (x + 0x9E3779B97F4A7C15) & _M64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _M64
+    return x ^ (x >> 31)
+
+
+def permute(index: int, n: int, key: int) -> int:
+    """Image of ``index`` under the keyed permutation of range(n)."""
+    bits = max(2, (n - 1).bit_length())
+    bits += bits & 1
+    half = bits // 2
+    mask = (1 << half) - 1
+    x = index
+    while True:
+        left, right = x >> half, x & mask
+        for rnd in range(_ROUNDS):
+            left, right = right, left ^ (_mix(key ^ (rnd << 56) ^ right) & mask)
+        x = (left << half) | right
+        if x < n:
+            return x
+
+
+@dataclass
+class StreamPosition:
+    """How far a player is through one difficulty's stream."""
+
+    cursor: int = 0
+    epoch: int = 0
+
+
+@dataclass
+class PlayerState:
+    """Where a player is in each difficulty's word stream."""
+
+    seed: int
+    streams: Dict[str, StreamPosition] = field(default_factory=dict)
+
+    @classmethod
+    def new(cls, rng: Optional[random.Random] = None) -> "PlayerState":
+        return cls(seed=(rng or random.SystemRandom()).getrandbits(64))
+
+    def stream(self, difficulty: str) -> StreamPosition:
+        position = self.streams.get(difficulty)
+        if position is None:
+            position = self.streams[difficulty] = StreamPosition()
+        return position
+
+    def to_bytes(self) -> bytes:
+        parts = [_STATE.pack(self.seed & _M64, len(self.streams))]
+        for difficulty, position in self.streams.items():
+            name = difficulty.encode()
+            parts.append(bytes([len(name)]) + name + _STREAM.pack(position.cursor, position.epoch & 0xFFFF))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PlayerState":
+        seed, count = _STATE.unpack_from(data)
+        state = cls(seed)
+        offset = _STATE.size
+        for _ in range(count):
+            end = offset + 1 + data[offset]
+            difficulty = data[offset + 1:end].decode()
+            cursor, epoch = _STREAM.unpack_from(data, end)
+            state.streams[difficulty] = StreamPosition(cursor, epoch)
+            offset = end + _STREAM.size
+        return state
+
+
+class ShuffleScheduler:
+    """Streams a difficulty's words to players without repeats until exhausted.
+
+    The scheduler itself is shared and holds only per-difficulty range tables
+    over the corpus; all per-player state lives in ``PlayerState``, which keeps
+    a separate cursor and epoch per difficulty, so switching difficulty never
+    cuts a pass short: each pool is still played through before any repeats.
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None) -> None:
+        self.corpus = corpus if corpus is not None else load_corpus()
+        self._pools: Dict[str, Tuple[List[int], List[int]]] = {}
+
+    def _pool(self, difficulty: str) -> Tuple[List[int], List[int]]:
+        pool = self._pools.get(difficulty)
+        if pool is None:
+            ranges = self.corpus.ids(difficulty)
+            if not ranges:
+                raise KeyError(difficulty)
+            pool = ([r.start for r in ranges], list(itertools.accumulate(len(r) for r in ranges)))
+            self._pools[difficulty] = pool
+        return pool
+
+    def pool_size(self, difficulty: str) -> int:
+        return self._pool(difficulty)[1][-1]
+
+    @staticmethod
+    def _key(state: PlayerState, difficulty: str, epoch: int) -> int:
+        return _mix(state.seed ^ _mix(zlib.crc32(difficulty.encode()) | (epoch << 32)))
+
+    def _position(self, state: PlayerState, difficulty: str, epoch: int, cursor: int, n: int) -> int:
+        if epoch and n > 1 and cursor < 2:
+            # Never repeat across a pass boundary: swap the first two slots
+            # if the new pass would start with the previous pass's last word
+            last = permute(n - 1, n, self._key(state, difficulty, epoch - 1))
+            if permute(0, n, self._key(state, difficulty, epoch)) == last:
+                cursor = 1 - cursor
+        return permute(cursor, n, self._key(state, difficulty, epoch))
+
+    def next_id(self, state: PlayerState, difficulty: str) -> int:
+        """Return the player's next word id and advance their state."""
+        starts, cumulative = self._pool(difficulty)
+        n = cumulative[-1]
+        position = state.stream(difficulty)
+        if position.cursor >= n:
+            position.cursor = 0
+            position.epoch += 1
+        k = self._position(state, difficulty, position.epoch, position.cursor, n)
+        position.cursor += 1
+        g = bisect.bisect_right(cumulative, k)
+        return starts[g] + k - (cumulative[g - 1] if g else 0)
+
+    def next(self, state: PlayerState, difficulty: str) -> Tuple[str, str]:
+        """Return the player's next (category, word)."""
+        _, category, word = self.corpus.entry(self.next_id(state, difficulty))
+        return category, word
+
+    def picker(self, state: PlayerState):
+        """A ``GameLogic`` picker drawing from this player's stream."""
+        return lambda difficulty: self.next(state, difficulty)
@@ -0,0 +1,295 @@
+"""Headless multi-session game server.
+
+Line-delimited JSON over TCP: each request is one JSON object per line and
+gets exactly one JSON line back, in order. Operations:
+
+    {"op": "new", "difficulty": "Beginner"}        -> {"ok": true, "session": ..., "state": {...}}
+    {"op": "new", "session": "..."}                 -> next round in that session
+    {"op": "guess", "session": "...", "letter": "e"} -> {"ok": true, "status": ..., "positions": [...], "state": {...}}
+    {"op": "state", "session": "..."}               -> {"ok": true, "state": {...}}
+    {"op": "close", "session": "..."}               -> {"ok": true}
+    {"op": "stats"} / {"op": "ping"}
+
+An optional "req" field is echoed back. Errors are {"ok": false, "error": ...}.
+Run with ``python -m word_guessing_game serve``; ``--state-dir`` keeps sessions
+across restarts (see ``persistence``).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .data import WORD_LISTS, pick_word
+from .game_logic import GameLogic
+from .metrics import GUESS_SECONDS, PICK_WORD_SECONDS, MetricsExporter, timed
+from .persistence import SYNC_INTERVAL_S, SessionStore
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+IDLE_TIMEOUT_S = 600.0
+MAX_SESSIONS = 200_000
+MAX_LINE = 4096
+# Stop reading from a connection while this much output is unsent
+WRITE_HIGH_WATER = 256 * 1024
+_SWEEP_INTERVAL_S = 5.0
+
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+_pick_word = timed(PICK_WORD_SECONDS, pick_word)
+
+
+class _Session:
+    __slots__ = ("logic", "last_seen")
+
+    def __init__(self, logic: GameLogic, now: float) -> None:
+        self.logic = logic
+        self.last_seen = now
+
+
+class SessionTable:
+    """Sessions in least-recently-used order, evicted when idle or over capacity."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_S, max_sessions: int = MAX_SESSIONS) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.evicted = 0
+        self.on_evict: Optional[Callable[[str], None]] = None
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, logic: GameLogic, sid: Optional[str] = None) -> str:
+        sid = sid or secrets.token_hex(8)
+        self._sessions[sid] = _Session(logic, time.monotonic())
+        while len(self._sessions) > self.max_sessions:
+            self._evict(self._sessions.popitem(last=False)[0])
+        return sid
+
+    def _evict(self, sid: str) -> None:
+        self.evicted += 1
+        if self.on_evict:
+            self.on_evict(sid)
+
+    def get(self, sid: str) -> Optional[GameLogic]:
+        session = self._sessions.get(sid)
+        if session is None:
+            return None
+        session.last_seen = time.monotonic()
+        self._sessions.move_to_end(sid)
+        return session.logic
+
+    def remove(self, sid: str) -> bool:
+        return self._sessions.pop(sid, None) is not None
+
+    def sweep(self) -> int:
+        """Drop sessions idle for longer than the timeout; return how many."""
+        cutoff = time.monotonic() - self.idle_timeout
+        dropped = 0
+        while self._sessions:
+            sid, session = next(iter(self._sessions.items()))
+            if session.last_seen >= cutoff:
+                break
+            del self._sessions[sid]
+            self._evict(sid)
+            dropped += 1
+        return dropped
+
+
+def _state(logic: GameLogic) -> Dict[str, object]:
+    done = logic.is_complete() or logic.is_game_over()
+    state: Dict[str, object] = {
+        "category": logic.category,
+        "first_letter": logic.word[0],
+        "board": "".join(logic.gameboard),
+        "guessed": "".join(sorted(logic.guessed_letters)),
+        "wrong": logic.wrong_guesses,
+        "max_wrong": logic.max_wrong,
+        "complete": logic.is_complete(),
+        "game_over": logic.is_game_over(),
+    }
+    if done:
+        state["word"] = logic.word
+    return state
+
+
+class GameServer:
+    def __init__(self, sessions: Optional[SessionTable] = None, store: Optional[SessionStore] = None) -> None:
+        self.sessions = sessions if sessions is not None else SessionTable()
+        self.store = store
+        self.requests = 0
+        self.connections = 0
+        if store is not None:
+            for key, logic in store.open().items():
+                logic.picker = _pick_word
+                self.sessions.create(logic, f"{key:016x}")
+            self.sessions.on_evict = lambda sid: store.record_end(int(sid, 16))
+
+    def handle(self, request: Dict) -> Dict[str, object]:
+        """Apply one decoded request and return the response object."""
+        op = request.get("op")
+        if op == "guess":
+            sid = str(request.get("session"))
+            logic = self.sessions.get(sid)
+            if logic is None:
+                return {"ok": False, "error": "unknown session"}
+            letter = request.get("letter")
+            if not isinstance(letter, str):
+                return {"ok": False, "error": "letter must be a string"}
+            if logic.is_complete() or logic.is_game_over():
+                return {"ok": False, "error": "game finished", "state": _state(logic)}
+            t = time.perf_counter()
+            result = logic.guess(letter)
+            GUESS_SECONDS.observe(time.perf_counter() - t)
+            if self.store is not None:
+                self.store.record_guess(int(sid, 16), letter)
+            return {"ok": True, "status": result.status, "positions": result.positions, "state": _state(logic)}
+        if op == "new":
+            sid = str(request["session"]) if "session" in request else None
+            logic = self.sessions.get(sid) if sid is not None else None
+            if sid is not None and logic is None:
+                return {"ok": False, "error": "unknown session"}
+            # A session's next round keeps its difficulty unless one is given
+            difficulty = request.get("difficulty", logic.difficulty if logic is not None else "Beginner")
+            if not isinstance(difficulty, str) or difficulty not in WORD_LISTS:
+                return {"ok": False, "error": f"unknown difficulty {difficulty!r}"}
+            if logic is None:
+                logic = GameLogic(difficulty, picker=_pick_word)
+                sid = self.sessions.create(logic)
+            else:
+                # Next round in an existing session
+                logic.difficulty = difficulty
+                logic.reset()
+            if self.store is not None:
+                self.store.record_new(int(sid, 16), logic)
+            return {"ok": True, "session": sid, "state": _state(logic)}
+        if op == "state":
+            logic = self.sessions.get(str(request.get("session")))
+            if logic is None:
+                return {"ok": False, "error": "unknown session"}
+            return {"ok": True, "state": _state(logic)}
+        if op == "close":
+            sid = str(request.get("session"))
+            removed = self.sessions.remove(sid)
+            if removed and self.store is not None:
+                self.store.record_end(int(sid, 16))
+            return {"ok": removed}
+        if op == "stats":
+            return {
+                "ok": True,
+                "sessions": len(self.sessions),
+                "evicted": self.sessions.evicted,
+                "requests": self.requests,
+                "connections": self.connections,
+            }
+        if op == "ping":
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def handle_line(self, line: bytes) -> bytes:
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            return _dumps({"ok": False, "error": f"bad request: {e}"}).encode() + b"\n"
+        try:
+            response = self.handle(request)
+        except Exception as e:
+            # A malformed request must not take the connection down with it
+            response = {"ok": False, "error": f"bad request: {type(e).__name__}: {e}"}
+        if "req" in request:
+            response["req"] = request["req"]
+        return _dumps(response).encode() + b"\n"
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        transport = writer.transport
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b'{"ok":false,"error":"line too long"}\n')
+                    break
+                if not line:
+                    break
+                writer.write(self.handle_line(line))
+                # Backpressure: a client that doesn't read its responses stops
+                # being read from, so its requests queue up in TCP, not here
+                if transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+                    await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _sweeper(self) -> None:
+        while True:
+            await asyncio.sleep(_SWEEP_INTERVAL_S)
+            self.sessions.sweep()
+
+    async def _syncer(self) -> None:
+        # Group commit: one fsync per interval however many guesses arrived.
+        # A failed sync stops the server rather than keep acknowledging
+        # guesses that would be lost on restart.
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL_S)
+            try:
+                self.store.flush()
+            except OSError as e:
+                raise OSError(e.errno, f"could not sync sessions to disk: {e.strerror or e}") from e
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        server = await asyncio.start_server(self._connection, host, port, limit=MAX_LINE)
+        tasks = [asyncio.ensure_future(self._sweeper())]
+        if self.store is not None:
+            tasks.append(asyncio.ensure_future(self._syncer()))
+        addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+        print(f"Serving Word Guessing Game on {addrs}")
+        try:
+            async with server:
+                tasks.append(asyncio.ensure_future(server.serve_forever()))
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+def run(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, idle_timeout: float = IDLE_TIMEOUT_S,
+        max_sessions: int = MAX_SESSIONS, state_dir: Optional[Path] = None,
+        metrics_path: Optional[Path] = None, metrics_port: Optional[int] = None) -> int:
+    """Serve until interrupted; returns 1 if session sync failed, else 0."""
+    store = SessionStore(state_dir) if state_dir else None
+    server = GameServer(SessionTable(idle_timeout, max_sessions), store)
+    if store is not None:
+        print(f"Restored {len(server.sessions)} sessions from {state_dir}")
+    exporter = MetricsExporter(metrics_path, metrics_port, host)
+    exporter.start()
+    code = 0
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Stopping: {e}", file=sys.stderr)
+        code = 1
+    finally:
+        exporter.close()
+        if store is not None:
+            try:
+                store.close()
+            except OSError as e:
+                print(f"Could not sync sessions to disk: {e}", file=sys.stderr)
+                code = 1
+    return code
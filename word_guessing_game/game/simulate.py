@@ -0,0 +1,339 @@
+"""Vectorised batch simulator for calibrating difficulty constants.
+
+Whole batches of games advance one guess per NumPy step: boards are letter
+masks, guessed sets are uint32 bitmasks and lives are an int array. Needs
+NumPy (``pip install numpy``); the game itself does not.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+from .corpus import Corpus
+from .data import MAX_WRONG_GUESSES, initial_hangman_index, load_corpus
+from .game_logic import word_masks
+
+_LETTER_BITS = None if np is None else (np.uint32(1) << np.arange(26, dtype=np.uint32))
+MAX_GUESSES = 26
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("The batch simulator needs NumPy: pip install numpy")
+
+
+@dataclass
+class WordTable:
+    """Corpus words as parallel arrays indexed by corpus word id."""
+
+    corpus: Corpus
+    masks: "np.ndarray"  # uint32 letter mask per word
+    lengths: "np.ndarray"  # int16
+    first_letter: "np.ndarray"  # int8, 0-25
+    difficulty: "np.ndarray"  # int16 index into difficulties
+    category: "np.ndarray"  # int16 index into categories
+    difficulties: List[str]
+    categories: List[str]
+    # Derived tables shared by strategies (e.g. letter frequencies)
+    cache: Dict[str, "np.ndarray"] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_corpus(cls, corpus: Corpus) -> "WordTable":
+        _require_numpy()
+        n = len(corpus)
+        words = [corpus.word(i) for i in range(n)]
+        pack_masks = getattr(corpus, "letter_masks", None)
+        if pack_masks is not None:
+            masks = np.frombuffer(pack_masks, dtype=np.uint32).copy()
+        else:
+            masks = np.fromiter((word_masks(w).letter_mask for w in words), dtype=np.uint32, count=n)
+        difficulties = corpus.difficulties()
+        categories = sorted({g[1] for g in corpus.groups})
+        diff = np.empty(n, dtype=np.int16)
+        cat = np.empty(n, dtype=np.int16)
+        for d, c, _, start, count in corpus.groups:
+            diff[start:start + count] = difficulties.index(d)
+            cat[start:start + count] = categories.index(c)
+        return cls(
+            corpus=corpus,
+            masks=masks,
+            lengths=np.fromiter((len(w) for w in words), dtype=np.int16, count=n),
+            first_letter=np.fromiter((ord(w[0]) - 97 for w in words), dtype=np.int8, count=n),
+            difficulty=diff,
+            category=cat,
+            difficulties=difficulties,
+            categories=categories,
+        )
+
+
+@dataclass
+class BatchState:
+    """State of a batch of games; strategies read it, the simulator updates it."""
+
+    word_ids: "np.ndarray"
+    word_mask: "np.ndarray"  # uint32
+    length: "np.ndarray"
+    first_letter: "np.ndarray"
+    guessed: "np.ndarray"  # uint32 bitmask of guessed letters
+    wrong: "np.ndarray"  # int16 lives used
+    guesses: "np.ndarray"  # int16 guesses made
+    active: "np.ndarray"  # bool, game still running
+
+    def unguessed(self) -> "np.ndarray":
+        """(B, 26) bool: letters each game may still guess."""
+        return (self.guessed[:, None] & _LETTER_BITS) == 0
+
+
+# A strategy maps (state, word table, rng) to one letter index (0-25) per game
+Strategy = Callable[[BatchState, WordTable, "np.random.Generator"], "np.ndarray"]
+STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    def deco(fn: Strategy) -> Strategy:
+        STRATEGIES[name] = fn
+        return fn
+    return deco
+
+
+def _pick(scores: "np.ndarray", state: BatchState) -> "np.ndarray":
+    scores = np.where(state.unguessed(), scores, -np.inf)
+    return scores.argmax(axis=1)
+
+
+def _with_hint(scores: "np.ndarray", state: BatchState) -> "np.ndarray":
+    # The player is shown the first letter, so it is always a safe guess
+    scores = scores.copy()
+    scores[np.arange(len(scores)), state.first_letter] = np.inf
+    return scores
+
+
+@register_strategy("random")
+def random_strategy(state: BatchState, table: WordTable, rng: "np.random.Generator") -> "np.ndarray":
+    return _pick(rng.random((len(state.word_ids), 26)), state)
+
+
+@register_strategy("frequency")
+def frequency_strategy(state: BatchState, table: WordTable, rng: "np.random.Generator") -> "np.ndarray":
+    freq = _letter_frequency(table)
+    scores = np.broadcast_to(freq, (len(state.word_ids), 26))
+    return _pick(_with_hint(scores, state), state)
+
+
+@register_strategy("length_frequency")
+def length_frequency_strategy(state: BatchState, table: WordTable, rng: "np.random.Generator") -> "np.ndarray":
+    freq = _length_frequency(table)
+    return _pick(_with_hint(freq[state.length], state), state)
+
+
+@register_strategy("sampled_frequency")
+def sampled_frequency_strategy(state: BatchState, table: WordTable, rng: "np.random.Generator") -> "np.ndarray":
+    # Letters drawn with probability proportional to squared length frequency
+    # (Gumbel-max trick), so repeated games on one word give graded results
+    freq = _length_frequency(table)[state.length]
+    scores = 2.0 * np.log(freq + 1.0) + rng.gumbel(size=freq.shape)
+    return _pick(_with_hint(scores, state), state)
+
+
+def _letter_frequency(table: WordTable) -> "np.ndarray":
+    if "letter_frequency" not in table.cache:
+        present = (table.masks[:, None] & _LETTER_BITS) != 0
+        table.cache["letter_frequency"] = present.sum(axis=0).astype(np.float64)
+    return table.cache["letter_frequency"]
+
+
+def _length_frequency(table: WordTable) -> "np.ndarray":
+    if "length_frequency" not in table.cache:
+        present = ((table.masks[:, None] & _LETTER_BITS) != 0).astype(np.float64)
+        out = np.zeros((int(table.lengths.max()) + 1, 26))
+        np.add.at(out, table.lengths, present)
+        table.cache["length_frequency"] = out
+    return table.cache["length_frequency"]
+
+
+def play_batch(
+    word_ids: "np.ndarray",
+    table: WordTable,
+    strategy: Strategy,
+    rng: "np.random.Generator",
+    max_wrong: int = MAX_WRONG_GUESSES,
+) -> BatchState:
+    """Play one game per entry of ``word_ids`` to completion."""
+    _require_numpy()
+    b = len(word_ids)
+    state = BatchState(
+        word_ids=word_ids,
+        word_mask=table.masks[word_ids],
+        length=table.lengths[word_ids],
+        first_letter=table.first_letter[word_ids],
+        guessed=np.zeros(b, dtype=np.uint32),
+        wrong=np.zeros(b, dtype=np.int16),
+        guesses=np.zeros(b, dtype=np.int16),
+        active=np.ones(b, dtype=bool),
+    )
+    for _ in range(MAX_GUESSES):
+        if not state.active.any():
+            break
+        letters = np.asarray(strategy(state, table, rng))
+        bits = _LETTER_BITS[letters]
+        act = state.active
+        fresh = act & ((state.guessed & bits) == 0)
+        hit = (state.word_mask & bits) != 0
+        state.guessed = np.where(fresh, state.guessed | bits, state.guessed)
+        state.wrong += (fresh & ~hit).astype(np.int16)
+        state.guesses += fresh.astype(np.int16)
+        won = (state.word_mask & ~state.guessed) == 0
+        state.active = act & ~won & (state.wrong < max_wrong)
+    return state
+
+
+@dataclass
+class SimulationResult:
+    table: WordTable
+    strategy: str
+    max_wrong: int
+    games: "np.ndarray"  # per word id
+    wins: "np.ndarray"
+    guess_hist: "np.ndarray"  # (words, MAX_GUESSES + 1) guesses-per-game counts
+
+    def _group(self, labels: "np.ndarray", names: Sequence[str], values: Optional[Sequence[int]] = None) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for name, value in zip(names, values if values is not None else range(len(names))):
+            sel = labels == value
+            games = int(self.games[sel].sum())
+            if games:
+                out[name] = _summarise(games, int(self.wins[sel].sum()), self.guess_hist[sel].sum(axis=0))
+        return out
+
+    def by_difficulty(self) -> Dict[str, Dict[str, float]]:
+        return self._group(self.table.difficulty, self.table.difficulties)
+
+    def by_category(self) -> Dict[str, Dict[str, float]]:
+        return self._group(self.table.category, self.table.categories)
+
+    def by_length(self) -> Dict[str, Dict[str, float]]:
+        lengths = sorted(set(int(l) for l in self.table.lengths[self.games > 0]))
+        out = self._group(self.table.lengths, [str(l) for l in lengths], lengths)
+        for l in lengths:
+            out[str(l)]["initial_hangman_index"] = initial_hangman_index(l)
+        return out
+
+    def by_word(self) -> Dict[str, Dict[str, float]]:
+        out: Dict[str, Dict[str, float]] = {}
+        for i in np.nonzero(self.games)[0]:
+            d, c, w = self.table.corpus.entry(int(i))
+            out[f"{d}/{c}/{w}"] = _summarise(int(self.games[i]), int(self.wins[i]), self.guess_hist[i])
+        return out
+
+    def to_dict(self, words: bool = False) -> Dict[str, object]:
+        report: Dict[str, object] = {
+            "strategy": self.strategy,
+            "max_wrong": self.max_wrong,
+            "overall": _summarise(int(self.games.sum()), int(self.wins.sum()), self.guess_hist.sum(axis=0)),
+            "difficulty": self.by_difficulty(),
+            "category": self.by_category(),
+            "length": self.by_length(),
+        }
+        if words:
+            report["word"] = self.by_word()
+        return report
+
+
+def _summarise(games: int, wins: int, hist: "np.ndarray") -> Dict[str, float]:
+    counts = np.asarray(hist, dtype=np.float64)
+    cdf = np.cumsum(counts) / max(1.0, counts.sum())
+    return {
+        "games": games,
+        "win_rate": round(wins / games, 4) if games else 0.0,
+        "mean_guesses": round(float((counts * np.arange(len(counts))).sum() / max(1.0, counts.sum())), 3),
+        "p50_guesses": int(np.searchsorted(cdf, 0.5)),
+        "p90_guesses": int(np.searchsorted(cdf, 0.9)),
+        "guess_hist": [int(c) for c in np.trim_zeros(counts.astype(np.int64), "b")],
+    }
+
+
+def simulate(
+    corpus: Optional[Corpus] = None,
+    strategy: str = "frequency",
+    games_per_word: int = 100,
+    difficulty: Optional[str] = None,
+    max_wrong: int = MAX_WRONG_GUESSES,
+    batch_size: int = 1 << 16,
+    seed: Optional[int] = None,
+    table: Optional[WordTable] = None,
+) -> SimulationResult:
+    """Play ``games_per_word`` games on every (matching) corpus word."""
+    _require_numpy()
+    table = table or WordTable.from_corpus(corpus or load_corpus())
+    fn = STRATEGIES[strategy]
+    rng = np.random.default_rng(seed)
+
+    n = len(table.masks)
+    if difficulty is None:
+        ids = np.arange(n)
+    else:
+        ids = np.nonzero(table.difficulty == table.difficulties.index(difficulty))[0]
+    all_games = np.repeat(ids, games_per_word)
+
+    games = np.zeros(n, dtype=np.int64)
+    wins = np.zeros(n, dtype=np.int64)
+    hist = np.zeros(n * (MAX_GUESSES + 1), dtype=np.int64)
+    for start in range(0, len(all_games), batch_size):
+        chunk = all_games[start:start + batch_size]
+        st = play_batch(chunk, table, fn, rng, max_wrong)
+        won = (st.word_mask & ~st.guessed) == 0
+        games += np.bincount(chunk, minlength=n)
+        wins += np.bincount(chunk, weights=won, minlength=n).astype(np.int64)
+        hist += np.bincount(chunk * (MAX_GUESSES + 1) + st.guesses, minlength=len(hist))
+    return SimulationResult(table, strategy, max_wrong, games, wins, hist.reshape(n, MAX_GUESSES + 1))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate many games to calibrate difficulty constants.")
+    parser.add_argument("--strategy", default="frequency", help=f"one of: {', '.join(sorted(STRATEGIES))}")
+    parser.add_argument("--games-per-word", type=int, default=1000)
+    parser.add_argument("--difficulty", default=None)
+    parser.add_argument("--max-wrong", type=int, nargs="+", default=[MAX_WRONG_GUESSES],
+                        help="one or more lives settings to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--words", action="store_true", help="include per-word results in the JSON")
+    parser.add_argument("--json", default=None, help="write the full report to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        _require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.strategy not in STRATEGIES:
+        parser.error(f"unknown strategy {args.strategy!r}")
+
+    table = WordTable.from_corpus(load_corpus())
+    reports = []
+    for max_wrong in args.max_wrong:
+        result = simulate(strategy=args.strategy, games_per_word=args.games_per_word, difficulty=args.difficulty,
+                          max_wrong=max_wrong, seed=args.seed, table=table)
+        report = result.to_dict(words=args.words)
+        reports.append(report)
+        print(f"strategy={args.strategy} max_wrong={max_wrong} overall={report['overall']['win_rate']:.3f} "
+              f"({report['overall']['games']} games)")
+        for section in ("difficulty", "category", "length"):
+            for name, s in report[section].items():  # type: ignore[union-attr]
+                print(f"  {section:10s} {name:14s} win {s['win_rate']:.3f}  "
+                      f"guesses mean {s['mean_guesses']:.2f} p90 {s['p90_guesses']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(reports if len(reports) > 1 else reports[0], fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
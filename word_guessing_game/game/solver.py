@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .corpus import Corpus
+from .data import ALPHABET, WORD_LISTS, load_corpus
+from .game_logic import GameLogic, GuessResult, letter_index
+
+# Fallback order when no candidate word matches the board
+_FREQUENCY_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+class _Pool:
+    """Bitsets over one (category, length) candidate pool.
+
+    Bit k of every bitset stands for ``words[k]``: ``has[x]`` marks words
+    containing letter x, ``at[x][j]`` words with letter x at position j.
+    """
+
+    __slots__ = ("words", "length", "all", "has", "at")
+
+    def __init__(self, words: Sequence[str], length: int) -> None:
+        n = len(words)
+        nbytes = (n + 7) // 8
+        has = [bytearray(nbytes) for _ in range(26)]
+        at = [[bytearray(nbytes) for _ in range(length)] for _ in range(26)]
+        for k, word in enumerate(words):
+            byte, bit = k >> 3, 1 << (k & 7)
+            for j, ch in enumerate(word):
+                x = letter_index(ch)
+                if x < 0:
+                    # Letters outside a-z have no bitsets, as in GameLogic
+                    continue
+                at[x][j][byte] |= bit
+                has[x][byte] |= bit
+        self.words = list(words)
+        self.length = length
+        self.all = (1 << n) - 1
+        self.has = [int.from_bytes(b, "little") for b in has]
+        self.at = [[int.from_bytes(b, "little") for b in row] for row in at]
+
+
+class Solver:
+    """Ranks the next letter by expected information gain over candidate words.
+
+    Candidates are the corpus words with the board's length (and category,
+    when known) that agree with every revealed position, contain no wrong
+    letter and, if given, start with the hinted first letter.
+    """
+
+    def __init__(self, corpus: Optional[Corpus] = None) -> None:
+        self.corpus = corpus if corpus is not None else load_corpus()
+        self._pools: Dict[Tuple[Optional[str], int], _Pool] = {}
+
+    def _pool(self, category: Optional[str], length: int) -> _Pool:
+        key = (category, length)
+        pool = self._pools.get(key)
+        if pool is None:
+            seen: Dict[str, None] = {}
+            for d, c, l, start, n in self.corpus.groups:
+                if l == length and (category is None or c == category):
+                    for i in range(start, start + n):
+                        seen.setdefault(self.corpus.word(i), None)
+            if not seen and category is not None:
+                return self._pool(None, length)
+            pool = self._pools[key] = _Pool(list(seen), length)
+        return pool
+
+    def _filter(self, pool: _Pool, board: Sequence[str], guessed: int, first_letter: Optional[str]) -> int:
+        cand = pool.all
+        revealed = 0
+        for j, ch in enumerate(board):
+            x = letter_index(ch)
+            if x >= 0:
+                revealed |= 1 << x
+            elif ch != "_":
+                # Revealed letter outside a-z: only words without an a-z letter here
+                for row in pool.at:
+                    cand &= ~row[j]
+        for x in range(26):
+            bit = 1 << x
+            if not guessed & bit and not revealed & bit:
+                continue
+            if revealed & bit:
+                ch = ALPHABET[x]
+                row = pool.at[x]
+                for j in range(pool.length):
+                    cand &= row[j] if board[j] == ch else ~row[j]
+            else:
+                cand &= ~pool.has[x]
+            if not cand:
+                return 0
+        if first_letter and board and board[0] == "_":
+            x = letter_index(first_letter.lower())
+            if x >= 0:
+                cand &= pool.at[x][0]
+        return cand
+
+    def rank(
+        self,
+        gameboard: Sequence[str],
+        guessed_letters: Iterable[str],
+        category: Optional[str] = None,
+        first_letter: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return unguessed letters with their expected gain in bits, best first."""
+        guessed = 0
+        for ch in guessed_letters:
+            i = letter_index(ch)
+            if i >= 0:
+                guessed |= 1 << i
+        for ch in gameboard:
+            i = letter_index(ch)
+            if i >= 0:
+                guessed |= 1 << i
+
+        pool = self._pool(category, len(gameboard))
+        cand = self._filter(pool, gameboard, guessed, first_letter)
+        open_letters = [x for x in range(26) if not guessed >> x & 1]
+        total = _popcount(cand)
+        if not total:
+            return [(ch, 0.0) for ch in _FREQUENCY_ORDER if not guessed >> letter_index(ch) & 1]
+
+        hidden = [j for j, ch in enumerate(gameboard) if ch == "_"]
+        scored: List[Tuple[float, int, str]] = []
+        for x in open_letters:
+            present = cand & pool.has[x]
+            n_present = _popcount(present)
+            if not n_present:
+                scored.append((0.0, 0, ALPHABET[x]))
+                continue
+            # Refine by the letter's position pattern: one part per pattern
+            parts = [present]
+            for j in hidden:
+                row = pool.at[x][j]
+                split: List[int] = []
+                for p in parts:
+                    q = p & row
+                    if q:
+                        split.append(q)
+                    if q != p:
+                        split.append(p ^ q)
+                parts = split
+            counts = [_popcount(p) for p in parts]
+            if total > n_present:
+                counts.append(total - n_present)
+            gain = -sum(c / total * math.log2(c / total) for c in counts)
+            scored.append((gain, n_present, ALPHABET[x]))
+        scored.sort(key=lambda t: (-t[0], -t[1], t[2]))
+        return [(ch, gain) for gain, _, ch in scored]
+
+    def candidates(
+        self,
+        gameboard: Sequence[str],
+        guessed_letters: Iterable[str],
+        category: Optional[str] = None,
+        first_letter: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[str]:
+        guessed = 0
+        for ch in list(guessed_letters) + [c for c in gameboard if c != "_"]:
+            i = letter_index(ch)
+            if i >= 0:
+                guessed |= 1 << i
+        pool = self._pool(category, len(gameboard))
+        cand = self._filter(pool, gameboard, guessed, first_letter)
+        out: List[str] = []
+        while cand and len(out) < limit:
+            low = cand & -cand
+            out.append(pool.words[low.bit_length() - 1])
+            cand ^= low
+        return out
+
+    def suggest(self, logic: GameLogic) -> Optional[str]:
+        """Best next letter for a game, using the same hints the player sees."""
+        ranked = self.rank(logic.gameboard, logic.guessed_letters, logic.category, logic.word[:1])
+        return ranked[0][0] if ranked else None
+
+
+def auto_play(logic: GameLogic, solver: Optional[Solver] = None) -> List[GuessResult]:
+    """Play ``logic`` to the end with solver suggestions; return every result."""
+    solver = solver or Solver()
+    results: List[GuessResult] = []
+    while not (logic.is_complete() or logic.is_game_over()):
+        letter = solver.suggest(logic)
+        if letter is None:
+            break
+        results.append(logic.guess(letter))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play games headlessly with the letter solver.")
+    parser.add_argument("--difficulty", choices=sorted(WORD_LISTS), default="Beginner")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    solver = Solver()
+    wins = 0
+    guesses = 0
+    for _ in range(args.games):
+        logic = GameLogic(args.difficulty)
+        guesses += len(auto_play(logic, solver))
+        wins += logic.is_complete()
+    print(f"{args.difficulty}: won {wins}/{args.games}, {guesses / max(1, args.games):.2f} guesses per game")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,64 +1,211 @@
 from __future__ import annotations
 
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-try:
-    import pygame
-except Exception:  # pragma: no cover
-    pygame = None  # type: ignore
+from .metrics import sound_dropped, sound_start_seconds
+
+# Effect name -> file under the sounds directory
+EFFECTS: Dict[str, str] = {
+    "correct": "correct_guess.wav",
+    "wrong": "wrong_guess.wav",
+    "win": "win_sound.mp3",
+    "game_over": "game_over.wav",
+}
+
+# Low-latency mixer configuration (the pygame default buffer is much larger)
+MIXER_FREQUENCY: int = 44100
+MIXER_SIZE: int = -16
+MIXER_CHANNELS: int = 2
+MIXER_BUFFER: int = 512
+
+# Reserved mixer channels per effect, used round-robin so rapid guesses overlap
+CHANNELS_PER_EFFECT: int = 2
+
+# A play request still waiting on decode after this long is dropped
+_STALE_PLAY_S = 0.25
+
+
+@dataclass
+class SoundStats:
+    decode_ms: Optional[float] = None
+    first_play_ms: Optional[float] = None
+    plays: int = 0
+    dropped: int = 0
 
 
 class SoundManager:
+    """Audio engine: mixer init and decoding run on a background thread.
+
+    ``preload`` warms every effect; otherwise an effect is decoded on its
+    first ``play_*`` call and played as soon as it is ready. The Tk thread
+    only ever calls ``Channel.play`` on an already decoded sound.
+    """
+
     def __init__(self, sounds_dir: Path) -> None:
         self.sounds_dir = sounds_dir
         self.enabled = False
-        self.correct = None
-        self.wrong = None
-        self.win = None
-        self.game_over = None
+        self.init_ms: Optional[float] = None
+        self.stats: Dict[str, SoundStats] = {name: SoundStats() for name in EFFECTS}
+        self._start_latency = {name: sound_start_seconds(name) for name in EFFECTS}
+        self._dropped = {name: sound_dropped(name) for name in EFFECTS}
+        self._pygame = None
+        self._sounds: Dict[str, object] = {}
+        self._failed: Set[str] = set()
+        self._channels: Dict[str, List[object]] = {}
+        self._next_channel: Dict[str, int] = {name: 0 for name in EFFECTS}
+        self._jobs: "queue.Queue[Tuple[str, str, float]]" = queue.Queue()
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the audio thread (initialises the mixer); safe to call repeatedly."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name="audio", daemon=True)
+                self._worker.start()
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """Decode effects in the background ahead of their first use."""
+        self.start()
+        for name in names if names is not None else EFFECTS:
+            self._jobs.put(("load", name, time.perf_counter()))
+
+    def play(self, name: str) -> None:
+        requested = time.perf_counter()
+        sound = self._sounds.get(name)
+        if sound is not None:
+            self._play_now(name, sound, requested)
+            return
+        if name in self._failed or (self._ready.is_set() and not self.enabled):
+            return
+        self.start()
+        self._jobs.put(("play", name, requested))
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the audio thread once the requests already queued are handled."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        self._jobs.put(("stop", "", 0.0))
+        worker.join(timeout)
+
+    def play_correct(self) -> None:
+        self.play("correct")
+
+    def play_wrong(self) -> None:
+        self.play("wrong")
 
-        if pygame is None:
+    def play_win(self) -> None:
+        self.play("win")
+
+    def play_game_over(self) -> None:
+        self.play("game_over")
+
+    def report(self) -> Dict[str, object]:
+        """Mixer init, decode and first-play latencies in milliseconds."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "init_ms": self.init_ms,
+                "buffer": MIXER_BUFFER,
+                "effects": {name: asdict(s) for name, s in self.stats.items()},
+            }
+
+    # Audio thread
+    def _work(self) -> None:
+        self._init_mixer()
+        self._ready.set()
+        while True:
+            kind, name, requested = self._jobs.get()
+            if kind == "stop":
+                return
+            if not self.enabled or name in self._failed:
+                continue
+            sound = self._sounds.get(name) or self._decode(name)
+            if kind != "play" or sound is None:
+                continue
+            if time.perf_counter() - requested > _STALE_PLAY_S:
+                with self._lock:
+                    self.stats[name].dropped += 1
+                self._dropped[name].inc()
+                continue
+            self._play_now(name, sound, requested)
+
+    def _init_mixer(self) -> None:
+        try:
+            import pygame
+        except Exception:  # pragma: no cover
             print("Pygame not available; audio disabled.")
             return
+        self._pygame = pygame
 
+        t = time.perf_counter()
         try:
-            pygame.mixer.init()
-            self.enabled = True
+            pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+            pygame.mixer.init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
         except Exception as e:  # pragma: no cover
             print(f"Audio init failed; audio disabled. Error: {e}")
-            self.enabled = False
+            return
 
-        self.correct = self._load("correct_guess.wav")
-        self.wrong = self._load("wrong_guess.wav")
-        self.win = self._load("win_sound.mp3")
-        self.game_over = self._load("game_over.wav")
+        try:
+            reserved = CHANNELS_PER_EFFECT * len(EFFECTS)
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+            pygame.mixer.set_reserved(reserved)
+            for i, name in enumerate(EFFECTS):
+                first = i * CHANNELS_PER_EFFECT
+                self._channels[name] = [pygame.mixer.Channel(first + k) for k in range(CHANNELS_PER_EFFECT)]
+        except Exception as e:  # pragma: no cover
+            print(f"Could not reserve mixer channels; using shared channels. Error: {e}")
+            self._channels.clear()
+        self.init_ms = (time.perf_counter() - t) * 1000.0
+        self.enabled = True
 
-    def _load(self, filename: str):
-        if not self.enabled:
+    def _decode(self, name: str):
+        filename = EFFECTS.get(name)
+        if filename is None:
+            self._failed.add(name)
             return None
         path = self.sounds_dir / filename
         if not path.exists():
             print(f"Sound not found: {path}")
+            self._failed.add(name)
             return None
+        t = time.perf_counter()
         try:
-            return pygame.mixer.Sound(str(path))  # type: ignore[attr-defined]
+            sound = self._pygame.mixer.Sound(str(path))  # type: ignore[union-attr]
         except Exception as e:
             print(f"Failed to load sound {path}: {e}")
+            self._failed.add(name)
             return None
+        with self._lock:
+            self.stats[name].decode_ms = (time.perf_counter() - t) * 1000.0
+        self._sounds[name] = sound
+        return sound
 
-    def play_correct(self) -> None:
-        if self.correct:
-            self.correct.play()
-
-    def play_wrong(self) -> None:
-        if self.wrong:
-            self.wrong.play()
-
-    def play_win(self) -> None:
-        if self.win:
-            self.win.play()
-
-    def play_game_over(self) -> None:
-        if self.game_over:
-            self.game_over.play()
+    # Either thread
+    def _play_now(self, name: str, sound, requested: float) -> None:
+        channels = self._channels.get(name)
+        try:
+            if channels:
+                with self._lock:
+                    i = self._next_channel[name]
+                    self._next_channel[name] = (i + 1) % len(channels)
+                channels[i].play(sound)  # type: ignore[attr-defined]
+            else:
+                sound.play()
+        except Exception:
+            return
+        latency = time.perf_counter() - requested
+        self._start_latency[name].observe(latency)
+        with self._lock:
+            s = self.stats[name]
+            s.plays += 1
+            if s.first_play_ms is None:
+                s.first_play_ms = latency * 1000.0
@@ -0,0 +1,297 @@
+"""Multi-process tournament: every strategy against every corpus word.
+
+The corpus is split into shards handed to a process pool. Each finished
+shard is appended to a JSON-lines checkpoint as soon as it arrives, so an
+interrupted run resumes by re-running the same command.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .data import load_corpus
+from .game_logic import GameLogic
+from .solver import Solver
+
+# A strategy returns the next letter for a game; rng is seeded per game
+TournamentStrategy = Callable[[GameLogic, random.Random], str]
+STRATEGIES: Dict[str, TournamentStrategy] = {}
+
+_ENGLISH_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+# No game needs more guesses than there are letters
+MAX_GUESSES = 26
+
+
+def register_strategy(name: str) -> Callable[[TournamentStrategy], TournamentStrategy]:
+    """Register a strategy under ``name``.
+
+    Strategies must be module-level functions: workers started with spawn
+    (the default on Windows and macOS) don't inherit this registry and
+    import them by module and qualified name instead.
+    """
+    def deco(fn: TournamentStrategy) -> TournamentStrategy:
+        STRATEGIES[name] = fn
+        return fn
+    return deco
+
+
+def _strategy_path(fn: TournamentStrategy) -> str:
+    return f"{fn.__module__}:{fn.__qualname__}"
+
+
+def _resolve_strategy(name: str, path: str) -> TournamentStrategy:
+    fn = STRATEGIES.get(name)
+    if fn is None:
+        module, _, qualname = path.partition(":")
+        obj = importlib.import_module(module)
+        try:
+            for attr in qualname.split("."):
+                obj = getattr(obj, attr)
+        except AttributeError:
+            raise LookupError(f"strategy {name!r} ({path}) is not importable; define it at module level") from None
+        fn = STRATEGIES[name] = obj
+    return fn
+
+
+@register_strategy("random")
+def random_strategy(logic: GameLogic, rng: random.Random) -> str:
+    mask = logic.guessed_mask
+    return rng.choice([chr(97 + i) for i in range(26) if not mask >> i & 1])
+
+
+@register_strategy("frequency")
+def frequency_strategy(logic: GameLogic, rng: random.Random) -> str:
+    mask = logic.guessed_mask
+    first = logic.word[0]
+    if not mask >> (ord(first) - 97) & 1:
+        return first
+    return next(ch for ch in _ENGLISH_ORDER if not mask >> (ord(ch) - 97) & 1)
+
+
+_solver: Optional[Solver] = None
+
+
+@register_strategy("solver")
+def solver_strategy(logic: GameLogic, rng: random.Random) -> str:
+    global _solver
+    if _solver is None:
+        _solver = Solver()
+    return _solver.suggest(logic) or frequency_strategy(logic, rng)
+
+
+def _game_seed(seed: int, strategy: str, word_id: int, rep: int) -> int:
+    digest = hashlib.blake2b(f"{seed}:{strategy}:{word_id}:{rep}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _is_letter(letter: object) -> bool:
+    return isinstance(letter, str) and len(letter) == 1 and letter.isalpha()
+
+
+def play_shard(shard: int, word_ids: Sequence[int], strategies: Dict[str, str], games_per_word: int, seed: int) -> Dict:
+    """Play every strategy on every word of a shard (runs in a worker process).
+
+    ``strategies`` maps each name to its import path (see ``register_strategy``).
+    A strategy that repeats a letter or returns anything but a letter forfeits
+    the game, which counts as a loss.
+    """
+    corpus = load_corpus()
+    fns = {name: _resolve_strategy(name, path) for name, path in strategies.items()}
+    results: Dict[str, Dict[str, List[int]]] = {name: {} for name in strategies}
+    for word_id in word_ids:
+        difficulty, category, word = corpus.entry(word_id)
+        for name, fn in fns.items():
+            wins = guesses = wrong = forfeits = 0
+            for rep in range(games_per_word):
+                rng = random.Random(_game_seed(seed, name, word_id, rep))
+                logic = GameLogic.from_word(difficulty, category, word)
+                # Capped, so a word the letters can't finish still ends
+                for _ in range(MAX_GUESSES):
+                    if logic.is_complete() or logic.is_game_over():
+                        break
+                    letter = fn(logic, rng)
+                    guesses += 1
+                    if not _is_letter(letter) or logic.guess(letter).status == "repeat":
+                        forfeits += 1
+                        break
+                wins += logic.is_complete()
+                wrong += logic.wrong_guesses
+            results[name][str(word_id)] = [games_per_word, wins, guesses, wrong, forfeits]
+    return {"shard": shard, "results": results}
+
+
+def _shards(n_words: int, n_shards: int) -> List[range]:
+    n_shards = max(1, min(n_shards, n_words))
+    step = -(-n_words // n_shards)
+    return [range(i, min(i + step, n_words)) for i in range(0, n_words, step)]
+
+
+def _read_checkpoint(path: Path, config: Dict) -> Tuple[List[Dict], int]:
+    """Return finished shards and the byte length of the intact prefix."""
+    if not path.exists():
+        return [], 0
+    data = path.read_bytes()
+    results: List[Dict] = []
+    good = 0
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break  # torn final line from an interrupted write
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            break
+        if good == 0:
+            if record.get("config") != config:
+                raise ValueError(f"{path} belongs to a run with different settings; remove it or pick another --checkpoint")
+        else:
+            results.append(record)
+        good += len(line)
+    return results, good
+
+
+def merge(shard_results: Sequence[Dict], corpus=None) -> Dict:
+    """Merge shard results into a leaderboard and a per-word hardness report."""
+    corpus = corpus or load_corpus()
+    totals: Dict[str, List[int]] = {}
+    per_word: Dict[str, List[int]] = {}
+    for shard in shard_results:
+        for name, words in shard["results"].items():
+            t = totals.setdefault(name, [0, 0, 0, 0, 0])
+            for word_id, row in words.items():
+                for i, v in enumerate(row):
+                    t[i] += v
+                w = per_word.setdefault(word_id, [0, 0, 0, 0, 0])
+                for i, v in enumerate(row):
+                    w[i] += v
+
+    leaderboard = [
+        {
+            "strategy": name,
+            "games": g,
+            "win_rate": round(wins / g, 4) if g else 0.0,
+            "mean_guesses": round(guesses / g, 3) if g else 0.0,
+            "mean_wrong": round(wrong / g, 3) if g else 0.0,
+            "forfeits": forfeits,
+        }
+        for name, (g, wins, guesses, wrong, forfeits) in totals.items()
+    ]
+    leaderboard.sort(key=lambda r: (-r["win_rate"], r["mean_guesses"]))
+
+    hardness = []
+    for word_id, (g, wins, guesses, wrong, _) in per_word.items():
+        d, c, w = corpus.entry(int(word_id))
+        hardness.append({
+            "word": w,
+            "category": c,
+            "difficulty": d,
+            "hardness": round(1.0 - wins / g, 4) if g else 0.0,
+            "mean_wrong": round(wrong / g, 3) if g else 0.0,
+        })
+    hardness.sort(key=lambda r: (-r["hardness"], -r["mean_wrong"], r["word"]))
+    return {"leaderboard": leaderboard, "hardness": hardness}
+
+
+def run_tournament(
+    checkpoint: Path,
+    strategies: Optional[Sequence[str]] = None,
+    games_per_word: int = 1,
+    shards: int = 64,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict:
+    """Run (or resume) a tournament and return the merged report."""
+    corpus = load_corpus()
+    strategies = list(strategies or sorted(STRATEGIES))
+    plan = _shards(len(corpus), shards)
+    config = {
+        "words": len(corpus),
+        # Word ids index this exact word table; another corpus must not resume
+        "corpus": corpus.fingerprint(),
+        "strategies": strategies,
+        "games_per_word": games_per_word,
+        "shards": len(plan),
+        "seed": seed,
+    }
+
+    finished, good = _read_checkpoint(checkpoint, config)
+    done = {r["shard"]: r for r in finished}
+    if good == 0:
+        checkpoint.write_text(json.dumps({"config": config}) + "\n", encoding="utf-8")
+    elif good < checkpoint.stat().st_size:
+        with open(checkpoint, "r+b") as fh:
+            fh.truncate(good)
+
+    pending = [i for i in range(len(plan)) if i not in done]
+    paths = {name: _strategy_path(STRATEGIES[name]) for name in strategies}
+    with open(checkpoint, "a", encoding="utf-8") as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(play_shard, i, list(plan[i]), paths, games_per_word, seed)
+            for i in pending
+        ]
+        try:
+            for fut in as_completed(futures):
+                result = fut.result()
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+                done[result["shard"]] = result
+                if progress:
+                    progress(len(done), len(plan))
+        except KeyboardInterrupt:
+            for f in futures:
+                f.cancel()
+            raise
+    return merge([done[i] for i in sorted(done)], corpus)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play every strategy against every word on all cores.")
+    parser.add_argument("--strategies", nargs="+", default=None, help=f"default: all ({', '.join(sorted(STRATEGIES))})")
+    parser.add_argument("--games-per-word", type=int, default=1)
+    parser.add_argument("--shards", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", type=Path, default=Path("tournament.jsonl"), help="resumable shard log")
+    parser.add_argument("--report", type=Path, default=None, help="write the merged report as JSON")
+    parser.add_argument("--top", type=int, default=10, help="hardest words to print")
+    args = parser.parse_args(argv)
+
+    unknown = [s for s in args.strategies or [] if s not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategies: {', '.join(unknown)}")
+
+    def progress(done: int, total: int) -> None:
+        print(f"\rshards {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    try:
+        report = run_tournament(args.checkpoint, args.strategies, args.games_per_word, args.shards,
+                                args.workers, args.seed, progress)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; finished shards are in {args.checkpoint}. Re-run to resume.", file=sys.stderr)
+        return 130
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+
+    for row in report["leaderboard"]:
+        print(f"{row['strategy']:12s} win {row['win_rate']:.3f}  guesses {row['mean_guesses']:.2f}  "
+              f"wrong {row['mean_wrong']:.2f}  ({row['games']} games, {row['forfeits']} forfeited)")
+    for row in report["hardness"][:args.top]:
+        print(f"  {row['word']:12s} {row['difficulty']:12s} {row['category']:10s} hardness {row['hardness']:.3f}")
+    if args.report:
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
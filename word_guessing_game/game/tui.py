@@ -0,0 +1,207 @@
+"""Terminal front-end: the same game without tkinter, Pillow or pygame.
+
+Runs full-screen with curses when stdin/stdout are a terminal and curses
+is available, otherwise as a plain line-by-line prompt (dumb terminals,
+pipes, Windows without curses). Only ``GameLogic``, the word scheduler and
+the text properties are used, so it starts in tens of milliseconds and
+stays small enough for low-resource machines and SSH sessions:
+
+    python -m word_guessing_game tui
+    python -m word_guessing_game tui --difficulty Advanced --plain
+
+Keys: a letter guesses it, ``?`` suggests one, Esc quits.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .game_logic import GameLogic, GuessResult
+from .persistence import load_player_state, save_player_state
+from .scheduler import PlayerState, ShuffleScheduler
+
+DIFFICULTIES = ["Beginner", "Intermediate", "Advanced"]
+_ESC = 27
+
+
+class TerminalGame:
+    """Round state and text shared by the curses and line-mode loops."""
+
+    def __init__(self, difficulty: str) -> None:
+        self.difficulty = difficulty
+        # Shared with the window, so neither repeats words the other has shown
+        self.player_state = load_player_state() or PlayerState.new()
+        self._picker = ShuffleScheduler().picker(self.player_state)
+        self.logic = GameLogic(difficulty, picker=self._picker)
+        self._save_player_state()
+        self.message = "Guess a letter (? suggests one)."
+        self._solver = None
+
+    def _save_player_state(self) -> None:
+        try:
+            save_player_state(self.player_state)
+        except OSError:
+            pass  # read-only home: words may repeat next launch
+
+    def new_round(self) -> None:
+        self.logic.reset()
+        self._save_player_state()
+        self.message = "New word. Guess a letter."
+
+    def guess(self, letter: str) -> GuessResult:
+        result = self.logic.guess(letter)
+        if result.complete:
+            self.message = f"You won! The word was {self.logic.word!r}."
+        elif result.game_over:
+            self.message = f"GAME OVER. The word was {self.logic.word!r}."
+        elif result.status == "repeat":
+            self.message = f"Already guessed {letter!r}."
+        elif result.status == "correct":
+            self.message = f"Yes, {letter!r} is in the word."
+        else:
+            self.message = f"No {letter!r}."
+        return result
+
+    def suggest(self) -> None:
+        if self._solver is None:
+            from .solver import Solver
+
+            self._solver = Solver()
+        letter = self._solver.suggest(self.logic)
+        self.message = f"Try {letter!r}." if letter else "No suggestion."
+
+    @property
+    def finished(self) -> bool:
+        return self.logic.is_complete() or self.logic.is_game_over()
+
+    def lines(self) -> List[str]:
+        logic = self.logic
+        return [
+            f"Word Guessing Game - {self.difficulty}",
+            "",
+            *logic.hint_text.splitlines(),
+            "",
+            "    " + logic.board_text,
+            "",
+            logic.guesses_text,
+            logic.lives_text,
+            "",
+            self.message,
+        ]
+
+
+# curses
+def _curses_loop(stdscr, difficulty: Optional[str]) -> None:
+    import curses
+
+    try:
+        curses.curs_set(0)
+    except curses.error:
+        pass
+
+    def draw(lines: List[str], prompt: str) -> None:
+        stdscr.erase()
+        height, width = stdscr.getmaxyx()
+        for y, line in enumerate(lines + ["", prompt]):
+            if y >= height - 1:
+                break
+            stdscr.addnstr(y, 1, line, max(0, width - 2))
+        stdscr.refresh()
+
+    while difficulty is None:
+        menu = ["Word Guessing Game", ""] + [f"  {i}) {d}" for i, d in enumerate(DIFFICULTIES, 1)]
+        draw(menu, "Pick a difficulty (1-3, Esc quits)")
+        ch = stdscr.getch()
+        if ch == _ESC:
+            return
+        if ord("1") <= ch < ord("1") + len(DIFFICULTIES):
+            difficulty = DIFFICULTIES[ch - ord("1")]
+
+    game = TerminalGame(difficulty)
+    while True:
+        if game.finished:
+            draw(game.lines(), "Play again? (y/n)")
+            ch = stdscr.getch()
+            if ch in (ord("y"), ord("Y")):
+                game.new_round()
+            elif ch in (ord("n"), ord("N"), _ESC):
+                return
+            continue
+        draw(game.lines(), "Letter, ? for a hint, Esc to quit")
+        ch = stdscr.getch()
+        if ch == _ESC:
+            return
+        if ch == ord("?"):
+            game.suggest()
+        elif 0 <= ch < 256 and chr(ch).isalpha():
+            game.guess(chr(ch).lower())
+
+
+# Line mode
+def _line_loop(difficulty: Optional[str]) -> None:
+    def ask(prompt: str) -> Optional[str]:
+        try:
+            return input(prompt).strip()
+        except EOFError:
+            return None
+
+    while difficulty is None:
+        print("Word Guessing Game")
+        for i, d in enumerate(DIFFICULTIES, 1):
+            print(f"  {i}) {d}")
+        answer = ask("Pick a difficulty (1-3): ")
+        if answer is None:
+            return
+        if answer in {str(i) for i in range(1, len(DIFFICULTIES) + 1)}:
+            difficulty = DIFFICULTIES[int(answer) - 1]
+
+    game = TerminalGame(difficulty)
+    while True:
+        print("\n".join(game.lines()))
+        if game.finished:
+            answer = ask("Play again? (y/n): ")
+            if not answer or answer[0].lower() != "y":
+                return
+            game.new_round()
+            continue
+        answer = ask("Letter (? for a hint): ")
+        if answer is None:
+            return
+        if answer == "?":
+            game.suggest()
+        elif len(answer) == 1 and answer.isalpha():
+            game.guess(answer.lower())
+        else:
+            game.message = "Type a single letter."
+
+
+def run(difficulty: Optional[str] = None, plain: bool = False) -> None:
+    if not plain and sys.stdin.isatty() and sys.stdout.isatty():
+        try:
+            import curses
+        except ImportError:
+            curses = None
+        if curses is not None:
+            # Esc is a key here, not the start of an escape sequence
+            os.environ.setdefault("ESCDELAY", "25")
+            curses.wrapper(_curses_loop, difficulty)
+            return
+    _line_loop(difficulty)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play in the terminal.")
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default=None)
+    parser.add_argument("--plain", action="store_true", help="line-by-line prompts instead of curses")
+    args = parser.parse_args(argv)
+    try:
+        run(args.difficulty, args.plain)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
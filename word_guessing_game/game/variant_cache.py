@@ -0,0 +1,243 @@
+"""Persistent pre-rendered image variants.
+
+Scaled images at sizes the GUI asks for again and again (a hangman frame at
+a scale bucket, a background at one of ``WARM_WINDOW_SIZES``, a button at
+its natural size) are written once to ``CACHE_DIR/variants`` as an
+uncompressed netpbm PAM file; other window sizes are scaled in memory only. Later launches
+map the raster straight into a PIL image (``Image.frombuffer``) and skip
+PNG decoding and resampling entirely.
+
+A variant's file name is a hash of the source path, its mtime and size and
+the target size, so edited assets never serve stale pixels. Hits bump the
+file's mtime; once the directory grows past ``VARIANT_CACHE_BYTES`` the
+least recently used files are pruned.
+
+Prebuild the variants for common window sizes with:
+
+    python -m word_guessing_game.game.variant_cache warm
+    python -m word_guessing_game.game.variant_cache info
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from .data import CACHE_DIR, VARIANT_CACHE_BYTES
+
+_SUFFIX = ".pam"
+_TUPLTYPES = {"L": b"GRAYSCALE", "RGB": b"RGB", "RGBA": b"RGB_ALPHA"}
+_MODES = {v: k for k, v in _TUPLTYPES.items()}
+
+# Window sizes prebuilt by `warm` (a 52-frame hangman set is ~30 MB per scale)
+WARM_WINDOW_SIZES: List[Tuple[int, int]] = [(950, 630), (1280, 720)]
+
+
+def _encode(img: Image.Image) -> bytes:
+    if img.mode not in _TUPLTYPES:
+        has_alpha = img.mode in ("LA", "PA", "RGBa", "La") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+    w, h = img.size
+    header = b"P7\nWIDTH %d\nHEIGHT %d\nDEPTH %d\nMAXVAL 255\nTUPLTYPE %s\nENDHDR\n" % (
+        w, h, len(img.getbands()), _TUPLTYPES[img.mode])
+    return header + img.tobytes()
+
+
+def _decode(data: bytes) -> Optional[Image.Image]:
+    end = data.find(b"ENDHDR\n")
+    if not data.startswith(b"P7\n") or end < 0:
+        return None
+    fields = dict(line.split(b" ", 1) for line in data[3:end].splitlines() if b" " in line)
+    try:
+        mode = _MODES[fields[b"TUPLTYPE"]]
+        size = (int(fields[b"WIDTH"]), int(fields[b"HEIGHT"]))
+    except (KeyError, ValueError):
+        return None
+    offset = end + len(b"ENDHDR\n")
+    if len(data) - offset != size[0] * size[1] * len(mode):
+        return None  # torn write
+    return Image.frombuffer(mode, size, memoryview(data)[offset:], "raw", mode, 0, 1)
+
+
+class VariantCache:
+    def __init__(self, directory: Optional[Path] = None, cap_bytes: int = VARIANT_CACHE_BYTES) -> None:
+        self.directory = Path(directory or CACHE_DIR / "variants")
+        self.cap_bytes = cap_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._bytes: Optional[int] = None  # scanned on first store
+
+    def path_for(self, source: Path, size: Optional[Tuple[int, int]]) -> Optional[Path]:
+        try:
+            st = source.stat()
+        except OSError:
+            return None
+        target = f"{size[0]}x{size[1]}" if size else "orig"
+        digest = hashlib.blake2b(f"{source.resolve()}|{st.st_mtime_ns}|{st.st_size}|{target}".encode(),
+                                 digest_size=10).hexdigest()
+        return self.directory / f"{digest}-{target}{_SUFFIX}"
+
+    def load(self, source: Path, size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
+        """Return the stored variant of ``source`` at ``size`` (None: natural size)."""
+        path = self.path_for(source, size)
+        img = None
+        if path is not None:
+            try:
+                img = _decode(path.read_bytes())
+                if img is not None:
+                    os.utime(path)  # LRU: recently used files are pruned last
+            except OSError:
+                img = None
+        with self._lock:
+            if img is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return img
+
+    def store(self, source: Path, size: Optional[Tuple[int, int]], img: Image.Image) -> None:
+        path = self.path_for(source, size)
+        if path is None:
+            return
+        data = _encode(img)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Resize workers may store concurrently; each writes its own tmp file
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = self._scan_bytes()
+            else:
+                self._bytes += len(data)
+            over = self._bytes > self.cap_bytes
+        if over:
+            self.prune()
+
+    def prune(self, cap_bytes: Optional[int] = None) -> int:
+        """Delete least recently used variants until under the cap; returns files removed."""
+        cap = self.cap_bytes if cap_bytes is None else cap_bytes
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for e in it:
+                    if e.name.endswith(_SUFFIX):
+                        st = e.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, e.path))
+        except OSError:
+            return 0
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= cap:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._bytes = total
+        return removed
+
+    def _scan_bytes(self) -> int:
+        try:
+            with os.scandir(self.directory) as it:
+                return sum(e.stat().st_size for e in it if e.name.endswith(_SUFFIX))
+        except OSError:
+            return 0
+
+    def usage(self) -> Tuple[int, int]:
+        """(files, bytes) currently stored."""
+        try:
+            with os.scandir(self.directory) as it:
+                sizes = [e.stat().st_size for e in it if e.name.endswith(_SUFFIX)]
+        except OSError:
+            return 0, 0
+        return len(sizes), sum(sizes)
+
+
+# Shared variant store behind IMAGE_CACHE
+VARIANT_CACHE = VariantCache()
+
+
+def warm(window_sizes: Sequence[Tuple[int, int]] = WARM_WINDOW_SIZES, cache: Optional[VariantCache] = None) -> int:
+    """Prebuild the variants the GUI asks for at ``window_sizes``; returns how many were built."""
+    from .data import BACKGROUNDS_DIR, BUTTONS_DIR, HANGMAN_DIR, HANGMAN_IMAGE_FILENAMES
+    from .frames import bucket_size, scale_bucket
+    from .image_cache import ImageCache
+
+    cache = cache or VARIANT_CACHE
+    images = ImageCache(variants=cache)
+    background = BACKGROUNDS_DIR / "background_image.png"
+    jobs: List[Tuple[Path, Optional[Tuple[int, int]]]] = [(background, None)]
+    jobs += [(BUTTONS_DIR / name, None) for name in
+             ("beginner_image.png", "intermediate_image.png", "advanced_image.png", "play_image.png")]
+    buckets = set()
+    for w, h in window_sizes:
+        jobs.append((background, (w, h)))
+        # Mirrors GameGUI: the hangman scales with min(w / 950, h / 630)
+        buckets.add(scale_bucket(min(w / 950, h / 630)))
+    for name in HANGMAN_IMAGE_FILENAMES:
+        jobs += [(HANGMAN_DIR / name, bucket_size(b)) for b in sorted(buckets)]
+
+    built = 0
+    for source, size in jobs:
+        if not source.exists() or cache.load(source, size) is not None:
+            continue
+        img = images.resized(source, size, persist=True) if size else images.natural(source)
+        if img is not None:
+            built += 1
+    return built
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    import argparse
+
+    w, _, h = text.lower().partition("x")
+    try:
+        return int(w), int(h)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the on-disk cache of pre-rendered image variants.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("warm", help="prebuild variants for common window sizes")
+    p.add_argument("--sizes", type=_parse_size, nargs="+", default=WARM_WINDOW_SIZES, metavar="WxH")
+    sub.add_parser("info", help="show where the cache is and how big it is")
+    p = sub.add_parser("prune", help="drop least recently used variants")
+    p.add_argument("--max-bytes", type=int, default=None, help="target size (default: VARIANT_CACHE_BYTES)")
+    args = parser.parse_args(argv)
+
+    cache = VARIANT_CACHE
+    if args.command == "warm":
+        built = warm(args.sizes)
+        files, nbytes = cache.usage()
+        print(f"Built {built} variants; {files} files, {nbytes / 1e6:.1f} MB in {cache.directory}")
+    elif args.command == "prune":
+        removed = cache.prune(args.max_bytes)
+        files, nbytes = cache.usage()
+        print(f"Removed {removed} variants; {files} files, {nbytes / 1e6:.1f} MB left")
+    else:
+        files, nbytes = cache.usage()
+        print(f"{cache.directory}: {files} variants, {nbytes / 1e6:.1f} MB (cap {cache.cap_bytes / 1e6:.0f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .corpus import Corpus, Entry, read_source, word_list_entries
+from .data import WORD_LISTS, initial_hangman_index
+from .game_logic import word_masks
+
+# Word pack layout (little- or big-endian as recorded in the metadata):
+#   header   magic, version, flags, word count, metadata length, CRC-32
+#   metadata JSON: name, byte order, category names, group table
+#   sections uint32 letter_masks[n], uint32 offsets[n + 1],
+#            uint16 category_ids[n], uint8 lengths[n],
+#            uint8 initial_indices[n], then the word blob
+# Every section starts 4-byte aligned; the CRC covers everything after the
+# header. Word order and groups match the corpus index (see corpus.py).
+PACK_MAGIC = b"WGGP"
+PACK_VERSION = 1
+PACK_SUFFIX = ".wgp"
+_PACK_HEADER = struct.Struct("<4sHHIII")
+
+
+def _pad(buf: bytearray) -> None:
+    buf += b"\0" * (-len(buf) % 4)
+
+
+def compile_pack(entries: Iterable[Entry], name: str = "") -> bytes:
+    """Compile (difficulty, category, word) entries into a word pack."""
+    rows = sorted({(d, c, len(w), w) for d, c, w in entries})
+    categories = sorted({r[1] for r in rows})
+    cat_ids = {c: i for i, c in enumerate(categories)}
+    if len(categories) > 0xFFFF or any(r[2] > 0xFF for r in rows):
+        raise ValueError("too many categories or words longer than 255 letters")
+
+    groups: List[list] = []
+    for i, (d, c, length, _) in enumerate(rows):
+        if groups and groups[-1][:3] == [d, c, length]:
+            groups[-1][4] += 1
+        else:
+            groups.append([d, c, length, i, 1])
+
+    offsets = array("I", [0])
+    blob = bytearray()
+    for r in rows:
+        blob += r[3].encode("ascii")
+        offsets.append(len(blob))
+
+    meta = json.dumps({
+        "name": name,
+        "byteorder": sys.byteorder,
+        "categories": categories,
+        "groups": groups,
+    }).encode("utf-8")
+
+    body = bytearray(meta)
+    sections = [
+        array("I", [word_masks(r[3]).letter_mask for r in rows]),
+        offsets,
+        array("H", [cat_ids[r[1]] for r in rows]),
+        array("B", [r[2] for r in rows]),
+        array("B", [initial_hangman_index(r[2]) for r in rows]),
+    ]
+    for section in sections:
+        # Pad relative to the file start, which the header keeps 4-aligned
+        body += b"\0" * (-(len(body) + _PACK_HEADER.size) % 4)
+        body += section.tobytes()
+    body += blob
+
+    header = _PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(rows), len(meta), zlib.crc32(body))
+    return header + bytes(body)
+
+
+class WordPack(Corpus):
+    """Loaded word pack: a Corpus plus per-word mask and metadata arrays.
+
+    ``letter_masks``, ``category_ids``, ``lengths`` and ``initial_indices``
+    are typed memoryviews into the (mapped) file; nothing is copied.
+    """
+
+    def __init__(self, buf: memoryview, mm=None, verify: bool = True) -> None:
+        if len(buf) < _PACK_HEADER.size:
+            raise ValueError("not a word pack")
+        magic, version, _, count, meta_len, crc = _PACK_HEADER.unpack_from(buf, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("not a word pack")
+        if version != PACK_VERSION:
+            raise ValueError(f"unsupported word pack version {version} (expected {PACK_VERSION})")
+        if verify and zlib.crc32(buf[_PACK_HEADER.size:]) != crc:
+            raise ValueError("word pack checksum mismatch")
+
+        pos = _PACK_HEADER.size + meta_len
+        self.meta = json.loads(bytes(buf[_PACK_HEADER.size:pos]))
+        self.meta["count"] = count
+        if self.meta["byteorder"] != sys.byteorder:
+            raise ValueError("word pack was built on a machine with another byte order")
+        self.name: str = self.meta.get("name", "")
+        self.category_names: List[str] = self.meta["categories"]
+
+        views: List[memoryview] = []
+        for typecode, n in (("I", count), ("I", count + 1), ("H", count), ("B", count), ("B", count)):
+            pos += -pos % 4
+            size = array(typecode).itemsize * n
+            views.append(buf[pos:pos + size].cast(typecode))
+            pos += size
+        self.letter_masks, offsets, self.category_ids, self.lengths, self.initial_indices = views
+
+        self._mmap = mm
+        self._buf = buf
+        self._index(self.meta["groups"], offsets, buf[pos:])
+
+    def _views(self) -> List[memoryview]:
+        return [self.letter_masks, self.category_ids, self.lengths, self.initial_indices] + super()._views()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile or inspect word packs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("compile", help="compile WORD_LISTS or a word file into a pack")
+    p.add_argument("output", type=Path)
+    p.add_argument("--source", type=Path, default=None, help="word file (see corpus.read_source); default: WORD_LISTS")
+    p.add_argument("--name", default="", help="pack name stored in the metadata")
+    p = sub.add_parser("info", help="verify a pack and print a summary")
+    p.add_argument("pack", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        entries = read_source(args.source) if args.source else word_list_entries(WORD_LISTS)
+        data = compile_pack(entries, name=args.name or (args.source.stem if args.source else "builtin"))
+        tmp = args.output.with_name(args.output.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, args.output)
+        print(f"Wrote {args.output} ({len(data)} bytes)")
+        return 0
+
+    try:
+        pack = WordPack.load(args.pack)
+    except ValueError as e:
+        print(f"Invalid word pack {args.pack}: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.pack}: '{pack.name}', {len(pack)} words, format v{PACK_VERSION}, checksum OK")
+    for d in pack.difficulties():
+        counts = ", ".join(f"{c}={sum(len(r) for r in pack.ids(d, c))}" for c in pack.categories(d))
+        print(f"  {d}: {counts}")
+    pack.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())